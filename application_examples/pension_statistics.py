@@ -1,8 +1,8 @@
 
 from interval import Interval, IntervalType
+from grouped_frequency import GroupedFrequencyTable
 from collections import Counter
-from itertools import repeat, chain
-from statistics import median, mean
+from itertools import chain
 
 # Saját jogon járó nyugdíjban és ellátásban részesülők a teljes ellátás összege szerint, 2024 január.
 
@@ -32,11 +32,13 @@ grouped_frequency_table = Counter(dict(zip((iv for iv in pension_groups), freque
 print(*(f'{str(pension_group):21}: {head_count:>7}'
         for pension_group, head_count in sorted(grouped_frequency_table.most_common())), sep='\n')
 
-# Az osztályközöket képviselő középértékek és gyakoriságok megfeleltetése.
-midpoint_frequency_table = Counter({iv.reprval('mid'): fr for iv, fr in grouped_frequency_table.items()})
+# Az osztályközöket a középértékük képviseli. A statisztikai jellemzők az osztályközökből és a gyakoriságokból
+# számítódnak, az egyes ellátottakhoz tartozó értékek előállítása nélkül.
+statistics_table = GroupedFrequencyTable(grouped_frequency_table, repr_key='mid')
 
-print('Becsült átlag nyugdíj és ellátás: {0:_g} Ft'.format(mean(midpoint_frequency_table.elements())))
-print('Becsült medián nyugdíj és ellátás: {0:_g} Ft'.format(median(midpoint_frequency_table.elements())))
+print('Becsült átlag nyugdíj és ellátás: {0:_g} Ft'.format(statistics_table.mean()))
+print('Becsült medián nyugdíj és ellátás: {0:_g} Ft'.format(statistics_table.median(interpolate=False)))
+print('Becsült medián nyugdíj és ellátás osztályközön belüli interpolációval: {0:_g} Ft'.format(statistics_table.median()))
 
 
 
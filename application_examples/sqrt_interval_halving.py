@@ -1,6 +1,5 @@
 
 from interval import Interval
-from math import isclose
 
 def sqrt(x) -> float:
     """Az x négyzetgyökével tér vissza. A számítás intervallumfelezéses eljárással történik."""
@@ -9,22 +8,17 @@ def sqrt(x) -> float:
         raise ValueError('Az argumentum nem lehet negatív szám.')
     
     current_interval = Interval(0, 1 if (0 <= x < 1) else x)
-    
-    while not isclose((middle_point := current_interval.midpoint()) ** 2, x, rel_tol=1e-15):
-        
-        lower_half, upper_half = current_interval.split(2)
-        
-        if middle_point ** 2 > x:
-            current_interval = lower_half
-        else:
-            current_interval = upper_half
-           
-    return middle_point
+
+    # A keresett érték az alsó félintervallumban van, ha a felezőpont négyzete nagyobb, mint x.
+    # A felezés részintervallumok létrehozása nélkül, a lebegőpontos pontosság határáig tart.
+    final_interval = current_interval.bisect(lambda middle_point: middle_point ** 2 > x)
+
+    return final_interval.midpoint()
 
 # TESZT
 
 print('Négyzetgyök 2 =', sqrt(2))        # Négyzetgyök 2 = 1.414213562373095
-print('Négyzetgyök 0.75 =', sqrt(0.75))  # Négyzetgyök 0.75 = 0.8660254037844384
+print('Négyzetgyök 0.75 =', sqrt(0.75))  # Négyzetgyök 0.75 = 0.8660254037844386
 
 # Egész értékek négyzetgyökének pontosságvizsgálata.
 for n in range(10000):
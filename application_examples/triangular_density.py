@@ -2,6 +2,7 @@
 from interval import Interval
 from typing import Iterable, Literal
 from random import triangular
+import numpy as np
 from matplotlib import pyplot as plt
 
 def relative_frequency(data: Iterable[int | float], a: int | float, b: int | float,
@@ -11,15 +12,14 @@ def relative_frequency(data: Iterable[int | float], a: int | float, b: int | flo
     az alsó vagy felső végpontja, illetve az intervallum középértéke attól függően, hogy a 
     bin_repr_value milyen értékre van állítva.
     """
-    frequencies = dict.fromkeys(Interval(a, b).split(bins), 0)
-    total_data_points = 0
-    for total_data_points, x in enumerate(data, 1):
-        for interval in frequencies.keys():
-            if x in interval:
-                frequencies[interval] += 1
+    partition = Interval(a, b).split(bins)
+    data = np.fromiter(data, dtype=float)
+    total_data_points = data.size
     if total_data_points:
+        # Az értékek részintervallumokba sorolása egyetlen vektorizált lépésben történik.
+        frequencies = partition.histogram(data).tolist()
         return {iv.reprval(bin_repr_value): freq / total_data_points
-                for iv, freq in frequencies.items()}
+                for iv, freq in zip(partition, frequencies)}
     raise ValueError('A "data" argumentum legalább egy elemet kell, hogy kiadjon.')
 
 
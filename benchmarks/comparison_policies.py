@@ -0,0 +1,57 @@
+"""Az Interval gyakori műveleteinek sebességét méri a végpontok típusa és az egyenlőségvizsgálati szabály szerint.
+
+Használat:
+    python benchmarks/comparison_policies.py [-n DARAB]
+
+Minden végponttípusra (int, float, Fraction) és szabályra (pontos, relatív tűrés, abszolút tűrés) megméri
+a tartalmazás, a <, az &, a |, az is_subinterval és az is_adjacent_to egy műveletre jutó idejét nanoszekundumban.
+"""
+from __future__ import annotations
+import argparse
+import sys
+from fractions import Fraction
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from interval import Interval, IntervalType, EXACT, RelativeTolerance, AbsoluteTolerance
+
+POLICIES = {'exact': EXACT, 'relative': RelativeTolerance(), 'absolute': AbsoluteTolerance(1e-12)}
+NUMBER_TYPES = {'int': int, 'float': float, 'Fraction': Fraction}
+
+
+def measure(number_type, comparison, n: int) -> dict:
+    types = tuple(IntervalType)
+    # Szomszédos és egymást tartalmazó párok vegyesen, hogy a végpontok egyenlősége is gyakran vizsgálandó legyen.
+    intervals = [Interval(number_type(i), number_type(i + 2), types[i % 4], comparison) for i in range(n)]
+    pairs = list(zip(intervals, intervals[1:] + intervals[:1]))
+    values = [number_type(i + i % 3) for i in range(n)]
+    operations = {
+        'contains': lambda: [v in iv for v, iv in zip(values, intervals)],
+        'lt': lambda: [iv1 < iv2 for iv1, iv2 in pairs],
+        'and': lambda: [iv1 & iv2 for iv1, iv2 in pairs],
+        'or': lambda: [iv1 | iv2 for iv1, iv2 in pairs],
+        'is_subinterval': lambda: [iv1.is_subinterval(iv2) for iv1, iv2 in pairs],
+        'is_adjacent_to': lambda: [iv1.is_adjacent_to(iv2) for iv1, iv2 in pairs],
+    }
+    return {name: timeit(operation, number=3) / 3 / n * 1e9 for name, operation in operations.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', type=int, default=20_000, help='a műveletenként mért intervallumpárok száma')
+    args = parser.parse_args(argv)
+
+    results = {f'{type_name}/{policy_name}': measure(number_type, comparison, args.n)
+               for type_name, number_type in NUMBER_TYPES.items()
+               for policy_name, comparison in POLICIES.items()}
+
+    operations = next(iter(results.values())).keys()
+    print(f'{"ns/op":20}' + ''.join(f'{operation:>16}' for operation in operations))
+    for label, result in results.items():
+        print(f'{label:20}' + ''.join(f'{result[operation]:>16.1f}' for operation in operations))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
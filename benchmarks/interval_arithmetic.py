@@ -0,0 +1,63 @@
+"""Az intervallumaritmetikai műveletek sebességét hasonlítja össze Interval példányok listáján és IntervalArray-en.
+
+Használat:
+    python benchmarks/interval_arithmetic.py [-n DARAB]
+
+Minden műveletre (+, -, *, /, ** 2, sqrt) megméri az egy intervallumpárra jutó időt nanoszekundumban, egyrészt az
+Interval példányok listáján ciklussal, másrészt az azonos intervallumokat tartalmazó IntervalArray példányokon
+vektorizáltan, és kiírja a kettő arányát.
+"""
+from __future__ import annotations
+import argparse
+import sys
+from pathlib import Path
+from random import Random
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from interval import Interval, IntervalType
+from interval_array import IntervalArray
+import interval_math
+
+
+def _intervals(rng: Random, n: int) -> list[Interval]:
+    types = tuple(IntervalType)
+    intervals = []
+    for _ in range(n):
+        lower = rng.uniform(-100, 100)
+        intervals.append(Interval(lower, lower + rng.uniform(0.5, 10), rng.choice(types)))
+    return intervals
+
+
+def measure(n: int) -> dict:
+    rng = Random(0)
+    intervals1 = _intervals(rng, n)
+    # Az osztó intervallumok pozitívak, a gyökvonás argumentumai nemnegatívak.
+    intervals2 = [iv ** 2 + 1 for iv in _intervals(rng, n)]
+    array1, array2 = IntervalArray.from_intervals(intervals1), IntervalArray.from_intervals(intervals2)
+    pairs = list(zip(intervals1, intervals2))
+    operations = {
+        '+': (lambda: [iv1 + iv2 for iv1, iv2 in pairs], lambda: array1 + array2),
+        '-': (lambda: [iv1 - iv2 for iv1, iv2 in pairs], lambda: array1 - array2),
+        '*': (lambda: [iv1 * iv2 for iv1, iv2 in pairs], lambda: array1 * array2),
+        '/': (lambda: [iv1 / iv2 for iv1, iv2 in pairs], lambda: array1 / array2),
+        '** 2': (lambda: [iv ** 2 for iv in intervals1], lambda: array1 ** 2),
+        'sqrt': (lambda: [interval_math.sqrt(iv) for iv in intervals2], lambda: interval_math.sqrt(array2)),
+    }
+    return {name: (timeit(scalar, number=3) / 3 / n * 1e9, timeit(vectorized, number=3) / 3 / n * 1e9)
+            for name, (scalar, vectorized) in operations.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', type=int, default=100_000, help='a műveletenként mért intervallumpárok száma')
+    args = parser.parse_args(argv)
+
+    print(f'{"ns/op":10}{"Interval":>14}{"IntervalArray":>16}{"speedup":>10}')
+    for name, (scalar, vectorized) in measure(args.n).items():
+        print(f'{name:10}{scalar:>14.1f}{vectorized:>16.1f}{scalar / vectorized:>9.0f}x')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Az Interval példányok memóriaigényét, valamint a létrehozás és a szótárbeli keresés sebességét méri.
+
+Használat:
+    python benchmarks/interval_footprint.py [-n DARAB] [--reference REGI_INTERVAL_PY]
+
+A --reference argumentummal megadott (például egy korábbi változatból kimentett) interval.py modul
+Interval osztályát is megméri, így a két megvalósítás eredménye egymás mellett összevethető.
+"""
+from __future__ import annotations
+import argparse
+import gc
+import importlib.util
+import sys
+import tracemalloc
+from pathlib import Path
+from timeit import timeit
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_interval_module(path: Path, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(module, n: int) -> dict:
+    Interval, IntervalType = module.Interval, module.IntervalType
+    types = tuple(IntervalType)
+    args = [(i * 0.5, i * 0.5 + 0.25, types[i % 4]) for i in range(n)]
+
+    # Memóriaigény: a létrehozott példányok által lefoglalt memória a lista mutatói nélkül.
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    intervals = [Interval(*a) for a in args]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    bytes_per_instance = (after - before) / n - 8
+
+    construction = timeit(lambda: [Interval(*a) for a in args], number=3) / 3
+    table = dict.fromkeys(intervals, 0)
+    lookup = timeit(lambda: [table[iv] for iv in intervals], number=3) / 3
+    return {'bytes/instance': bytes_per_instance,
+            'construct ns/op': construction / n * 1e9,
+            'dict lookup ns/op': lookup / n * 1e9}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', type=int, default=200_000, help='a létrehozott példányok száma')
+    parser.add_argument('--reference', type=Path, help='egy összehasonlításként mérendő interval.py modul útvonala')
+    args = parser.parse_args(argv)
+
+    candidates = {'current': ROOT / 'interval.py'}
+    if args.reference:
+        candidates['reference'] = args.reference
+    results = {label: measure(load_interval_module(path, f'_bench_interval_{label}'), args.n)
+               for label, path in candidates.items()}
+
+    metrics = next(iter(results.values())).keys()
+    print(f'{"metric":20}' + ''.join(f'{label:>14}' for label in results))
+    for metric in metrics:
+        print(f'{metric:20}' + ''.join(f'{result[metric]:>14.1f}' for result in results.values()))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Az interval modul gyakran használt műveleteinek reprodukálható teljesítménymérése.
+
+Használat:
+    python benchmarks/suite.py [--sizes N [N ...]] [--cases NÉV [NÉV ...]] [--repeat R]
+                               [--save FÁJL] [--compare FÁJL] [--threshold ARÁNY]
+
+Minden mérési esetet több elemszám mellett futtat, és kiírja az áteresztőképességet (művelet/másodperc, a
+legjobb ismétlés alapján), valamint a tracemalloc által mért csúcs memóriahasználatot. Az adatok rögzített
+kezdőértékű véletlenszám-generátorral készülnek, így a futások összevethetők, és hálózati kapcsolatot sem igényelnek.
+
+A --save a mért értékeket JSON fájlba írja (a tárolt alapértékek a benchmarks/baseline.json fájlban vannak).
+A --compare egy korábban mentett fájlhoz hasonlítja az eredményeket, és ha valamely eset áteresztőképessége
+a --threshold aránynál (alapértelmezés szerint 20%) többel csökkent, vagy a memóriahasználata ennél többel nőtt,
+akkor regresszióként jelzi, és a szkript 1-es kóddal lép ki. Az időmérések csak azonos gépen mért
+alapértékekkel vethetők össze érdemben.
+"""
+from __future__ import annotations
+import argparse
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from math import ceil
+from pathlib import Path
+from random import Random
+from time import perf_counter
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from interval import Interval, IntervalType
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+MIN_SAMPLE_TIME = 0.05
+BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+TYPES = tuple(IntervalType)
+
+
+def _intervals(rng: Random, n: int) -> list[Interval]:
+    """n darab véletlen intervallum, amelyek között átlapolódók, szomszédosak és diszjunktak is vannak."""
+    result = []
+    for i in range(n):
+        lower = rng.randrange(n) * 0.5
+        upper = lower + rng.choice((0.5, 1.0, 1.5))
+        result.append(Interval(lower, upper, TYPES[i % 4]))
+    return result
+
+
+def _pairs(rng: Random, n: int) -> list[tuple[Interval, Interval]]:
+    intervals = _intervals(rng, n)
+    return list(zip(intervals, intervals[1:] + intervals[:1]))
+
+
+# Minden eset egy előkészítő függvény, amely az (rng, n) argumentumokból előállítja a bemenetet, és visszaadja
+# a mérendő, n műveletet végző függvényt. Az előkészítés ideje és memóriaigénye nem számít bele a mérésbe.
+
+def case_init(rng: Random, n: int) -> Callable:
+    args = [(rng.random(), rng.random() + 1, TYPES[i % 4]) for i in range(n)]
+    return lambda: [Interval(*a) for a in args]
+
+
+def case_contains(rng: Random, n: int) -> Callable:
+    intervals = _intervals(rng, n)
+    values = [rng.randrange(2 * n) * 0.25 for _ in range(n)]
+    return lambda: [v in iv for v, iv in zip(values, intervals)]
+
+
+def case_and(rng: Random, n: int) -> Callable:
+    pairs = _pairs(rng, n)
+    return lambda: [iv1 & iv2 for iv1, iv2 in pairs]
+
+
+def case_or(rng: Random, n: int) -> Callable:
+    pairs = _pairs(rng, n)
+    return lambda: [iv1 | iv2 for iv1, iv2 in pairs]
+
+
+def case_dict_lookup(rng: Random, n: int) -> Callable:
+    """Szótár felépítése Interval kulcsokkal és az összes kulcs visszakeresése (hash és egyenlőségvizsgálat)."""
+    intervals = [Interval(i * 0.5, i * 0.5 + rng.choice((0.25, 0.5)), TYPES[i % 4]) for i in range(n)]
+    keys = [Interval(iv.lower_endpoint, iv.upper_endpoint, iv.type) for iv in intervals]
+
+    def run():
+        table = dict.fromkeys(intervals, 0)
+        return [table[key] for key in keys]
+    return run
+
+
+def case_split(rng: Random, n: int) -> Callable:
+    """Egy intervallum n részre osztása és a részintervallumok bejárása."""
+    interval = Interval(-rng.random(), rng.random() + 1)
+    return lambda: list(interval.split(n))
+
+
+def case_is_adjacent_to(rng: Random, n: int) -> Callable:
+    pairs = _pairs(rng, n)
+    return lambda: [iv1.is_adjacent_to(iv2) for iv1, iv2 in pairs]
+
+
+def case_binning(rng: Random, n: int) -> Callable:
+    """A relative_frequency példafüggvényhez hasonló osztályba sorolás, értékenként a Partition.bin_index() hívásával."""
+    partition = Interval(-100, 100).split(50)
+    data = [rng.triangular(-100, 100, 50) for _ in range(n)]
+
+    def run():
+        counts = [0] * len(partition)
+        for value in data:
+            # A partíción kívül eső értékek indexe -1, ezeket a histogram() sem számolja.
+            if (index := partition.bin_index(value)) >= 0:
+                counts[index] += 1
+        return counts
+    return run
+
+
+def case_histogram(rng: Random, n: int) -> Callable:
+    """Ugyanaz az osztályba sorolás vektorizáltan, a Partition.histogram() metódussal."""
+    partition = Interval(-100, 100).split(50)
+    data = np.array([rng.triangular(-100, 100, 50) for _ in range(n)])
+    return lambda: partition.histogram(data)
+
+
+def case_bisect(rng: Random, n: int) -> Callable:
+    """Négyzetgyökvonás intervallumfelezéssel n különböző értékre."""
+    values = [rng.uniform(0, 4) for _ in range(n)]
+    start = Interval(0, 2)
+    return lambda: [start.bisect(lambda middle_point: middle_point ** 2 > x) for x in values]
+
+
+CASES = {
+    'init': case_init,
+    'contains': case_contains,
+    'and': case_and,
+    'or': case_or,
+    'dict_lookup': case_dict_lookup,
+    'split': case_split,
+    'is_adjacent_to': case_is_adjacent_to,
+    'binning': case_binning,
+    'histogram': case_histogram,
+    'bisect': case_bisect,
+}
+NUMPY_CASES = {'histogram'}
+
+
+def measure(case: Callable, n: int, repeat: int, seed: int = 0) -> dict:
+    """Az eset n elemszámú futásának áteresztőképessége (művelet/s) és csúcs memóriahasználata (bájt)."""
+    run = case(Random(seed), n)
+    # Bemelegítés, és a futások számának megválasztása úgy, hogy egy mérés legalább MIN_SAMPLE_TIME ideig tartson.
+    start = perf_counter()
+    run()
+    number = max(1, ceil(MIN_SAMPLE_TIME / (perf_counter() - start)))
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = perf_counter()
+        for _ in range(number):
+            run()
+        best = min(best, (perf_counter() - start) / number)
+    # A memóriát külön futásban mérjük, mert a tracemalloc lassítja a végrehajtást.
+    gc.collect()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'ops_per_sec': n / best, 'peak_bytes': peak}
+
+
+def run_suite(case_names, sizes, repeat: int) -> dict:
+    results = {}
+    for name in case_names:
+        for n in sizes:
+            key = f'{name}/{n}'
+            result = results[key] = measure(CASES[name], n, repeat)
+            print(f'{key:24}{result["ops_per_sec"]:>16,.0f} op/s{result["peak_bytes"] / 1024:>14,.1f} KiB', flush=True)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """A baseline-hoz képest a threshold aránynál nagyobb romlást mutató esetek leírásainak listája."""
+    regressions = []
+    print(f'\n{"case":24}{"op/s change":>14}{"memory change":>16}')
+    for key, result in results.items():
+        if key not in baseline:
+            print(f'{key:24}{"(new)":>14}')
+            continue
+        speed = result['ops_per_sec'] / baseline[key]['ops_per_sec'] - 1
+        memory = result['peak_bytes'] / max(baseline[key]['peak_bytes'], 1) - 1
+        flags = []
+        if speed < -threshold:
+            flags.append(f'{key}: throughput {speed:+.1%}')
+        if memory > threshold:
+            flags.append(f'{key}: peak memory {memory:+.1%}')
+        print(f'{key:24}{speed:>+14.1%}{memory:>+16.1%}' + ('  REGRESSION' if flags else ''))
+        regressions.extend(flags)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='a mért elemszámok')
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=list(CASES), help='a futtatandó esetek')
+    parser.add_argument('--repeat', type=int, default=5, help='az időmérés ismétléseinek száma')
+    parser.add_argument('--save', type=Path, help='az eredményeket ebbe a JSON fájlba írja')
+    parser.add_argument('--compare', type=Path, nargs='?', const=BASELINE,
+                        help=f'az eredményeket ehhez a JSON fájlhoz hasonlítja (alapértelmezés: {BASELINE.name})')
+    parser.add_argument('--threshold', type=float, default=0.2, help='a regressziónak tekintett romlás aránya')
+    args = parser.parse_args(argv)
+
+    case_names = [name for name in args.cases if np is not None or name not in NUMPY_CASES]
+    results = run_suite(case_names, args.sizes, args.repeat)
+
+    if args.save:
+        args.save.write_text(json.dumps({'python': platform.python_version(), 'machine': platform.machine(),
+                                         'results': results}, indent=2) + '\n', encoding='utf-8')
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding='utf-8'))['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print('\nRegressions:', *regressions, sep='\n  ')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,247 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, AsyncIterable, Literal, NamedTuple
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from multiprocessing import shared_memory
+from threading import Lock
+import asyncio
+import os
+import numpy as np
+from interval import Partition, ComparisonPolicy, _bin_indices
+
+# A munkafolyamatokban a partíció végpontjainak és a végpontokat tartalmazó intervallumok indexeinek osztott memóriában
+# lévő tömbjei, amelyeket a folyamat indulásakor _attach_partition állít be.
+_worker_partition = None
+
+
+def _chunks(data_source, chunk_size: int) -> Iterator[np.ndarray]:
+    """A data_source értékeit legfeljebb chunk_size elemű float64 tömbökben adja ki. NumPy tömb esetén a darabok
+    nézetek, egyébként a forrást folyamatosan olvassa, így egyszerre csak egy darab van a memóriában.
+    """
+    if isinstance(data_source, np.ndarray):
+        data = data_source.ravel()
+        for start in range(0, data.size, chunk_size):
+            yield data[start:start + chunk_size]
+        return
+    iterator = iter(data_source)
+    while (chunk := np.fromiter(islice(iterator, chunk_size), dtype=float)).size:
+        yield chunk
+
+
+def _count(values, edges, edge_bins, comparison: ComparisonPolicy) -> np.ndarray:
+    indices = _bin_indices(values, edges, edge_bins, comparison)
+    return np.bincount(indices[indices >= 0], minlength=len(edges) - 1)
+
+
+def _attach_partition(name: str, n: int, comparison: ComparisonPolicy):
+    """A munkafolyamat inicializálója: az osztott memóriában lévő tömbökre nézeteket hoz létre."""
+    global _worker_partition
+    memory = shared_memory.SharedMemory(name=name)
+    edges = np.ndarray(n + 1, dtype=np.float64, buffer=memory.buf)
+    edge_bins = np.ndarray(n + 1, dtype=np.int64, buffer=memory.buf, offset=edges.nbytes)
+    # A memory objektumot is meg kell tartani, mert a nézetek annak pufferére hivatkoznak.
+    _worker_partition = memory, edges, edge_bins, comparison
+
+
+def _count_chunk(values: np.ndarray) -> np.ndarray:
+    _, edges, edge_bins, comparison = _worker_partition
+    return _count(values, edges, edge_bins, comparison)
+
+
+def parallel_histogram(data_source: Iterable[int | float] | np.ndarray, partition: Partition, workers: int | None = None,
+                       chunk_size: int = 1_000_000, max_pending: int | None = None) -> np.ndarray:
+    """A Partition.histogram() párhuzamos megfelelője: egy NumPy tömbbel tér vissza, amelynek elemei megadják, hogy
+    a data_source értékei közül hány esik a partition egyes intervallumaiba.
+    A data_source lehet NumPy tömb vagy tetszőleges, számokat kiadó iterálható objektum (például generátor).
+    Az értékeket chunk_size elemű darabokban, workers számú (alapértelmezés szerint a processzorok számának megfelelő)
+    folyamatban sorolja osztályokba. A partíció végpontjait és flagjeit osztott memórián keresztül kapják meg a
+    folyamatok. Egyszerre legfeljebb max_pending (alapértelmezés szerint a folyamatok számának kétszerese) darab
+    van feldolgozás alatt, így a generátorok olvasása korlátos memóriával történik. Az eredmény megegyezik a soros
+    feldolgozáséval, mert a folyamatok ugyanazokból a tömbökből, ugyanazzal a szabállyal számolnak.
+    """
+    if chunk_size < 1:
+        raise ValueError('The chunk size should be at least 1.')
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    edges, edge_bins = partition._edge_arrays()
+    n = len(partition)
+    counts = np.zeros(n, dtype=np.int64)
+    if workers == 1:
+        for chunk in _chunks(data_source, chunk_size):
+            counts += _count(chunk, edges, edge_bins, partition.comparison)
+        return counts
+
+    memory = shared_memory.SharedMemory(create=True, size=edges.nbytes + (n + 1) * 8)
+    try:
+        np.ndarray(n + 1, dtype=np.float64, buffer=memory.buf)[:] = edges
+        np.ndarray(n + 1, dtype=np.int64, buffer=memory.buf, offset=edges.nbytes)[:] = edge_bins
+        with ProcessPoolExecutor(workers, initializer=_attach_partition,
+                                 initargs=(memory.name, n, partition.comparison)) as executor:
+            pending = set()
+            for chunk in _chunks(data_source, chunk_size):
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        counts += future.result()
+                pending.add(executor.submit(_count_chunk, chunk))
+            for future in pending:
+                counts += future.result()
+    finally:
+        memory.close()
+        memory.unlink()
+    return counts
+
+
+class BinnerSnapshot(NamedTuple):
+    """Egy Binner állapota egy adott pillanatban. A counts csak olvasható NumPy tömb, amelynek elemei a partition
+    egyes intervallumaiba esett értékek számai. Az underflow és overflow a partíció alsó végpontjánál kisebb, illetve
+    felső végpontjánál nagyobb (vagy a nyitott végponttal egyenlő) értékek, az invalid a NaN értékek, a gaps pedig
+    azon belső végpontokkal egyenlő értékek száma, amelyeket egyik szomszédos intervallum sem tartalmaz.
+    """
+    partition: Partition
+    counts: np.ndarray
+    underflow: int
+    overflow: int
+    invalid: int
+    gaps: int = 0
+
+    @property
+    def total(self) -> int:
+        """Az összes hozzáadott érték száma, a partíción kívül esőket is beleértve."""
+        return int(self.counts.sum()) + self.underflow + self.overflow + self.invalid + self.gaps
+
+    def relative_frequencies(self, bin_repr_value: Literal['lower', 'upper', 'mid'] = 'lower') -> dict:
+        """Az egyes intervallumokba esett értékek relatív gyakoriságát adja vissza egy szótárban, amelynek kulcsai az
+        intervallumokat a bin_repr_value szerint képviselő értékek (lásd Interval.reprval()). A relatív gyakoriságok
+        az összes hozzáadott értékhez viszonyítottak. Ha még nincs hozzáadott érték, akkor ValueError kivételt vált ki.
+        """
+        if not (total := self.total):
+            raise ValueError('No values have been added yet.')
+        return {iv.reprval(bin_repr_value): count / total for iv, count in zip(self.partition, self.counts.tolist())}
+
+
+class Binner:
+    """Folyamatosan érkező értékek osztályba sorolását végző gyűjtő, amely az értékeket nem tárolja, csak a partíció
+    egyes intervallumaiba esők számát. Az értékek egyesével (add()), tömbökben (update()) vagy aszinkron forrásból
+    (feed()) adhatók hozzá, az állapot pedig bármikor lekérdezhető a snapshot() metódussal. A partíción kívül eső
+    értékeket külön számlálók rögzítik. A gyűjtő több szálból is használható: az osztályba sorolás a zároláson kívül
+    történik, a számlálók frissítése és a pillanatkép másolása pedig zárolva, így egy pillanatkép minden hozzáadott
+    tömbnek vagy az egészét, vagy egyetlen elemét sem tartalmazza.
+    """
+
+    def __init__(self, partition: Partition):
+        """A partition például az Interval.split() által előállított partíció."""
+        self._partition = partition
+        self._edges, self._edge_bins = partition._edge_arrays()
+        # Egy egyik intervallumba sem eső, nem NaN érték alulcsordulás, ha az alsó végpontnál kisebb vagy vele egyenlő
+        # (ez utóbbi esetben a végpont nyitott), túlcsordulás, ha a felső végpontnál nagyobb vagy vele egyenlő. Egyébként
+        # egy olyan belső végponttal egyenlő, amelyben két nyitott végű intervallum csatlakozik.
+        self._lower, self._upper = float(self._edges[0]), float(self._edges[-1])
+        self._counts = np.zeros(len(partition), dtype=np.int64)
+        self._underflow = self._overflow = self._invalid = self._gaps = 0
+        self._lock = Lock()
+
+    @property
+    def partition(self) -> Partition:
+        return self._partition
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._partition!r})'
+
+    def add(self, value: int | float):
+        """Egyetlen értéket ad hozzá. Az intervallum keresése a Partition.bin_index() metódusával, NumPy nélkül történik,
+        amely a végpontok közelében is az update() által használt Partition.bin_indices() szabálya szerint dönt, így az
+        egyesével és a tömbökben hozzáadott értékek ugyanazokba a számlálókba kerülnek.
+        """
+        index = self._partition.bin_index(value)
+        eq = self._partition.comparison.eq
+        with self._lock:
+            if index >= 0:
+                self._counts[index] += 1
+            elif value != value:
+                self._invalid += 1
+            elif value < self._lower or eq(value, self._lower):
+                self._underflow += 1
+            elif value > self._upper or eq(value, self._upper):
+                self._overflow += 1
+            else:
+                self._gaps += 1
+
+    def update(self, values: Iterable[int | float] | np.ndarray):
+        """Az értékek tömbjét vagy iterálható objektum által kiadott értékeket egyetlen vektorizált lépésben adja hozzá."""
+        if isinstance(values, (np.ndarray, list, tuple)):
+            values = np.asarray(values, dtype=float).ravel()
+        else:
+            values = np.fromiter(values, dtype=float)
+        indices = _bin_indices(values, self._edges, self._edge_bins, self._partition.comparison)
+        counts = np.bincount(indices[indices >= 0], minlength=len(self._counts))
+        outside = values[indices < 0]
+        eq_array = self._partition.comparison.eq_array
+        invalid = int(np.isnan(outside).sum())
+        below = (outside < self._lower) | eq_array(outside, self._lower)
+        above = ~below & ((outside > self._upper) | eq_array(outside, self._upper))
+        underflow, overflow = int(below.sum()), int(above.sum())
+        gaps = outside.size - invalid - underflow - overflow
+        with self._lock:
+            self._counts += counts
+            self._underflow += underflow
+            self._overflow += overflow
+            self._invalid += invalid
+            self._gaps += gaps
+
+    async def feed(self, source: AsyncIterable, batch_size: int = 1024) -> int:
+        """Az aszinkron source által kiadott értékeket adja hozzá, és a hozzáadott értékek számával tér vissza.
+        A source számokat, vagy számok NumPy tömbjeit, listáit vagy tuple-jeit adhatja ki. Az egyesével érkező számokat batch_size elemű
+        tömbökben sorolja osztályokba, és minden tömb után átadja a vezérlést az eseményhurok többi feladatának, így
+        folyamatosan rendelkezésre álló forrás esetén sem blokkolja az eseményhurkot. A forrás kimerülésekor vagy a
+        feladat megszakításakor a még fel nem dolgozott számokat is hozzáadja.
+        """
+        if batch_size < 1:
+            raise ValueError('The batch size should be at least 1.')
+        buffer, fed = [], 0
+        try:
+            async for item in source:
+                if not isinstance(item, (np.ndarray, list, tuple)):
+                    buffer.append(item)
+                    if len(buffer) < batch_size:
+                        continue
+                    batch, buffer = buffer, []
+                else:
+                    batch = np.asarray(item, dtype=float).ravel()
+                self.update(batch)
+                fed += len(batch)
+                await asyncio.sleep(0)
+        finally:
+            if buffer:
+                self.update(buffer)
+                fed += len(buffer)
+        return fed
+
+    def snapshot(self) -> BinnerSnapshot:
+        """Az aktuális állapot konzisztens másolata, amelynek elkészítése az intervallumok számával arányos idejű."""
+        with self._lock:
+            counts = self._counts.copy()
+            snapshot = BinnerSnapshot(self._partition, counts, self._underflow, self._overflow, self._invalid, self._gaps)
+        counts.flags.writeable = False
+        return snapshot
+
+    def merge(self, other: Binner):
+        """Az other gyűjtő számlálóit hozzáadja a self számlálóihoz. A két gyűjtő partíciójának azonos végpontokkal,
+        flagekkel és egyenlőségvizsgálati szabállyal kell rendelkeznie, különben ValueError kivételt vált ki.
+        """
+        if not (np.array_equal(self._edges, other._edges) and np.array_equal(self._edge_bins, other._edge_bins)
+                and self._partition.comparison == other._partition.comparison):
+            raise ValueError('The binners should have the same partition.')
+        state = other.snapshot()
+        with self._lock:
+            self._counts += state.counts
+            self._underflow += state.underflow
+            self._overflow += state.overflow
+            self._invalid += state.invalid
+            self._gaps += state.gaps
+
+    def reset(self):
+        """Minden számlálót lenulláz."""
+        with self._lock:
+            self._counts[:] = 0
+            self._underflow = self._overflow = self._invalid = self._gaps = 0
@@ -0,0 +1,322 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, Sequence
+from itertools import product
+from math import inf, isfinite, prod
+from interval import Interval, IntervalType, Partition
+from interval_index import IntervalIndex
+
+
+class Box:
+    """Több dimenziós téglatestet modellez, amely tengelyenként egy-egy Interval Descartes-szorzata.
+    Egy pont akkor eleme, ha minden koordinátája a megfelelő tengely intervallumának eleme, így a tengelyenkénti
+    végpontok nyitottsága vagy zártsága és az egyenlőségvizsgálat szabálya az Interval osztályéval azonos.
+    """
+    __slots__ = ('_intervals', '_hash')
+
+    def __init__(self, *intervals: Interval):
+        """A tengelyek intervallumait a tengelyek sorrendjében kell megadni. Legalább egy tengely szükséges."""
+        if not intervals:
+            raise ValueError('A box should have at least one axis.')
+        if not all(isinstance(iv, Interval) for iv in intervals):
+            raise TypeError('The axes of a box should be Interval instances.')
+        self._intervals: tuple[Interval, ...] = intervals
+        self._hash = None
+
+    @classmethod
+    def from_corners(cls, lower_corner: Sequence[int | float], upper_corner: Sequence[int | float],
+                     type: IntervalType = IntervalType.CLOSED) -> Box:
+        """Új példányt hoz létre a legkisebb és legnagyobb koordinátájú csúcsok alapján, minden tengelyen type típusú
+        intervallumokkal.
+        """
+        if len(lower_corner) != len(upper_corner):
+            raise ValueError('The corners should have the same number of coordinates.')
+        return cls(*(Interval(lower, upper, type) for lower, upper in zip(lower_corner, upper_corner)))
+
+    @property
+    def intervals(self) -> tuple[Interval, ...]:
+        return self._intervals
+
+    @property
+    def ndim(self) -> int:
+        """A tengelyek száma."""
+        return len(self._intervals)
+
+    @property
+    def lower_corner(self) -> tuple:
+        return tuple(iv.lower_endpoint for iv in self._intervals)
+
+    @property
+    def upper_corner(self) -> tuple:
+        return tuple(iv.upper_endpoint for iv in self._intervals)
+
+    def __getitem__(self, axis: int) -> Interval:
+        """Az axis tengely intervalluma."""
+        return self._intervals[axis]
+
+    def __iter__(self) -> Iterator[Interval]:
+        return iter(self._intervals)
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(map(repr, self._intervals)))
+
+    def __str__(self):
+        return ' × '.join(map(str, self._intervals))
+
+    def __eq__(self, other) -> bool:
+        """Két téglatest egyenlő, ha tengelyenként egyenlőek."""
+        if not isinstance(other, Box):
+            return NotImplemented
+        return self._intervals == other._intervals
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self._intervals)
+        return self._hash
+
+    def _check_ndim(self, ndim: int):
+        if ndim != self.ndim:
+            raise ValueError('The number of dimensions should match.')
+
+    def __contains__(self, point: Sequence[int | float]) -> bool:
+        """Igaz értékkel tér vissza, ha a point koordinátáival megadott pont a téglatest eleme."""
+        self._check_ndim(len(point))
+        return all(value in iv for value, iv in zip(point, self._intervals))
+
+    def contains_array(self, points):
+        """Logikai NumPy tömbbel tér vissza, amely a points (pontonként egy sort tartalmazó, n × ndim alakú) tömb
+        azon sorainak helyén igaz, amelyek a téglatest elemei.
+        """
+        import numpy as np
+        points = np.asarray(points, dtype=float).reshape(-1, self.ndim)
+        result = np.ones(len(points), dtype=bool)
+        for axis, iv in enumerate(self._intervals):
+            result &= iv.contains_array(points[:, axis])
+        return result
+
+    def __and__(self, other: Box) -> Box | None:
+        """A két téglatest közös részével tér vissza, vagy None értékkel, ha nincs közös pontjuk."""
+        if not isinstance(other, Box):
+            return NotImplemented
+        self._check_ndim(other.ndim)
+        intervals = []
+        for iv1, iv2 in zip(self._intervals, other._intervals):
+            if (intersection := iv1 & iv2) is None:
+                return None
+            intervals.append(intersection)
+        return type(self)(*intervals)
+
+    def overlaps(self, other: Box) -> bool:
+        """Igaz, ha a két téglatestnek van közös pontja, vagyis minden tengelyen átlapolódnak."""
+        self._check_ndim(other.ndim)
+        return all(iv1.overlaps(iv2) for iv1, iv2 in zip(self._intervals, other._intervals))
+
+    def is_subbox(self, other: Box) -> bool:
+        """Igaz, ha a self minden pontja az other téglatestnek is eleme."""
+        self._check_ndim(other.ndim)
+        return all(iv1.is_subinterval(iv2) for iv1, iv2 in zip(self._intervals, other._intervals))
+
+    def volume(self) -> int | float:
+        """A tengelyenkénti hosszak szorzata."""
+        return prod(iv.length() for iv in self._intervals)
+
+    def split(self, shape: int | Sequence[int]) -> BoxGrid:
+        """A téglatestet egy rácsra osztja, amelynek tengelyenként shape megfelelő elemének megfelelő számú része van.
+        Egyetlen egész szám esetén minden tengely ennyi részre oszlik. A tengelyek felosztása az Interval.split()
+        szabályai szerint történik, így minden pont legfeljebb egy rácselembe esik.
+        """
+        shape = (shape,) * self.ndim if isinstance(shape, int) else tuple(shape)
+        self._check_ndim(len(shape))
+        return BoxGrid(tuple(iv.split(n) for iv, n in zip(self._intervals, shape)))
+
+
+class BoxGrid:
+    """Téglatestek szabályos rácsa, amelyet tengelyenként egy-egy Partition határoz meg. A rácselemek csak a
+    hozzáféréskor jönnek létre. A pontok rácselemekbe sorolása tengelyenként a Partition.bin_indices() metódusával,
+    vektorizáltan történik, így a végpontok nyitottsága vagy zártsága tengelyenként érvényesül.
+    """
+    __slots__ = ('_partitions',)
+
+    def __init__(self, partitions: Iterable[Partition]):
+        self._partitions: tuple[Partition, ...] = tuple(partitions)
+        if not self._partitions:
+            raise ValueError('A box grid should have at least one axis.')
+
+    @property
+    def partitions(self) -> tuple[Partition, ...]:
+        """A tengelyek felosztásai."""
+        return self._partitions
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(map(len, self._partitions))
+
+    @property
+    def ndim(self) -> int:
+        return len(self._partitions)
+
+    def __len__(self) -> int:
+        """A rácselemek száma."""
+        return prod(self.shape)
+
+    def __getitem__(self, index: Sequence[int]) -> Box:
+        """A tengelyenkénti indexekkel megadott rácselem."""
+        if len(index) != self.ndim:
+            raise IndexError('The index should have one component per axis.')
+        return Box(*(partition[i] for partition, i in zip(self._partitions, index)))
+
+    def __iter__(self) -> Iterator[Box]:
+        """A rácselemeket sorfolytonosan (az utolsó tengely szerinti index változik a leggyorsabban) adja ki."""
+        return (Box(*intervals) for intervals in product(*self._partitions))
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self._partitions)
+
+    def bin_indices(self, points):
+        """Egy NumPy tömbbel tér vissza, amelynek elemei a points (n × ndim alakú) tömb azonos indexű pontjait tartalmazó
+        rácselemek sorfolytonos indexei. Ha egy pontot egyik rácselem sem tartalmaz, akkor az index -1.
+        """
+        import numpy as np
+        points = np.asarray(points, dtype=float).reshape(-1, self.ndim)
+        indices = np.stack([partition.bin_indices(points[:, axis]) for axis, partition in enumerate(self._partitions)])
+        inside = np.all(indices >= 0, axis=0)
+        flat = np.full(len(points), -1, dtype=np.intp)
+        flat[inside] = np.ravel_multi_index(tuple(indices[:, inside]), self.shape)
+        return flat
+
+    def histogram(self, points):
+        """A numpy.histogramdd() függvényhez hasonlóan egy shape alakú tömbbel tér vissza, amelynek elemei megadják,
+        hogy a points pontjai közül hány esik az egyes rácselemekbe. A rácson kívül eső pontokat nem számolja.
+        """
+        import numpy as np
+        indices = self.bin_indices(points)
+        return np.bincount(indices[indices >= 0], minlength=len(self)).reshape(self.shape)
+
+
+class BoxIndex:
+    """Téglatestek gyűjteménye, amelyben gyorsan megkereshetők egy adott pontot tartalmazó, illetve egy adott
+    téglatesttel átlapolódó téglatestek. A téglatestek minden tengelyének intervallumait egy-egy IntervalIndex tárolja.
+    Egy keresés a legszelektívebbnek becsült tengely indexében részlineáris időben szűkít, és csak az ottani
+    találatoknál vizsgálja a többi tengelyt. Egy tengely annál szelektívebb, minél kisebb az intervallumai hosszainak
+    összege a tengelyen elfoglalt tartományuk hosszához képest, vagyis minél kevesebb intervallum tartalmaz
+    átlagosan egy pontot. A gyorsulás ezért az adatoktól függ: ha minden tengelyen sok téglatest fedi egymást,
+    akkor a keresés a találatok ellenőrzése miatt közel lineáris idejű.
+    Az index téglatestjeinek és a keresések argumentumainak dimenziószáma meg kell, hogy egyezzen.
+    """
+
+    def __init__(self, boxes: Iterable[Box] = ()):
+        # Minden téglatest minden tengelyének intervallumáról saját másolat kerül az adott tengely indexébe, amelynek
+        # azonosítója alapján a találatokhoz tartozó téglatest visszakereshető. Fordítva, a téglatestekhez tartozó
+        # kulcsok listái alapján az eltávolítandó téglatest kulcsai keresés nélkül adódnak.
+        self._boxes: dict[int, tuple[Interval, Box]] = {}
+        self._keys: dict[Box, list[tuple[Interval, ...]]] = {}
+        self._reset(0)
+        entries = []
+        for box in boxes:
+            if not entries:
+                self._reset(box.ndim)
+            entries.append(self._entry(box))
+        if entries:
+            self._indexes = [IntervalIndex(keys[axis] for keys in entries) for axis in range(self._ndim)]
+
+    def _reset(self, ndim: int):
+        """Üres, ndim dimenziós indexet állít be. A tengelyenkénti hosszösszegek, a nem korlátos intervallumok számai és
+        a tartományok a szelektivitás becslését szolgálják.
+        """
+        self._ndim, self._size = ndim, 0
+        self._indexes = [IntervalIndex() for _ in range(ndim)]
+        self._lengths, self._unbounded = [0] * ndim, [0] * ndim
+        self._lowers, self._uppers = [inf] * ndim, [-inf] * ndim
+
+    def _check_ndim(self, ndim: int):
+        if self._size and ndim != self._ndim:
+            raise ValueError('The number of dimensions should match.')
+
+    def _entry(self, box: Box) -> tuple[Interval, ...]:
+        self._check_ndim(box.ndim)
+        keys = tuple(Interval.from_endpoint_values_and_flags(iv.lower_endpoint, iv.upper_endpoint, *iv.flags, iv.comparison)
+                     for iv in box)
+        for axis, key in enumerate(keys):
+            self._boxes[id(key)] = key, box
+            self._add_length(axis, key, 1)
+            self._lowers[axis] = min(self._lowers[axis], key.lower_endpoint)
+            self._uppers[axis] = max(self._uppers[axis], key.upper_endpoint)
+        self._keys.setdefault(box, []).append(keys)
+        self._size += 1
+        return keys
+
+    def _add_length(self, axis: int, key: Interval, sign: int):
+        if isfinite(length := key.length()):
+            self._lengths[axis] += sign * length
+        else:
+            self._unbounded[axis] += sign
+
+    def _axis(self) -> int:
+        """A legszelektívebbnek becsült tengely, amelynél egy pontot átlagosan a legkevesebb intervallum tartalmaz.
+        Egy nem korlátos intervallum minden pontot tartalmaz. A tartományok eltávolításkor nem szűkülnek.
+        """
+        def density(axis: int):
+            span = self._uppers[axis] - self._lowers[axis]
+            bounded = self._lengths[axis] / span if 0 < span < inf else self._size - self._unbounded[axis]
+            return bounded + self._unbounded[axis]
+        return min(range(self._ndim), key=density)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Box]:
+        return (self._boxes[id(keys[0])][1] for entries in self._keys.values() for keys in entries)
+
+    def __repr__(self):
+        return '{}([{}])'.format(type(self).__name__, ', '.join(map(repr, self)))
+
+    def insert(self, box: Box):
+        """A box téglatestet hozzáadja az indexhez."""
+        if not self._size:
+            self._reset(box.ndim)
+        for index, key in zip(self._indexes, self._entry(box)):
+            index.insert(key)
+
+    def remove(self, box: Box):
+        """Eltávolítja az indexből a box téglatesttel egyenlő téglatestek egyikét.
+        Ha ilyen nincs az indexben, akkor ValueError kivételt vált ki.
+        """
+        if (entries := self._keys.get(box)) is None:
+            # A tűréssel egyenlő, de eltérő hasítóértékű téglatestet az egyik tengely szerinti keresés találja meg.
+            self._check_ndim(box.ndim)
+            stored = next((stored for stored in self._found(self._overlapping(box)) if stored == box), None) \
+                if self._size else None
+            if stored is None:
+                raise ValueError('The box is not in the index.')
+            box = stored
+            entries = self._keys[box]
+        keys = entries.pop()
+        if not entries:
+            del self._keys[box]
+        for axis, (index, key) in enumerate(zip(self._indexes, keys)):
+            index.remove(key)
+            del self._boxes[id(key)]
+            self._add_length(axis, key, -1)
+        self._size -= 1
+
+    def containing(self, point: Sequence[int | float]) -> list[Box]:
+        """Az index azon téglatestjeinek listájával tér vissza, amelyeknek a point pont eleme."""
+        self._check_ndim(len(point))
+        if not self._size:
+            return []
+        axis = self._axis()
+        return [box for box in self._found(self._indexes[axis].containing(point[axis])) if point in box]
+
+    def _overlapping(self, box: Box) -> list[Interval]:
+        """A legszelektívebb tengely indexének a box téglatest azonos tengelyű intervallumával átlapolódó kulcsai."""
+        axis = self._axis()
+        return self._indexes[axis].overlapping(box[axis])
+
+    def overlapping(self, box: Box) -> list[Box]:
+        """Az index azon téglatestjeinek listájával tér vissza, amelyek a box téglatesttel átlapolódnak."""
+        self._check_ndim(box.ndim)
+        if not self._size:
+            return []
+        return [stored for stored in self._found(self._overlapping(box)) if stored.overlaps(box)]
+
+    def _found(self, keys: list[Interval]) -> Iterator[Box]:
+        return (self._boxes[id(key)][1] for key in keys)
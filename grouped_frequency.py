@@ -0,0 +1,153 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, Literal, Mapping
+from itertools import accumulate, pairwise
+from math import fsum, sqrt
+from interval import Interval
+
+
+class GroupedFrequencyTable:
+    """Osztályközös gyakorisági sort modellez, amelyben az osztályközök egymással át nem lapolódó Interval példányok,
+    és mindegyikhez egy gyakoriság (az osztályközbe eső elemek száma) tartozik.
+    A statisztikai jellemzők az osztályközök végpontjaiból és a gyakoriságokból számítódnak, az egyes elemek előállítása nélkül,
+    így a számítás ideje csak az osztályközök számától függ. Az osztályközöket képviselő érték az Interval.reprval()
+    metódusával, a repr_key argumentumnak megfelelően adódik.
+    """
+
+    def __init__(self, frequencies: Mapping[Interval, int | float] | Iterable[tuple[Interval, int | float]],
+                 repr_key: Literal['lower', 'upper', 'mid'] = 'mid'):
+        """A frequencies egy szótár (például Counter), amelynek kulcsai az osztályközök, értékei a gyakoriságok,
+        vagy ilyen (osztályköz, gyakoriság) párokat kiadó iterálható objektum.
+        """
+        items = frequencies.items() if isinstance(frequencies, Mapping) else frequencies
+        items = sorted(items, key=lambda item: item[0].lower_endpoint)
+        for (iv1, _), (iv2, _) in pairwise(items):
+            if iv1.overlaps(iv2):
+                raise ValueError('The class intervals should not overlap.')
+        if any(frequency < 0 for _, frequency in items):
+            raise ValueError('The frequencies should be non-negative.')
+        self._intervals: list[Interval] = [iv for iv, _ in items]
+        self._frequencies: list = [frequency for _, frequency in items]
+        self._repr_key = repr_key
+        self._repr_values = [iv.reprval(repr_key) for iv in self._intervals]
+        self._cumulative = list(accumulate(self._frequencies))
+
+    def __repr__(self):
+        return '{}({{{}}})'.format(type(self).__name__, ', '.join(f'{iv!r}: {f!r}' for iv, f in self.items()))
+
+    def __len__(self) -> int:
+        """Az osztályközök száma."""
+        return len(self._intervals)
+
+    def __iter__(self) -> Iterator[Interval]:
+        """Az osztályközöket adja ki az alsó végpontjuk szerint növekvő sorrendben."""
+        return iter(self._intervals)
+
+    def items(self) -> Iterator[tuple[Interval, int | float]]:
+        """Az (osztályköz, gyakoriság) párokat adja ki az osztályközök alsó végpontja szerint növekvő sorrendben."""
+        return zip(self._intervals, self._frequencies)
+
+    def __getitem__(self, interval: Interval) -> int | float:
+        for iv, frequency in self.items():
+            if iv == interval:
+                return frequency
+        raise KeyError(interval)
+
+    def total(self) -> int | float:
+        """A gyakoriságok összege, vagyis az elemek száma."""
+        return self._cumulative[-1] if self._cumulative else 0
+
+    def _check_not_empty(self):
+        if not self.total():
+            raise ValueError('The frequency table should contain at least one element.')
+
+    def mean(self) -> float:
+        """Az osztályközöket képviselő értékek gyakoriságokkal súlyozott átlaga."""
+        self._check_not_empty()
+        return fsum(value * frequency for value, frequency in zip(self._repr_values, self._frequencies)) / self.total()
+
+    def _value_at(self, position: int):
+        """A képviselő értékek szerint rendezett elemsor position indexű elemének értéke."""
+        for value, cumulative in zip(self._repr_values, self._cumulative):
+            if position < cumulative:
+                return value
+
+    def median(self, interpolate: bool = True) -> float:
+        """A medián becslése. Ha az interpolate igaz, akkor a mediánt tartalmazó osztályközön belül lineáris
+        interpolációval számítja ki, feltételezve, hogy az elemek az osztályközön belül egyenletesen oszlanak el.
+        Egyébként az osztályközöket képviselő értékek szerinti elemsor mediánját adja vissza, amely megegyezik a
+        statistics.median() függvény által a kifejtett elemsorra adott értékkel.
+        """
+        if interpolate:
+            return self.quantile(0.5)
+        self._check_not_empty()
+        n = self.total()
+        if n % 2:
+            return self._value_at(n // 2)
+        return (self._value_at(n // 2 - 1) + self._value_at(n // 2)) / 2
+
+    def quantile(self, p: float) -> float:
+        """A p-edik kvantilis (0 <= p <= 1) becslése az azt tartalmazó osztályközön belüli lineáris interpolációval."""
+        if not 0 <= p <= 1:
+            raise ValueError('The probability should be between 0 and 1.')
+        self._check_not_empty()
+        position = p * self.total()
+        previous_cumulative = 0
+        for iv, frequency, cumulative in zip(self._intervals, self._frequencies, self._cumulative):
+            if frequency and position <= cumulative:
+                return iv.lower_endpoint + (position - previous_cumulative) / frequency * iv.length()
+            previous_cumulative = cumulative
+
+    def quantiles(self, n: int = 4) -> list[float]:
+        """Az elemeket n egyenlő gyakoriságú részre osztó n - 1 kvantilis listája."""
+        if n < 1:
+            raise ValueError('n should be at least 1.')
+        return [self.quantile(i / n) for i in range(1, n)]
+
+    def pvariance(self) -> float:
+        """Az osztályközöket képviselő értékek gyakoriságokkal súlyozott (populációs) varianciája."""
+        mean = self.mean()
+        return fsum(frequency * (value - mean) ** 2 for value, frequency in zip(self._repr_values, self._frequencies)) / self.total()
+
+    def variance(self) -> float:
+        """Az osztályközöket képviselő értékek gyakoriságokkal súlyozott mintavarianciája."""
+        n = self.total()
+        if n < 2:
+            raise ValueError('The frequency table should contain at least two elements.')
+        return self.pvariance() * n / (n - 1)
+
+    def pstdev(self) -> float:
+        return sqrt(self.pvariance())
+
+    def stdev(self) -> float:
+        return sqrt(self.variance())
+
+    def mode_class(self, density: bool = False) -> Interval:
+        """A legnagyobb gyakoriságú osztályközzel tér vissza. Ha a density igaz, akkor a gyakoriság helyett az
+        egységnyi hosszra jutó gyakoriság (gyakorisági sűrűség) alapján választ, ami eltérő hosszúságú
+        osztályközök esetén ad helyes eredményt.
+        """
+        self._check_not_empty()
+        if density:
+            weights = [frequency / iv.length() if iv.length() else (float('inf') if frequency else 0)
+                       for iv, frequency in self.items()]
+        else:
+            weights = self._frequencies
+        return self._intervals[max(range(len(weights)), key=weights.__getitem__)]
+
+    def merge(self, other: GroupedFrequencyTable) -> GroupedFrequencyTable:
+        """Új gyakorisági sorral tér vissza, amelyben az egyenlő osztályközök gyakoriságai összeadódnak,
+        a többi osztályköz pedig változatlanul szerepel. Az osztályközök ekkor sem lapolódhatnak át.
+        """
+        items = sorted((*self.items(), *other.items()), key=lambda item: item[0].lower_endpoint)
+        merged = []
+        for iv, frequency in items:
+            if merged and merged[-1][0] == iv:
+                merged[-1] = (iv, merged[-1][1] + frequency)
+            else:
+                merged.append((iv, frequency))
+        return type(self)(merged, self._repr_key)
+
+    def __add__(self, other: GroupedFrequencyTable) -> GroupedFrequencyTable:
+        if not isinstance(other, GroupedFrequencyTable):
+            return NotImplemented
+        return self.merge(other)
@@ -1,9 +1,14 @@
 
 from __future__ import annotations
+import os
 import sys
-from typing import Literal, Iterator
+from typing import Literal, Iterator, Iterable, Callable
+from collections.abc import Sequence
 from itertools import pairwise, chain
-from math import isclose
+from bisect import bisect_left, bisect_right
+from math import isclose, floor, isfinite, nextafter, inf, nan
+from numbers import Number
+from operator import eq as _exact_eq
 from enum import Enum
 from collections import namedtuple
 
@@ -21,10 +26,226 @@ IType = IvType = IntervalType
 IntervalEndpoint = namedtuple('IntervalEndpoint', 'value flag')
 Endpoints = namedtuple('Endpoints', 'lower upper')
 
+class ComparisonPolicy:
+    """A végpontok és más értékek egyenlőségvizsgálatának módját meghatározó szabály alaposztálya.
+    Az Interval minden olyan művelete, amelyben két érték egyenlőségét kell vizsgálni, az intervallumhoz tartozó
+    szabály eq() metódusát használja, a vektorizált műveletek pedig az eq_array() metódusát.
+    """
+    __slots__ = ()
+    exact: bool = False
+
+    def eq(self, num1, num2) -> bool:
+        raise NotImplementedError
+
+    def eq_array(self, values1, values2):
+        """Az eq() vektorizált megfelelője, amely NumPy tömbök elemeit páronként hasonlítja össze."""
+        raise NotImplementedError
+
+    def _key(self) -> tuple:
+        return ()
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ComparisonPolicy):
+            return NotImplemented
+        return type(self) is type(other) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash((type(self), self._key()))
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(map(repr, self._key())))
+
+
+class ExactComparison(ComparisonPolicy):
+    """Pontos egyenlőségvizsgálat az == operátorral. Egész, Fraction és Decimal típusú végpontokhoz ajánlott,
+    mert ezeknél a tűréssel való összehasonlítás lassú és szükségtelen. Az ilyen intervallumok műveletei
+    az egyenlőségvizsgálatot függvényhívás nélkül, közvetlenül végzik.
+    """
+    __slots__ = ()
+    exact = True
+    eq = staticmethod(_exact_eq)
+
+    def eq_array(self, values1, values2):
+        return values1 == values2
+
+
+class RelativeTolerance(ComparisonPolicy):
+    """Két érték egyenlő, ha eltérésük nem nagyobb a nagyobbik abszolút értékének rel_tol-szorosánál (math.isclose())."""
+    __slots__ = ('rel_tol',)
+
+    def __init__(self, rel_tol: float = 1e-15):
+        if rel_tol < 0:
+            raise ValueError('The tolerance should be non-negative.')
+        self.rel_tol = rel_tol
+
+    def _key(self) -> tuple:
+        return self.rel_tol,
+
+    def eq(self, num1, num2) -> bool:
+        return isclose(num1, num2, rel_tol=self.rel_tol)
+
+    def eq_array(self, values1, values2):
+        import numpy as np
+        with np.errstate(invalid='ignore'):
+            difference = np.abs(values1 - values2)
+            # A math.isclose() függvényhez hasonlóan a végtelen csak önmagával egyenlő.
+            return (values1 == values2) | (difference <= self.rel_tol * np.maximum(np.abs(values1), np.abs(values2))) & \
+                (difference != np.inf)
+
+
+class AbsoluteTolerance(ComparisonPolicy):
+    """Két érték egyenlő, ha eltérésük nem nagyobb abs_tol értékénél."""
+    __slots__ = ('abs_tol',)
+
+    def __init__(self, abs_tol: float):
+        if abs_tol < 0:
+            raise ValueError('The tolerance should be non-negative.')
+        self.abs_tol = abs_tol
+
+    def _key(self) -> tuple:
+        return self.abs_tol,
+
+    def eq(self, num1, num2) -> bool:
+        return isclose(num1, num2, rel_tol=0.0, abs_tol=self.abs_tol)
+
+    def eq_array(self, values1, values2):
+        import numpy as np
+        with np.errstate(invalid='ignore'):
+            return (values1 == values2) | (np.abs(values1 - values2) <= self.abs_tol)
+
+
+EXACT = ExactComparison()
+
+
+def _check_comparison(comparison1: ComparisonPolicy, comparison2: ComparisonPolicy):
+    """ValueError kivételt vált ki, ha a két egyenlőségvizsgálati szabály eltér."""
+    if comparison1 is not comparison2 and comparison1 != comparison2:
+        raise ValueError('The intervals should have the same comparison policy.')
+
+
+def _common_comparison(intervals: Iterable, default: ComparisonPolicy | None = None) -> ComparisonPolicy:
+    """Az intervals által kiadott intervallumok (vagy comparison attribútummal rendelkező gyűjtemények) közös
+    egyenlőségvizsgálati szabálya. Ha a szabályok eltérnek, akkor ValueError kivételt vált ki. Ha nincs egyetlen
+    intervallum sem, akkor a default, vagy ha az None, akkor az Interval osztály default_comparison attribútuma.
+    """
+    comparison = None
+    for interval in intervals:
+        if comparison is None:
+            comparison = interval.comparison
+        else:
+            _check_comparison(comparison, interval.comparison)
+    if comparison is None:
+        return Interval.default_comparison if default is None else default
+    return comparison
+
+# Az intervallumtípusok a végpontok flagjeiből képzett kétbites szám (alsó flag * 2 + felső flag) szerinti sorrendben.
+_INTERVAL_TYPES = tuple(sorted(IntervalType, key=lambda t: t.value))
+_INTERVAL_TYPES_BY_FLAGS = {t.value: t for t in IntervalType}
+
+# Az intervallumaritmetika lebegőpontos eredményeit csak akkor kerekítjük kifelé, ha a kerekített érték a pontos
+# eredménytől eltér. Ennek eldöntéséhez a kerekítési hibát hibamentes transzformációkkal (Knuth és Dekker módszerével)
+# számítjuk ki. A segédfüggvények csak aritmetikai műveleteket használnak, így NumPy tömbökre is alkalmazhatók.
+# Egy hiba NaN, ha a számítás túlcsordult; ilyenkor a kerekítés iránya nem ismert, ezért mindig kerekítünk.
+# A _TINY-nál kisebb abszolút értékű szorzatok és hányadosok hibája alulcsordulás miatt nem számítható pontosan,
+# ezért ezeket (a nulla operandusból adódó pontos nullát kivéve) mindig kerekítjük.
+_SPLITTER = 134217729.0  # 2 ** 27 + 1
+_TINY = 2.0 ** -969
+
+
+def _split(value):
+    """Két, legfeljebb 26 értékes bitet tartalmazó számra bontja value-t, amelyek összege pontosan value."""
+    scaled = _SPLITTER * value
+    high = scaled - (scaled - value)
+    return high, value - high
+
+
+def _sum_error(a, b, total):
+    """Az a + b pontos összegének és a kerekített total összegnek a különbsége (TwoSum)."""
+    b_virtual = total - a
+    return (a - (total - b_virtual)) + (b - b_virtual)
+
+
+def _product_error(a, b, product):
+    """Az a * b pontos szorzatának és a kerekített product szorzatnak a különbsége (TwoProduct)."""
+    a_high, a_low = _split(a)
+    b_high, b_low = _split(b)
+    return ((a_high * b_high - product) + a_high * b_low + a_low * b_high) + a_low * b_low
+
+
+def _underflow(a, b, result):
+    """Igaz (tömb esetén ott igaz), ahol az a és b nem nulla operandusokból képzett result szorzat vagy hányados
+    hibája alulcsordulás miatt nem számítható pontosan.
+    """
+    return (abs(result) < _TINY) & (a != 0) & (b != 0)
+
+
+def _quotient_residual(a, b, quotient):
+    """Az a - quotient * b pontos maradék, amelynek előjele pozitív b esetén a pontos hányados és a kerekített
+    quotient különbségének előjele.
+    """
+    product = quotient * b
+    return (a - product) - _product_error(quotient, b, product)
+
+
+def _power_exact(base, exponent: int):
+    """Igaz (tömb esetén ott igaz), ahol base ** exponent (exponent ≥ 1) pontosan ábrázolható. Ez pontosan akkor
+    teljesül, ha a bináris hatványozás minden szorzása pontos, mert a részeredmények kisebb kitevős hatványok.
+    """
+    exact, result, square = True, None, base
+    while True:
+        if exponent & 1:
+            if result is None:
+                result = square
+            else:
+                product = result * square
+                exact = exact & (_product_error(result, square, product) == 0) & (abs(product) >= _TINY)
+                result = product
+        exponent >>= 1
+        if not exponent:
+            return exact | (base == 0)
+        product = square * square
+        exact = exact & (_product_error(square, square, product) == 0) & (abs(product) >= _TINY)
+        square = product
+
+
+def _round_down(value, inexact: bool = True):
+    """Lebegőpontos érték esetén, ha inexact igaz, akkor a következő kisebb ábrázolható szám. Túlcsordulás esetén
+    ez a végtelen helyett a legnagyobb véges szám.
+    """
+    return nextafter(value, -inf) if inexact and isinstance(value, float) and value != -inf else value
+
+
+def _round_up(value, inexact: bool = True):
+    return nextafter(value, inf) if inexact and isinstance(value, float) and value != inf else value
+
+
+def _extremes(candidates: list[tuple], zero_attained: bool) -> tuple:
+    """A (érték, felvett-e, kerekítési hiba) hármasok közül a legkisebb és legnagyobb értékkel, azzal, hogy ezeket
+    felveszi-e a művelet, valamint azzal tér vissza, hogy kifelé kell-e őket kerekíteni. Egy szélsőértéket akkor vesz
+    fel, ha valamelyik azt adó hármas felveszi, a nullát pedig akkor is, ha zero_attained igaz (például szorzásnál,
+    ha valamelyik tényező intervallumának eleme a nulla). A kerekítési hiba a pontos és a kerekített érték különbsége.
+    """
+    lower = min(value for value, _, _ in candidates)
+    upper = max(value for value, _, _ in candidates)
+    lower_flag = any(attained for value, attained, _ in candidates if value == lower) or (lower == 0 and zero_attained)
+    upper_flag = any(attained for value, attained, _ in candidates if value == upper) or (upper == 0 and zero_attained)
+    round_lower = any(not error >= 0 for value, _, error in candidates if value == lower)
+    round_upper = any(not error <= 0 for value, _, error in candidates if value == upper)
+    return lower, int(lower_flag), upper, int(upper_flag), round_lower, round_upper
+
+
 class Interval:
-    """Egy valós értékkészletű korlátos intervallumot modellez."""
+    """Egy valós értékkészletű korlátos intervallumot modellez.
+    A példányok helytakarékosan tárolódnak: a végpontok értékei mellett a flagek egyetlen kétbites számba sűrítve
+    szerepelnek, a hasítóértéket pedig az első használatkor számítjuk ki és eltároljuk.
+    Az értékek egyenlőségét az intervallumhoz tartozó ComparisonPolicy példány szerint vizsgáljuk, amely a konstruktorban
+    adható meg, egyébként az osztály default_comparison attribútuma. Ez osztályszinten (alosztályban is) átállítható.
+    """
+    __slots__ = ('_lower_endpoint', '_upper_endpoint', '_bits', '_hash', '_comparison')
+    default_comparison: ComparisonPolicy = RelativeTolerance(1e-15)
 
-    def __init__(self, lower_endpoint_value: int | float, upper_endpoint_value: int | float, type: IntervalType = IntervalType.CLOSED):
+    def __init__(self, lower_endpoint_value: int | float, upper_endpoint_value: int | float, type: IntervalType = IntervalType.CLOSED,
+                 comparison: ComparisonPolicy | None = None):
         """Egy valós értékkészletű intervallumot meghatározza a két végpontja (lower_endpoint_value, upper_endpoint_value), amelyek közül
         a felső (jobb oldali) nagyobb, mint az alsó (bal oldali), és az, hogy a végeken nyitott vagy zárt. Ez utóbbi az
         intervallum típusát határozza meg, amelyet a type argumentummal lehet megadni az IntervalType felsorolástípus példányaival.
@@ -37,14 +258,17 @@ class Interval:
         Műveletek eredményeként kiadódhat olyan elfajult intervallum, amelynek egy eleme van, vagyis az alsó és felső végpontok azonosak.
         Ez megengedett ebben a modellben. Ellenben az üres, elemet nem tartalmazó intevallum nem értelmezett. Ha egy műveletből ilyen
         adódna, akkor None lesz az eredmény.
+        A comparison az egyenlőségvizsgálat szabálya. Ha nincs megadva, akkor az osztály default_comparison attribútuma.
+        A műveletek eredményeként létrejövő intervallumok a self szabályát öröklik.
         """
         if lower_endpoint_value > upper_endpoint_value:
             raise ValueError('Upper endpoint should be greater than lower endpoint.')
 
         self._lower_endpoint, self._upper_endpoint = lower_endpoint_value, upper_endpoint_value
-        self._type: IntervalType = type
-        self._flags: tuple = type.value
-        self.endpoints = Endpoints(IntervalEndpoint(lower_endpoint_value, self._flags[0]), IntervalEndpoint(upper_endpoint_value, self._flags[1]))
+        flags = type._value_
+        self._bits: int = flags[0] << 1 | flags[1]
+        self._hash = None
+        self._comparison: ComparisonPolicy = self.default_comparison if comparison is None else comparison
 
     @property
     def lower_endpoint(self) -> int | float:
@@ -56,14 +280,27 @@ class Interval:
 
     @property
     def type(self) -> IntervalType:
-        return self._type
+        return _INTERVAL_TYPES[self._bits]
 
     @property
     def flags(self) -> tuple:
         """Az alsó és felső végpontok nyitott vagy zárt jellegét leíró kételemű tuple.
         Ha az intervallum az adott végponton nyitott, akkor az érték 0, ha zárt, akkor 1.
         """
-        return self._flags
+        return _INTERVAL_TYPES[self._bits]._value_
+
+    @property
+    def comparison(self) -> ComparisonPolicy:
+        """Az intervallum értékeinek egyenlőségvizsgálatához használt szabály."""
+        return self._comparison
+
+    @property
+    def endpoints(self) -> Endpoints:
+        """A végpontok értékét és flagjét tartalmazó IntervalEndpoint objektumok az alsó és felső végpont sorrendjében.
+        Ezek nem tárolódnak a példányban, hanem minden hozzáféréskor létrejönnek.
+        """
+        lower_flag, upper_flag = self.flags
+        return Endpoints(IntervalEndpoint(self._lower_endpoint, lower_flag), IntervalEndpoint(self._upper_endpoint, upper_flag))
 
     def __repr__(self):
         return '{}({}, {}, {})'.format(type(self).__name__, self.lower_endpoint, self.upper_endpoint, self.type)
@@ -77,21 +314,27 @@ class Interval:
 
     @classmethod
     def from_endpoint_values_and_flags(cls, lower_endpoint_value, upper_endpoint_value,
-                                       lower_endpoint_flag: Literal[0, 1], upper_endpoint_flag: Literal[0, 1]) -> Interval:
+                                       lower_endpoint_flag: Literal[0, 1], upper_endpoint_flag: Literal[0, 1],
+                                       comparison: ComparisonPolicy | None = None) -> Interval:
         """Új Interval példányt hoz létre a végpontok, valamint a végpontok nyitottságát vagy zártságát
         jelző 0 vagy 1 értékek alapján.
         """
-        return cls(lower_endpoint_value, upper_endpoint_value, IntervalType((lower_endpoint_flag, upper_endpoint_flag)))
+        try:
+            interval_type = _INTERVAL_TYPES_BY_FLAGS[lower_endpoint_flag, upper_endpoint_flag]
+        except KeyError:
+            raise ValueError('The endpoint flags should be 0 or 1.') from None
+        return cls(lower_endpoint_value, upper_endpoint_value, interval_type, comparison)
 
     @classmethod
-    def from_endpoints(cls, lower_endpoint: IntervalEndpoint, upper_endpoint: IntervalEndpoint) -> Interval:
+    def from_endpoints(cls, lower_endpoint: IntervalEndpoint, upper_endpoint: IntervalEndpoint,
+                       comparison: ComparisonPolicy | None = None) -> Interval:
         """Új Interval példányt hoz létre a végpontobjektumok alapján."""
-        return cls.from_endpoint_values_and_flags(lower_endpoint.value, upper_endpoint.value, lower_endpoint.flag, upper_endpoint.flag)
+        return cls.from_endpoint_values_and_flags(lower_endpoint.value, upper_endpoint.value, lower_endpoint.flag, upper_endpoint.flag,
+                                                  comparison)
 
-    @staticmethod
-    def _eq(num1: float, num2: float) -> bool:
-        """Segédfüggvény két valós szám egyenlőségvizsgálatához."""
-        return isclose(num1, num2, rel_tol=1e-15)
+    def _eq(self, num1: float, num2: float) -> bool:
+        """Segédfüggvény két valós szám egyenlőségvizsgálatához az intervallum szabálya szerint."""
+        return self._comparison.eq(num1, num2)
 
     def __eq__(self, other) -> bool:
         """Igaz értékkel tér vissza, ha a self és other egyenlő. Ezek akkor egyenlőek, ha az azonos oldalakon
@@ -103,7 +346,9 @@ class Interval:
                                             self._eq(self.upper_endpoint, other.upper_endpoint))
 
     def __hash__(self):
-        return hash((*self.endpoints, *self.flags))
+        if self._hash is None:
+            self._hash = hash((self._lower_endpoint, self._upper_endpoint, self._bits))
+        return self._hash
 
     def __lt__(self, other):
         """Igaz értékkel tér vissza, ha a self kisebb, mint other. A self akkor kisebb, mint other, ha
@@ -113,10 +358,10 @@ class Interval:
             return NotImplemented
         # Ahhoz, hogy a self kisebb legyen, mint other a következő feltételek valamelyikének kell teljesülni.
         # Ha a self felső végpontja kisebb, mint az other alsó végpontja.
-        cond1 = self.upper_endpoint < other.lower_endpoint
+        if self._upper_endpoint < other._lower_endpoint:
+            return True
         # Ha a self felső végpont és az other alsó végpont egyenlő és ezen oldalakon bármelyik intervallum nyitott.
-        cond2 = self._eq(other.lower_endpoint, self.upper_endpoint) and (0 in (other.flags[0], self.flags[1]))
-        return cond1 or cond2
+        return not (self._bits & 1 and other._bits & 2) and self._comparison.eq(other._lower_endpoint, self._upper_endpoint)
 
     def __le__(self, other) -> bool:
         """Igaz értékkel tér vissza, ha a self kisebb vagy egyenlő, mint other."""
@@ -128,8 +373,56 @@ class Interval:
         """Igaz értékkel tér vissza, ha a value a self értékei között szerepel, beleértve a végpontokat is, ha
         az intervallum azon az oldalon zárt.
         """
-        return ((self._eq(self.lower_endpoint, value) * self.flags[0] or self.lower_endpoint < value) and
-                (self._eq(self.upper_endpoint, value) * self.flags[1] or self.upper_endpoint > value))
+        lower, upper = self._lower_endpoint, self._upper_endpoint
+        # A végpontok közé eső értékeknél nincs szükség egyenlőségvizsgálatra.
+        if lower < value < upper:
+            return True
+        if self._comparison.exact:
+            return ((lower < value or self._bits & 2 and lower == value) and
+                    (value < upper or self._bits & 1 and upper == value))
+        eq = self._comparison.eq
+        return ((lower < value or self._bits & 2 and eq(lower, value)) and
+                (value < upper or self._bits & 1 and eq(upper, value)))
+
+    def contains_array(self, values):
+        """A __contains__ vektorizált megfelelője. Egy NumPy tömbbel tér vissza, amelynek elemei a values tömb azonos
+        indexű elemeire adják meg, hogy az adott érték eleme-e az intervallumnak. A values lehet bármilyen tömbszerű objektum.
+        """
+        import numpy as np
+        values = np.asarray(values, dtype=float)
+        lower, upper = float(self.lower_endpoint), float(self.upper_endpoint)
+        lower_flag, upper_flag = map(bool, self.flags)
+        eq_array = self._comparison.eq_array
+        return (((lower < values) | (lower_flag & eq_array(values, lower))) &
+                ((values < upper) | (upper_flag & eq_array(values, upper))))
+
+    def select(self, sorted_values) -> slice:
+        """A növekvő sorrendbe rendezett sorted_values sorozat (lista, tuple vagy NumPy tömb) azon elemeit kijelölő
+        szelettel tér vissza, amelyek az intervallum elemei. A szelet határait bináris kereséssel, O(log n) időben
+        határozza meg: a keresés iránya a végpontok nyitottságától vagy zártságától függ, zárt végpont esetén pedig a
+        végponttal (tűréssel) egyező szomszédos elemek is a szeletbe kerülnek, a __contains__ metódussal megegyezően.
+        """
+        lower, upper = self._lower_endpoint, self._upper_endpoint
+        if hasattr(sorted_values, 'searchsorted'):
+            start = int(sorted_values.searchsorted(lower, 'left' if self._bits & 2 else 'right'))
+            stop = int(sorted_values.searchsorted(upper, 'right' if self._bits & 1 else 'left'))
+        else:
+            start = (bisect_left if self._bits & 2 else bisect_right)(sorted_values, lower)
+            stop = (bisect_right if self._bits & 1 else bisect_left)(sorted_values, upper)
+        if not self._comparison.exact:
+            eq = self._comparison.eq
+            if self._bits & 2:
+                while start and eq(sorted_values[start - 1], lower):
+                    start -= 1
+            if self._bits & 1:
+                while stop < len(sorted_values) and eq(sorted_values[stop], upper):
+                    stop += 1
+        return slice(start, max(start, stop))
+
+    def count_in(self, sorted_values) -> int:
+        """A növekvő sorrendbe rendezett sorted_values sorozat intervallumba eső elemeinek száma (lásd select())."""
+        selection = self.select(sorted_values)
+        return selection.stop - selection.start
 
     def __iter__(self) -> Iterator:
         """Olyan iterátort ad vissza, amely sorban kiadja az alsó és a felső végpontotokat, majd az ezekhez tartozó flagek értékeit."""
@@ -150,21 +443,46 @@ class Interval:
         repr_values = {'lower': self.lower_endpoint, 'upper': self.upper_endpoint, 'mid': self.midpoint()}
         return repr_values[key]
 
-    def split(self, n: int) -> Iterator[Interval]:
+    def split(self, n: int) -> Partition:
         """Az intervallumot n részintervallumra osztja.
         Ahhoz, hogy egy keresett érték csak egyetlen részintervallumban legyen megtalálható, minden részintervallum
         alsó végpontja megegyezik a felosztott intervallum alsó végpontjával, a felső végpontok
         ehhez igazodnak, hogy a csatlakozó végpontok zártsága/nyitottsága ellentétes legyen. Az utolsó részintervallum
         felső végpontja a felosztott intervallum felső végpontjának megfelelő lesz.
+        A részintervallumokat egy Partition példány adja vissza, amely azokat csak a hozzáféréskor hozza létre.
+        """
+        return Partition.uniform(self, n)
+
+    def bisect(self, predicate: Callable[[float], bool], tol: float = 0.0) -> Interval:
+        """Intervallumfelezéssel szűkíti az intervallumot, és a végső, legfeljebb tol hosszúságú intervallummal tér vissza,
+        amelynek típusa megegyezik a self típusával. A predicate a felezőponttal hívva akkor ad igaz értéket, ha a keresett
+        érték az alsó félintervallumban van, egyébként a felső félintervallumban folytatódik a keresés.
+        A felezés lebegőpontos számokon történik (a nem float végpontok is float típusúvá alakulnak), részintervallumok
+        létrehozása nélkül. Ha tol nulla, akkor addig tart, amíg a felezőpont a lebegőpontos ábrázolás miatt már nem esik
+        a két végpont közé, ami legfeljebb néhány ezer lépés után bekövetkezik.
         """
-        width = self.length() / n
-        # Az első (n-1) darab részintervallum előállítása.
-        iterable1 = (Interval.from_endpoint_values_and_flags(a, b, self.flags[0], self.flags[0] ^ 1)
-                     for a, b in pairwise(self.lower_endpoint + width * i for i in range(n)))
-        # Az utolsó részintervallum előállítása.
-        iterable2 = [Interval.from_endpoint_values_and_flags(left_point := self.lower_endpoint + width * (n - 1), left_point + width,
-                                                             self.flags[0], self.flags[1])]
-        return chain(iterable1, iterable2)
+        lower, upper = float(self._lower_endpoint), float(self._upper_endpoint)
+        while upper - lower > tol:
+            middle = (lower + upper) / 2
+            if not lower < middle < upper:
+                break
+            if predicate(middle):
+                upper = middle
+            else:
+                lower = middle
+        return type(self)(lower, upper, self.type, self._comparison)
+
+    def find_root(self, f: Callable[[float], float], tol: float = 0.0) -> Interval:
+        """Az f függvény egy zérushelyét tartalmazó, legfeljebb tol hosszúságú intervallummal tér vissza, amelyet a
+        bisect() metódussal határoz meg. Az f előjelének a két végpontban különbözőnek kell lennie, vagy valamelyik
+        végpontban nulla értéket kell felvennie.
+        """
+        f_lower, f_upper = f(self._lower_endpoint), f(self._upper_endpoint)
+        if f_lower and f_upper and (f_lower > 0) == (f_upper > 0):
+            raise ValueError('The function should have opposite signs at the endpoints.')
+        # A zérushely az alsó félintervallumban van, ha f a felezőpontban nulla, vagy előjele eltér az alsó végpontbelitől.
+        lower_positive = f_lower > 0 if f_lower else not f_upper > 0
+        return self.bisect(lambda middle: (f_middle := f(middle)) == 0 or (f_middle > 0) != lower_positive, tol)
 
     def sort(self, *others: Interval) -> list[Interval]:
         """Egy listával tér vissza, amelynek a self és az others argumentummal megadott intervallumok az elemei az
@@ -176,28 +494,33 @@ class Interval:
         """Olyan új Interval példánnyal tér vissza, amely a self és other közös részét (metszetét) képviseli.
         Két intervallum közös része egy olyan intervallum, amelyben legalább egy olyan érték van, amely közös a két intervallumban.
         """
+        if not isinstance(other, Interval):
+            return NotImplemented
         _iv1, _iv2 = self.sort(other)
 
         if t := _iv1.adj_iv_common_endpoint(_iv2):
             _, flag1, flag2 = t
             if flag1 & flag2:
-                return Interval.from_endpoints(_iv1.endpoints, _iv2.endpoints)
+                return Interval.from_endpoints(_iv1.endpoints.upper, _iv2.endpoints.lower, self._comparison)
             else:
                 return None
 
         elif not (_iv2 > _iv1):
             intersect_lower_value = _iv2.lower_endpoint
             if self._eq(_iv1.lower_endpoint, _iv2.lower_endpoint):
-                intersect_lower_flag = _iv2.endpoints.lower.flag & _iv1.endpoints.lower.flag
+                intersect_lower_flag = _iv2.flags[0] & _iv1.flags[0]
             else:
-                intersect_lower_flag = _iv2.endpoints.lower.flag
+                intersect_lower_flag = _iv2.flags[0]
             intersect_upper_endpoint: IntervalEndpoint = min((_iv1.endpoints.upper, _iv2.endpoints.upper), key=lambda ep: ep.value)
             if self._eq(_iv1.upper_endpoint, _iv2.upper_endpoint):
-                intersect_upper_flag = _iv2.endpoints.upper.flag & _iv1.endpoints.upper.flag
+                intersect_upper_flag = _iv2.flags[1] & _iv1.flags[1]
             else:
                 intersect_upper_flag = intersect_upper_endpoint.flag
+            # Az egyetlen végpontból álló metszet csak akkor nem üres, ha a végpontot mindkét intervallum tartalmazza.
+            if self._eq(intersect_lower_value, intersect_upper_endpoint.value) and not intersect_lower_flag & intersect_upper_flag:
+                return None
             return Interval.from_endpoint_values_and_flags(intersect_lower_value, intersect_upper_endpoint.value,
-                                                           intersect_lower_flag, intersect_upper_flag)
+                                                           intersect_lower_flag, intersect_upper_flag, self._comparison)
         return None
 
     def __or__(self, other: Interval) -> Interval | None:
@@ -206,54 +529,183 @@ class Interval:
         Ha ez a feltétel nem teljesül, akkor a self és other nem egyesíthető egyetlen intervallummá.
         Ekkor a visszatérési érték None.
         """
+        if not isinstance(other, Interval):
+            return NotImplemented
         _iv1, _iv2 = self.sort(other)
 
         if t := _iv1.adj_iv_common_endpoint(_iv2):
             _, flag1, flag2 = t
             if flag1 | flag2:
-                return Interval.from_endpoints(_iv1.endpoints, _iv2.endpoints)
+                return Interval.from_endpoints(_iv1.endpoints.lower, _iv2.endpoints.upper, self._comparison)
             else:
                 return None
 
         elif not (_iv2 > _iv1):
             union_lower_value = _iv1.lower_endpoint
             if self._eq(_iv1.lower_endpoint, _iv2.lower_endpoint):
-                union_lower_flag = _iv1.endpoints.lower.flag | _iv2.endpoints.lower.flag
+                union_lower_flag = _iv1.flags[0] | _iv2.flags[0]
             else:
-                union_lower_flag = _iv1.endpoints.lower.flag
+                union_lower_flag = _iv1.flags[0]
 
             union_upper_endpoint: IntervalEndpoint = max((_iv1.endpoints.upper, _iv2.endpoints.upper), key=lambda ep: ep.value)
             if self._eq(_iv1.upper_endpoint, _iv2.upper_endpoint):
-                union_upper_flag = _iv1.endpoints.upper.flag | _iv2.endpoints.upper.flag
+                union_upper_flag = _iv1.flags[1] | _iv2.flags[1]
             else:
                 union_upper_flag = union_upper_endpoint.flag
 
             return Interval.from_endpoint_values_and_flags(union_lower_value, union_upper_endpoint.value,
-                                                           union_lower_flag, union_upper_flag)
+                                                           union_lower_flag, union_upper_flag, self._comparison)
         return None
 
-    def __add__(self, value: int | float) -> Interval:
-        """Olyan új Interval példánnyal tér vissza, amely a végein ugyanúgy zárt/nyitott, mint self, de
-        két végpontja a self végpontjaihoz képest value értékkel növeltek. Más szóval, az új intervallum
+    def _from_bounds(self, lower, lower_flag: int, upper, upper_flag: int, round_lower: bool = True,
+                     round_upper: bool = True) -> Interval:
+        """Az intervallumaritmetikai műveletek eredménye a self szabályával. A lebegőpontos lower (upper) végpontot
+        kifelé kerekíti, ha round_lower (round_upper) igaz, vagyis ha a kerekített érték a pontostól eltérhet.
+        """
+        return type(self).from_endpoint_values_and_flags(_round_down(lower, round_lower), _round_up(upper, round_upper),
+                                                         lower_flag, upper_flag, self._comparison)
+
+    def __add__(self, value: int | float | Interval) -> Interval:
+        """Ha value szám, akkor olyan új Interval példánnyal tér vissza, amely a végein ugyanúgy zárt/nyitott, mint self,
+        de két végpontja a self végpontjaihoz képest value értékkel növeltek. Más szóval, az új intervallum
         a self-hez képest value értékkel el van tolva.
+        Ha value Interval, akkor az intervallumaritmetika szerinti összeggel, vagyis a két intervallum elemeiből
+        képzett összegek intervallumával tér vissza. Ha a lebegőpontos végpontok összege nem pontos, akkor azt kifelé
+        kerekíti, így a kerekítés miatt egyetlen összeg sem esik ki az eredményből.
+        Más típusú value esetén NotImplemented, így a művelet a másik operandus megfelelő metódusával végezhető el.
         """
-        return type(self)(self.lower_endpoint + value, self.upper_endpoint + value, self.type)
+        if isinstance(value, Interval):
+            bits = self._bits & value._bits
+            lower = self._lower_endpoint + value._lower_endpoint
+            upper = self._upper_endpoint + value._upper_endpoint
+            return self._from_bounds(lower, bits >> 1, upper, bits & 1,
+                                     not _sum_error(self._lower_endpoint, value._lower_endpoint, lower) >= 0,
+                                     not _sum_error(self._upper_endpoint, value._upper_endpoint, upper) <= 0)
+        if not isinstance(value, Number):
+            return NotImplemented
+        return type(self)(self.lower_endpoint + value, self.upper_endpoint + value, self.type, self._comparison)
 
     def __radd__(self, value: int | float) -> Interval:
+        if not isinstance(value, Number):
+            return NotImplemented
         return self + value
 
-    def __mul__(self, value: int | float) -> Interval:
-        """Olyan új Interval példánnyal tér vissza, amely a végein ugyanúgy zárt/nyitott, mint self és középpontja
-        megegyezik a self középpontjával, de szélessége value-szerese a self szélességének, ahol value > 0 valós szám.
+    def __neg__(self) -> Interval:
+        """Az elemek ellentettjeinek intervalluma."""
+        return type(self).from_endpoint_values_and_flags(-self._upper_endpoint, -self._lower_endpoint,
+                                                         self._bits & 1, self._bits >> 1, self._comparison)
+
+    def __sub__(self, value: int | float | Interval) -> Interval:
+        """Szám esetén a -value értékkel való eltolás, Interval esetén az intervallumaritmetika szerinti különbség."""
+        if not isinstance(value, (Interval, Number)):
+            return NotImplemented
+        return self + -value
+
+    def __rsub__(self, value: int | float) -> Interval:
+        if not isinstance(value, Number):
+            return NotImplemented
+        return -self + value
+
+    def _product(self, other: Interval, divide: bool = False) -> Interval:
+        """A két intervallum elemeiből képzett szorzatok (ha divide igaz, akkor hányadosok) intervalluma.
+        A szélsőértékek a végpontokból képzett négy érték közül kerülnek ki, a nullát pedig akkor is felveszi, ha a
+        self eleme. Szorzásnál az other-re is igaz ez utóbbi.
         """
+        lower_flag, upper_flag = self._bits >> 1, self._bits & 1
+        other_lower_flag, other_upper_flag = other._bits >> 1, other._bits & 1
+        candidates = []
+        for value1, flag1 in ((self._lower_endpoint, lower_flag), (self._upper_endpoint, upper_flag)):
+            for value2, flag2 in ((other._lower_endpoint, other_lower_flag), (other._upper_endpoint, other_upper_flag)):
+                result = value1 / value2 if divide else value1 * value2
+                if not isinstance(result, float):
+                    error = 0
+                elif _underflow(value1, value2, result):
+                    error = nan
+                elif divide:
+                    residual = _quotient_residual(value1, value2, result)
+                    error = residual if value2 > 0 else -residual
+                else:
+                    error = _product_error(value1, value2, result)
+                candidates.append((result, flag1 & flag2, error))
+        zero_attained = 0 in self or (not divide and 0 in other)
+        return self._from_bounds(*_extremes(candidates, zero_attained))
+
+    def __mul__(self, value: int | float | Interval) -> Interval:
+        """Ha value szám, akkor olyan új Interval példánnyal tér vissza, amely a végein ugyanúgy zárt/nyitott, mint self
+        és középpontja megegyezik a self középpontjával, de szélessége value-szerese a self szélességének, ahol
+        value > 0 valós szám.
+        Ha value Interval, akkor az intervallumaritmetika szerinti szorzattal tér vissza (szükség esetén kifelé
+        kerekítve). Egy intervallum és egy c szám ilyen szorzata az Interval(c, c) intervallummal való szorzással kapható.
+        """
+        if isinstance(value, Interval):
+            return self._product(value)
+        if not isinstance(value, Number):
+            return NotImplemented
         if value <= 0:
             raise ValueError('Az argumentum pozítv valós szám kell, hogy legyen.')
         return type(self)(self.midpoint() - (self.midpoint() - self.lower_endpoint) * value,
-                          self.midpoint() + (self.upper_endpoint - self.midpoint()) * value, self.type)
+                          self.midpoint() + (self.upper_endpoint - self.midpoint()) * value, self.type, self._comparison)
 
     def __rmul__(self, value: int | float) -> Interval:
+        if not isinstance(value, Number):
+            return NotImplemented
         return self * value
 
+    def _as_interval(self, value: int | float | Interval) -> Interval:
+        if isinstance(value, Interval):
+            return value
+        return type(self)(value, value, IntervalType.CLOSED, self._comparison)
+
+    def __truediv__(self, value: int | float | Interval) -> Interval:
+        """Az intervallumaritmetika szerinti hányadossal tér vissza (szükség esetén kifelé kerekítve). A szám osztó
+        egyelemű intervallumnak számít. Ha az osztó intervallum a nullát tartalmazza, vagy nyitott végpontja a nulla,
+        akkor a hányados nem korlátos, ezért ZeroDivisionError kivételt vált ki.
+        """
+        if not isinstance(value, (Interval, Number)):
+            return NotImplemented
+        value = self._as_interval(value)
+        if value._lower_endpoint <= 0 <= value._upper_endpoint:
+            raise ZeroDivisionError('The divisor interval should not contain or border zero.')
+        return self._product(value, divide=True)
+
+    def __rtruediv__(self, value: int | float) -> Interval:
+        if not isinstance(value, Number):
+            return NotImplemented
+        return self._as_interval(value) / self
+
+    def __pow__(self, exponent: int | float) -> Interval:
+        """Az elemek exponent-edik hatványainak intervalluma (szükség esetén kifelé kerekítve). Egész kitevő esetén
+        bármely intervallum hatványozható (negatív kitevőnél a nullát nem tartalmazó), nem egész kitevő esetén csak
+        nemnegatív (negatív kitevőnél pozitív) elemű intervallum, különben ValueError kivételt vált ki.
+        """
+        lower, upper = self._lower_endpoint, self._upper_endpoint
+        lower_flag, upper_flag = self._bits >> 1, self._bits & 1
+        if isinstance(exponent, int):
+            if exponent == 0:
+                return self._as_interval(1)
+            if exponent < 0:
+                return 1 / self ** -exponent
+            lower_power, upper_power = lower ** exponent, upper ** exponent
+            lower_inexact = isinstance(lower_power, float) and not _power_exact(lower, exponent)
+            upper_inexact = isinstance(upper_power, float) and not _power_exact(upper, exponent)
+            if exponent % 2 == 0 and upper <= 0:
+                # Páros kitevő esetén a hatványfüggvény a nempozitív számokon monoton csökkenő.
+                return self._from_bounds(upper_power, upper_flag, lower_power, lower_flag, upper_inexact, lower_inexact)
+            if exponent % 2 == 0 and lower < 0:
+                # A nulla belső pont, a legnagyobb értéket a nagyobb abszolút értékű végpont adja.
+                _, _, maximum, maximum_flag, _, round_maximum = _extremes(
+                    [(lower_power, lower_flag, nan if lower_inexact else 0),
+                     (upper_power, upper_flag, nan if upper_inexact else 0)], False)
+                return self._from_bounds(0, 1, maximum, maximum_flag, False, round_maximum)
+            return self._from_bounds(lower_power, lower_flag, upper_power, upper_flag, lower_inexact, upper_inexact)
+        if lower < 0 or exponent < 0 and lower == 0:
+            raise ValueError('The interval should be non-negative (positive for a negative exponent).')
+        # Nem egész kitevő esetén csak a 0 és az 1 hatványai biztosan pontosak.
+        lower_inexact, upper_inexact = lower not in (0, 1), upper not in (0, 1)
+        if exponent < 0:
+            return self._from_bounds(upper ** exponent, upper_flag, lower ** exponent, lower_flag, upper_inexact, lower_inexact)
+        return self._from_bounds(lower ** exponent, lower_flag, upper ** exponent, upper_flag, lower_inexact, upper_inexact)
+
     def adj_iv_common_endpoint(self, other: Interval) -> tuple:
         """Ha két intervallum szomszédos, akkor egy tuple-ban visszaadja a közös végpont értékét, valamint
         e point zártságát jelző flag értékeket az alsó végpontok szerint sorbarendezett intervallumok sorrendjében.
@@ -263,7 +715,7 @@ class Interval:
         """
         if self.is_adjacent_to(other):
             _iv1, _iv2 = self.sort(other)
-            return _iv1.upper_endpoint, _iv1.endpoints.upper.flag, _iv2.endpoints.lower.flag
+            return _iv1.upper_endpoint, _iv1.flags[1], _iv2.flags[0]
         return ()
 
     def union(self, other: Interval) -> Interval | None:
@@ -281,8 +733,24 @@ class Interval:
     def overlaps(self, other: Interval) -> bool:
         """Igaz értéket ad vissza, ha a self és other átlapolódó intervallumok.
         Két intervallum átlapolódik, ha legalább egy közös értékük van.
+        Az eredmény megegyezik a bool(self & other) értékével, de a metszetintervallum létrehozása nélkül számítódik ki.
         """
-        return bool(self & other)
+        # A metszet alsó végpontja a nagyobbik alsó, felső végpontja a kisebbik felső végpont.
+        if self._eq(self._lower_endpoint, other._lower_endpoint):
+            lower, lower_flag = max(self._lower_endpoint, other._lower_endpoint), self._bits & other._bits & 2
+        elif self._lower_endpoint > other._lower_endpoint:
+            lower, lower_flag = self._lower_endpoint, self._bits & 2
+        else:
+            lower, lower_flag = other._lower_endpoint, other._bits & 2
+        if self._eq(self._upper_endpoint, other._upper_endpoint):
+            upper, upper_flag = min(self._upper_endpoint, other._upper_endpoint), self._bits & other._bits & 1
+        elif self._upper_endpoint < other._upper_endpoint:
+            upper, upper_flag = self._upper_endpoint, self._bits & 1
+        else:
+            upper, upper_flag = other._upper_endpoint, other._bits & 1
+        if self._eq(lower, upper):
+            return bool(lower_flag and upper_flag)
+        return lower < upper
 
     def is_subinterval(self, other: Interval) -> bool:
         """A self akkor részintervalluma az other intervallumnak, ha minden értéke other-nek is értéke.
@@ -302,9 +770,16 @@ class Interval:
         végpotok által alkotott intervallum hosszával.
         Ha ez teljesül, akkor True értékkel tér vissza függetlenül attól, hogy az egyenlő értékű végpontok
         zártsága milyen (mindkét végpont zárt, csak valamelyik, vagy egyik sem).
+        Ha other nem Interval, akkor TypeError kivételt vált ki.
         """
-        _iv1, _iv2 = self.sort(other)
-        return self._eq(_iv1.length() + _iv2.length(), Interval(_iv1.lower_endpoint, _iv2.upper_endpoint).length())
+        if not isinstance(other, Interval):
+            raise TypeError('The argument should be an Interval instance.')
+        _iv1, _iv2 = (self, other) if self._lower_endpoint <= other._lower_endpoint else (other, self)
+        if self._comparison.exact:
+            # Pontos összehasonlításnál a hosszak összegének egyezése a közös végpont egyezésével egyenértékű.
+            return _iv1._upper_endpoint == _iv2._lower_endpoint
+        return self._eq((_iv1._upper_endpoint - _iv1._lower_endpoint) + (_iv2._upper_endpoint - _iv2._lower_endpoint),
+                        _iv2._upper_endpoint - _iv1._lower_endpoint)
 
     def is_closed(self) -> bool:
         """Igaz értékkel tér vissza, ha az intervallum mindkét végpontján zárt."""
@@ -327,4 +802,237 @@ class Interval:
         return self.type in (IntervalType.RIGHT_OPEN, IntervalType.LEFT_OPEN)
 
 
-    
+def _bin_indices(values, edges, edge_bins, comparison: ComparisonPolicy):
+    """A Partition.bin_indices() megvalósítása a partíció végpontjainak és a végpontokat tartalmazó intervallumok
+    indexeinek tömbjeiből, így ezekből (például más folyamatban) a partíció nélkül is azonos eredmény számítható.
+    """
+    import numpy as np
+    n = len(edges) - 1
+    values = np.asarray(values, dtype=float)
+    indices = np.searchsorted(edges, values, side='right') - 1
+    lower_edge, upper_edge = np.clip(indices, 0, n), np.clip(indices + 1, 0, n)
+    # A két végpont közé szigorúan eső értékek intervalluma a keresés eredménye, akkor is, ha az érték tűréssel
+    # egyezik valamelyik végponttal. A többi, a végpontokkal (tűréssel) egyező érték intervallumát a végpont
+    # zártsága határozza meg.
+    interior = (0 <= indices) & (indices < n) & (edges[lower_edge] < values) & (values < edges[upper_edge])
+    eq_array = comparison.eq_array
+    on_lower_edge = ~interior & eq_array(values, edges[lower_edge])
+    on_upper_edge = ~interior & eq_array(values, edges[upper_edge])
+    indices = np.where(interior, indices, -1)
+    indices = np.where(on_lower_edge, edge_bins[lower_edge], indices)
+    return np.where(on_upper_edge, edge_bins[upper_edge], indices)
+
+
+class Partition(Sequence):
+    """Egymáshoz csatlakozó, egymással át nem lapolódó intervallumok alsó végpontjuk szerint rendezett sorozata.
+    Ilyen például az Interval.split() által kiadott részintervallumok sorozata, vagy osztályközös gyakorisági sorok osztályközei.
+    Az intervallumokat nem tároljuk, hanem a végpontokból és a flagekből csak akkor hozzuk létre, amikor hozzájuk férnek.
+    Egyenlő hosszúságú intervallumok esetén a végpontokat sem tároljuk, hanem az alsó végpontból és a szélességből számítjuk ki.
+    Így az elemszám és az index szerinti hozzáférés (szeletekre is) O(1) idejű, egy értéket tartalmazó intervallum
+    indexe egyenlő hosszúságú intervallumoknál O(1), egyébként O(log n) időben, értékek tömbjére pedig vektorizáltan
+    határozható meg. A példányok nem módosíthatók, ezért több felhasználó között is megoszthatók.
+    """
+    __slots__ = ('_start', '_width', '_edges', '_lower_flags', '_upper_flags', '_total', '_offset', '_count', '_arrays',
+                 '_comparison')
+
+    def __init__(self, intervals: Iterable[Interval]):
+        """A partíciót az intervals által alsó végpontjuk szerint növekvő sorrendben kiadott intervallumok alkotják.
+        Két szomszédos intervallum közös végpontját legfeljebb az egyik tartalmazhatja.
+        Az intervallumok egyenlőségvizsgálati szabályának meg kell egyeznie, ez lesz a partíció szabálya.
+        """
+        intervals = tuple(intervals)
+        if not intervals:
+            raise ValueError('A partition should contain at least one interval.')
+        self._comparison = _common_comparison(intervals)
+        for iv1, iv2 in pairwise(intervals):
+            if not self._comparison.eq(iv1.upper_endpoint, iv2.lower_endpoint) or iv1.flags[1] & iv2.flags[0]:
+                raise ValueError('The intervals should be contiguous and non-overlapping.')
+        self._start = self._width = None
+        self._edges = tuple(iv.lower_endpoint for iv in intervals) + (intervals[-1].upper_endpoint,)
+        self._lower_flags = tuple(iv.flags[0] for iv in intervals)
+        self._upper_flags = tuple(iv.flags[1] for iv in intervals)
+        self._total = self._count = len(intervals)
+        self._offset = 0
+        self._arrays = None
+
+    @classmethod
+    def uniform(cls, interval: Interval, n: int) -> Partition:
+        """Az interval intervallum n egyenlő hosszúságú részintervallumra való felosztását adja vissza az
+        Interval.split() metódus leírásában szereplő szabályok szerint. A részintervallumok csak a hozzáféréskor jönnek létre.
+        """
+        if n < 1:
+            raise ValueError('The number of subintervals should be at least 1.')
+        partition = cls.__new__(cls)
+        partition._start, partition._width = interval.lower_endpoint, interval.length() / n
+        partition._edges = None
+        # Egyenlő hosszúságú felosztásnál a flagek helyén a felosztott intervallum flagjei állnak.
+        partition._lower_flags, partition._upper_flags = interval.flags
+        partition._total = partition._count = n
+        partition._offset = 0
+        partition._arrays = None
+        partition._comparison = interval.comparison
+        return partition
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[int | float], type: IntervalType = IntervalType.RIGHT_OPEN,
+                   comparison: ComparisonPolicy | None = None) -> Partition:
+        """Az edges által növekvő sorrendben kiadott végpontok közötti intervallumokból álló partíciót adja vissza.
+        A végpontok zártságát a type határozza meg az Interval.split() szabályai szerint: minden intervallum alsó végpontja
+        a type-nak megfelelő, a csatlakozó végpontok zártsága ellentétes, az utolsó intervallum felső végpontja
+        pedig ismét a type-nak megfelelő.
+        """
+        edges = tuple(edges)
+        if len(edges) < 2 or any(a > b for a, b in pairwise(edges)):
+            raise ValueError('The edges should be at least two values in increasing order.')
+        lower_flag, upper_flag = type.value
+        n = len(edges) - 1
+        return cls(Interval.from_endpoint_values_and_flags(a, b, lower_flag, upper_flag if i == n - 1 else lower_flag ^ 1, comparison)
+                   for i, (a, b) in enumerate(pairwise(edges)))
+
+    def _view(self, offset: int, count: int) -> Partition:
+        """Ugyanazon végpontokat használó, a self offset indexű elemétől kezdődő count elemű részpartíciót adja vissza."""
+        partition = type(self).__new__(type(self))
+        for name in self.__slots__:
+            setattr(partition, name, getattr(self, name))
+        partition._offset, partition._count, partition._arrays = self._offset + offset, count, None
+        return partition
+
+    def _edge(self, k: int) -> int | float:
+        """A teljes felosztás k-adik végpontja."""
+        if self._edges is not None:
+            return self._edges[k]
+        if k == self._total:
+            # Az utolsó végpont az Interval.split() korábbi számításával azonos módon adódik.
+            return self._start + self._width * (k - 1) + self._width
+        return self._start + self._width * k
+
+    def _flags(self, k: int) -> tuple:
+        """A teljes felosztás k-adik intervallumának alsó és felső flagje."""
+        if self._edges is not None:
+            return self._lower_flags[k], self._upper_flags[k]
+        return self._lower_flags, self._upper_flags if k == self._total - 1 else self._lower_flags ^ 1
+
+    def _interval(self, k: int) -> Interval:
+        return Interval.from_endpoint_values_and_flags(self._edge(k), self._edge(k + 1), *self._flags(k), self._comparison)
+
+    def __repr__(self):
+        return '{}([{}])'.format(type(self).__name__, ', '.join(map(repr, self)))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Interval]:
+        return map(self._interval, range(self._offset, self._offset + self._count))
+
+    def __getitem__(self, index: int | slice) -> Interval | Partition | tuple[Interval, ...]:
+        """Egész szám index esetén a megfelelő intervallummal tér vissza. Egyes lépésközű szelet esetén a kiválasztott
+        intervallumokból álló, a végpontokat a self-fel megosztó partícióval, egyéb szelet esetén pedig a kiválasztott
+        intervallumok tuple-jével, mert ezek nem csatlakoznak egymáshoz.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._count)
+            if step != 1:
+                return tuple(self[i] for i in range(start, stop, step))
+            return self._view(start, max(stop - start, 0))
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('Partition index out of range.')
+        return self._interval(self._offset + index)
+
+    @property
+    def comparison(self) -> ComparisonPolicy:
+        """A végpontokkal való egyezés vizsgálatához használt szabály."""
+        return self._comparison
+
+    @property
+    def edges(self) -> tuple:
+        """Az intervallumok végpontjai növekvő sorrendben. Ennek elemszáma eggyel több, mint az intervallumoké."""
+        return tuple(map(self._edge, range(self._offset, self._offset + self._count + 1)))
+
+    def bin_index(self, value: int | float) -> int:
+        """A value értéket tartalmazó intervallum indexével tér vissza, vagy -1 értékkel, ha egyik intervallum sem tartalmazza.
+        A keresés egyenlő hosszúságú intervallumoknál számítással, egyébként bináris kereséssel történik. A besorolás
+        szabálya a bin_indices() metódusével azonos: a két végpont közé szigorúan eső érték a közöttük lévő
+        intervallumba tartozik, a végponttal (tűréssel) egyező többi értéket pedig a végpont zártsága sorolja be.
+        """
+        first, last = self._offset, self._offset + self._count
+        if value != value:
+            return -1
+        # k a value értéknél nem nagyobb végpontok közül az utolsó indexe (first - 1, ha ilyen nincs).
+        if self._edges is not None:
+            k = bisect_right(self._edges, value, first, last + 1) - 1
+        elif self._width and isfinite(value):
+            k = min(max(floor((value - self._start) / self._width), first - 1), last)
+        else:
+            k = first - 1 if value < self._start else last
+        # A számított index a kerekítés miatt eggyel eltérhet a végpontok alapján adódótól.
+        while k >= first and value < self._edge(k):
+            k -= 1
+        while k < last and value >= self._edge(k + 1):
+            k += 1
+        if first <= k < last and self._edge(k) < value < self._edge(k + 1):
+            return k - first
+        lower_edge, upper_edge = min(max(k, first), last), min(max(k + 1, first), last)
+        if self._comparison.eq(value, self._edge(upper_edge)):
+            return self._edge_bin(upper_edge)
+        if self._comparison.eq(value, self._edge(lower_edge)):
+            return self._edge_bin(lower_edge)
+        return -1
+
+    def _edge_bin(self, k: int) -> int:
+        """A teljes felosztás k-adik végpontját tartalmazó intervallum indexe a partíción belül, vagy -1."""
+        first, last = self._offset, self._offset + self._count
+        if k < last and self._flags(k)[0]:
+            return k - first
+        if k > first and self._flags(k - 1)[1]:
+            return k - 1 - first
+        return -1
+
+    def _edge_arrays(self) -> tuple:
+        """A végpontok, valamint a végpontokkal egyenlő értékeket tartalmazó intervallumok indexeinek tömbjei.
+        Ha egy végpontot egyik intervallum sem tartalmaz, akkor az index -1. A tömbök az első használatkor
+        jönnek létre, és nem módosíthatók.
+        """
+        if self._arrays is None:
+            import numpy as np
+            indices = np.arange(self._offset, self._offset + self._count + 1)
+            if self._edges is not None:
+                edges = np.array(self._edges[self._offset:self._offset + self._count + 1], dtype=float)
+                lower_flags = np.array(self._lower_flags[self._offset:self._offset + self._count], dtype=bool)
+                upper_flags = np.array(self._upper_flags[self._offset:self._offset + self._count], dtype=bool)
+            else:
+                edges = self._start + self._width * indices.astype(float)
+                lower_flags = np.full(self._count, bool(self._lower_flags))
+                upper_flags = np.full(self._count, not self._lower_flags)
+                if self._count and indices[-1] == self._total:
+                    edges[-1] = self._edge(self._total)
+                    upper_flags[-1] = bool(self._upper_flags)
+            positions = np.arange(self._count + 1)
+            closed_above = np.append(lower_flags, False)
+            closed_below = np.insert(upper_flags, 0, False)
+            edge_bins = np.where(closed_above, positions, np.where(closed_below, positions - 1, -1))
+            edges.flags.writeable = edge_bins.flags.writeable = False
+            self._arrays = edges, edge_bins
+        return self._arrays
+
+    def bin_indices(self, values):
+        """Egy NumPy tömbbel tér vissza, amelynek elemei a values tömb azonos indexű elemeit tartalmazó intervallumok
+        indexei. Ha egy értéket egyik intervallum sem tartalmaz, akkor az index -1. A végpontokkal való egyezés
+        vizsgálata az Interval osztályéval azonos tűréssel történik.
+        """
+        return _bin_indices(values, *self._edge_arrays(), self._comparison)
+
+    def histogram(self, values):
+        """Egy NumPy tömbbel tér vissza, amelynek elemei megadják, hogy a values értékei közül hány esik
+        az egyes intervallumokba. Az intervallumokon kívül eső értékeket nem számolja.
+        """
+        import numpy as np
+        indices = self.bin_indices(values)
+        return np.bincount(indices[indices >= 0], minlength=len(self))
+
+
+# A műveletek mérése csak a környezeti változó megadása esetén kapcsol be, egyébként az interval_profiling modul be sem töltődik.
+if os.environ.get('REAL_INTERVAL_PROFILE'):
+    import interval_profiling
+    interval_profiling.enable_from_environment()
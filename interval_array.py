@@ -0,0 +1,452 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, Callable
+import warnings
+import numpy as np
+from interval import (Interval, IntervalType, ComparisonPolicy, _check_comparison, _common_comparison, _sum_error,
+                      _product_error, _quotient_residual, _power_exact, _underflow)
+
+
+# Egy float64 végpontú intervallum felezése legfeljebb körülbelül 2100 lépés után eléri a lebegőpontos pontosság határát
+# (a legnagyobb, 2 ** 1024 nagyságrendű szélességtől a legkisebb, 2 ** -1074 nagyságrendű távolságig), így ennyi lépés
+# alapértelmezés szerint minden intervallum felezését befejezi.
+_MAX_BISECTIONS = 2200
+
+
+def _pack_flags(lower_flags, upper_flags):
+    """A végpontok flagjeit egyetlen bájtba sűríti: az 1-es helyiértékű bit a felső, a 2-es az alsó végpont zártságát jelzi.
+    Így a kapott érték az IntervalType konstansok értékét kettes számrendszerbeli számként olvasva adódik.
+    """
+    return (np.asarray(lower_flags, dtype=np.uint8) << 1) | np.asarray(upper_flags, dtype=np.uint8)
+
+
+def _contains_zero(lower, upper, lower_flags, upper_flags):
+    """Ott igaz, ahol a nulla az intervallum eleme."""
+    return (lower < 0) & (upper > 0) | (lower == 0) & (lower_flags == 1) | (upper == 0) & (upper_flags == 1)
+
+
+class IntervalArray:
+    """Intervallumok tömbjét modellezi oszlopos tárolással. Az alsó és felső végpontok értékei egy-egy float64 típusú,
+    a végpontok flagjei pedig egy uint8 típusú NumPy tömbben vannak. Ezen kívül egy logikai maszk jelzi a hiányzó elemeket,
+    amelyek azoknál a műveleteknél keletkeznek, ahol az Interval megfelelő metódusa None értéket adna vissza.
+    A műveletek elemenként, vektorizáltan, az Interval metódusaival azonos szabályok szerint hajtódnak végre.
+    A másik operandus lehet azonos elemszámú IntervalArray, vagy egyetlen Interval, amely minden elemmel párosul.
+    Az elemek egyenlőségvizsgálati szabálya közös, ennek a másik operanduséval meg kell egyeznie, egyébként ValueError
+    kivétel keletkezik. A műveletek eredményei és a kiolvasott Interval példányok ezt a szabályt öröklik.
+    """
+
+    def __init__(self, lower_endpoint_values, upper_endpoint_values, flags=IntervalType.CLOSED, mask=None,
+                 comparison: ComparisonPolicy | None = None):
+        """A flags az egyes intervallumok flagjeit tartalmazó tömb a _pack_flags által leírt formában, vagy egy
+        IntervalType konstans, ha minden intervallum azonos típusú. A mask azon elemek helyén igaz, amelyek hiányoznak.
+        A comparison az egyenlőségvizsgálat szabálya. Ha nincs megadva, akkor az Interval osztály default_comparison attribútuma.
+        """
+        self._lower = np.asarray(lower_endpoint_values, dtype=float)
+        self._upper = np.asarray(upper_endpoint_values, dtype=float)
+        if isinstance(flags, IntervalType):
+            flags = _pack_flags(*flags.value)
+        self._flags = np.broadcast_to(np.asarray(flags, dtype=np.uint8), self._lower.shape)
+        self._mask = np.zeros(self._lower.shape, dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+        self._comparison: ComparisonPolicy = Interval.default_comparison if comparison is None else comparison
+        if not (self._lower.ndim == 1 and self._lower.shape == self._upper.shape == self._mask.shape):
+            raise ValueError('The endpoint, flag and mask arrays should be one-dimensional and of equal length.')
+        if np.any(self._lower[~self._mask] > self._upper[~self._mask]):
+            raise ValueError('Upper endpoint should be greater than lower endpoint.')
+
+    @classmethod
+    def _from_columns(cls, lower, upper, flags, mask, comparison: ComparisonPolicy | None = None) -> IntervalArray:
+        """Új példányt hoz létre a már megfelelő típusú és alakú tömbökből, másolás és ellenőrzés nélkül."""
+        array = cls.__new__(cls)
+        array._lower, array._upper, array._flags, array._mask = lower, upper, flags, mask
+        array._comparison = Interval.default_comparison if comparison is None else comparison
+        return array
+
+    @classmethod
+    def from_endpoint_values_and_flags(cls, lower_endpoint_values, upper_endpoint_values,
+                                       lower_endpoint_flags, upper_endpoint_flags, mask=None,
+                                       comparison: ComparisonPolicy | None = None) -> IntervalArray:
+        """Új példányt hoz létre a végpontok, valamint a végpontok nyitottságát vagy zártságát jelző 0 vagy 1 értékek tömbjei alapján."""
+        return cls(lower_endpoint_values, upper_endpoint_values, _pack_flags(lower_endpoint_flags, upper_endpoint_flags), mask,
+                   comparison)
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[Interval | None]) -> IntervalArray:
+        """Új példányt hoz létre az intervals által kiadott Interval példányokból. A None elemek hiányzó elemek lesznek.
+        Az egyenlőségvizsgálat szabálya az intervallumoké, amelyeknek meg kell egyeznie.
+        """
+        intervals = list(intervals)
+        comparison = _common_comparison(iv for iv in intervals if iv is not None)
+        rows = [(*iv, False) if iv is not None else (0.0, 0.0, 1, 1, True) for iv in intervals]
+        columns = tuple(zip(*rows)) or ((),) * 5
+        return cls.from_endpoint_values_and_flags(*columns, comparison)
+
+    def to_list(self) -> list[Interval | None]:
+        """Az elemeket Interval példányok listájaként adja vissza, amelyben a hiányzó elemek helyén None áll."""
+        comparison = self._comparison
+        return [Interval.from_endpoint_values_and_flags(lower, upper, flags >> 1, flags & 1, comparison) if not masked else None
+                for lower, upper, flags, masked in zip(self._lower.tolist(), self._upper.tolist(),
+                                                       self._flags.tolist(), self._mask.tolist())]
+
+    @property
+    def comparison(self) -> ComparisonPolicy:
+        """Az elemek egyenlőségvizsgálatához használt szabály."""
+        return self._comparison
+
+    @property
+    def lower_endpoints(self):
+        return self._lower
+
+    @property
+    def upper_endpoints(self):
+        return self._upper
+
+    @property
+    def flags(self):
+        """Az intervallumok végpontjainak flagjei a _pack_flags által leírt formában."""
+        return self._flags
+
+    @property
+    def lower_flags(self):
+        return self._flags >> 1
+
+    @property
+    def upper_flags(self):
+        return self._flags & 1
+
+    @property
+    def mask(self):
+        """Logikai tömb, amely a hiányzó elemek helyén igaz."""
+        return self._mask
+
+    def __len__(self) -> int:
+        return len(self._lower)
+
+    def __iter__(self) -> Iterator[Interval | None]:
+        return iter(self.to_list())
+
+    def __getitem__(self, index) -> Interval | None | IntervalArray:
+        """Egész szám index esetén a megfelelő Interval példánnyal vagy hiányzó elem esetén None értékkel, szelet
+        vagy indextömb esetén a kiválasztott elemekből álló IntervalArray példánnyal tér vissza.
+        """
+        if isinstance(index, (int, np.integer)):
+            if self._mask[index]:
+                return None
+            flags = int(self._flags[index])
+            return Interval.from_endpoint_values_and_flags(float(self._lower[index]), float(self._upper[index]),
+                                                           flags >> 1, flags & 1, self._comparison)
+        return type(self)(self._lower[index], self._upper[index], self._flags[index], self._mask[index], self._comparison)
+
+    def __repr__(self):
+        return '{}([{}])'.format(type(self).__name__, ', '.join(map(repr, self)))
+
+    def _operands(self, other: IntervalArray | Interval) -> tuple:
+        """A másik operandus végpontjait, flagjeit és maszkját adja vissza a vektorizált műveletekhez."""
+        if isinstance(other, IntervalArray):
+            _check_comparison(self._comparison, other._comparison)
+            return other._lower, other._upper, other.lower_flags, other.upper_flags, other._mask
+        if isinstance(other, Interval):
+            _check_comparison(self._comparison, other.comparison)
+            return float(other.lower_endpoint), float(other.upper_endpoint), *other.flags, False
+        raise TypeError('The operand should be an IntervalArray or Interval instance.')
+
+    def _masked(self, values, mask=None):
+        return np.ma.array(values, mask=self._mask if mask is None else mask)
+
+    def length(self):
+        """Az intervallumok hosszainak maszkolt tömbje."""
+        return self._masked(self._upper - self._lower)
+
+    def midpoint(self):
+        """Az intervallumok középértékeinek maszkolt tömbje."""
+        return self._masked((self._lower + self._upper) / 2)
+
+    def select(self, sorted_values) -> tuple:
+        """Az Interval.select() vektorizált megfelelője: a növekvő sorrendbe rendezett sorted_values NumPy tömb egyes
+        intervallumokba eső elemeit kijelölő szeletek kezdő és záró indexeinek maszkolt tömbjeivel tér vissza.
+        A keresés az összes intervallumra egyszerre, a numpy.searchsorted() függvénnyel történik, a végponttal tűréssel
+        egyező szomszédos elemeket pedig lépésenként, az összes intervallumra egyszerre vonja be.
+        """
+        values = np.asarray(sorted_values, dtype=float)
+        lower_closed, upper_closed = self.lower_flags == 1, self.upper_flags == 1
+        starts = np.where(lower_closed, np.searchsorted(values, self._lower, 'left'),
+                          np.searchsorted(values, self._lower, 'right'))
+        stops = np.where(upper_closed, np.searchsorted(values, self._upper, 'right'),
+                         np.searchsorted(values, self._upper, 'left'))
+        if len(values):
+            eq_array = self._comparison.eq_array
+            while (step := lower_closed & (starts > 0) & eq_array(values[starts - 1], self._lower)).any():
+                starts -= step
+            last = len(values) - 1
+            while (step := upper_closed & (stops <= last) & eq_array(values[np.minimum(stops, last)], self._upper)).any():
+                stops += step
+        stops = np.maximum(starts, stops)
+        return self._masked(starts), self._masked(stops)
+
+    def count_in(self, sorted_values):
+        """Az egyes intervallumokba eső elemek számának maszkolt tömbje (lásd select())."""
+        starts, stops = self.select(sorted_values)
+        return stops - starts
+
+    def __and__(self, other: IntervalArray | Interval) -> IntervalArray:
+        """Az elemenkénti metszetek tömbjével tér vissza. Ahol a metszet üres, ott az eredmény hiányzó elem."""
+        lower2, upper2, lower_flags2, upper_flags2, mask2 = self._operands(other)
+        lower1, upper1, lower_flags1, upper_flags1 = self._lower, self._upper, self.lower_flags, self.upper_flags
+        # A metszet alsó végpontja a nagyobbik alsó, felső végpontja a kisebbik felső végpont. Egyenlő végpontoknál
+        # az eredmény csak akkor zárt, ha mindkét végpont zárt.
+        lower, upper = np.maximum(lower1, lower2), np.minimum(upper1, upper2)
+        eq_array = self._comparison.eq_array
+        lower_flags = np.where(eq_array(lower1, lower2), lower_flags1 & lower_flags2,
+                               np.where(lower1 > lower2, lower_flags1, lower_flags2))
+        upper_flags = np.where(eq_array(upper1, upper2), upper_flags1 & upper_flags2,
+                               np.where(upper1 < upper2, upper_flags1, upper_flags2))
+        degenerate = eq_array(lower, upper)
+        empty = np.where(degenerate, (lower_flags & upper_flags) == 0, lower > upper)
+        return self.from_endpoint_values_and_flags(lower, upper, lower_flags, upper_flags, self._mask | mask2 | empty,
+                                                   self._comparison)
+
+    def __or__(self, other: IntervalArray | Interval) -> IntervalArray:
+        """Az elemenkénti uniók tömbjével tér vissza. Ahol az unió nem egyetlen intervallum, ott az eredmény hiányzó elem."""
+        lower2, upper2, lower_flags2, upper_flags2, mask2 = self._operands(other)
+        lower1, upper1, lower_flags1, upper_flags1 = self._lower, self._upper, self.lower_flags, self.upper_flags
+        lower, upper = np.minimum(lower1, lower2), np.maximum(upper1, upper2)
+        eq_array = self._comparison.eq_array
+        lower_flags = np.where(eq_array(lower1, lower2), lower_flags1 | lower_flags2,
+                               np.where(lower1 < lower2, lower_flags1, lower_flags2))
+        upper_flags = np.where(eq_array(upper1, upper2), upper_flags1 | upper_flags2,
+                               np.where(upper1 > upper2, upper_flags1, upper_flags2))
+        # Az alsó végpontjuk szerint előbb álló intervallum felső végpontja nem lehet kisebb a másik alsó végpontjánál,
+        # egyenlőség esetén pedig a közös végpontot legalább az egyiknek tartalmaznia kell.
+        self_first = lower1 <= lower2
+        first_upper, first_upper_flags = np.where(self_first, upper1, upper2), np.where(self_first, upper_flags1, upper_flags2)
+        second_lower, second_lower_flags = np.where(self_first, lower2, lower1), np.where(self_first, lower_flags2, lower_flags1)
+        joinable = np.where(eq_array(first_upper, second_lower), (first_upper_flags | second_lower_flags) == 1,
+                            first_upper > second_lower)
+        return self.from_endpoint_values_and_flags(lower, upper, lower_flags, upper_flags, self._mask | mask2 | ~joinable,
+                                                   self._comparison)
+
+    def overlaps(self, other: IntervalArray | Interval):
+        """Maszkolt logikai tömbbel tér vissza, amely ott igaz, ahol a két intervallumnak van közös értéke."""
+        intersection = self & other
+        return self._masked(~intersection._mask, self._mask | self._operands(other)[4])
+
+    def is_subinterval(self, other: IntervalArray | Interval):
+        """Maszkolt logikai tömbbel tér vissza, amely ott igaz, ahol a self eleme az other megfelelő elemének részintervalluma."""
+        lower2, upper2, lower_flags2, upper_flags2, mask2 = self._operands(other)
+        eq_array = self._comparison.eq_array
+        cond1 = eq_array(self._lower, lower2) & (self.lower_flags == 1) & (lower_flags2 == 0)
+        cond2 = eq_array(self._upper, upper2) & (self.upper_flags == 1) & (upper_flags2 == 0)
+        cond3, cond4 = self._lower < lower2, self._upper > upper2
+        return self._masked(~(cond1 | cond2 | cond3 | cond4), self._mask | mask2)
+
+    def is_adjacent_to(self, other: IntervalArray | Interval):
+        """Maszkolt logikai tömbbel tér vissza, amely ott igaz, ahol a két intervallum az Interval.is_adjacent_to()
+        metódusa szerint szomszédos.
+        """
+        lower2, upper2, _, _, mask2 = self._operands(other)
+        self_first = self._lower <= lower2
+        if self._comparison.exact:
+            # Pontos összehasonlításnál a hosszak összegének egyezése a közös végpont egyezésével egyenértékű.
+            return self._masked(np.where(self_first, self._upper == lower2, upper2 == self._lower), self._mask | mask2)
+        hull_length = np.where(self_first, upper2, self._upper) - np.minimum(self._lower, lower2)
+        adjacent = self._comparison.eq_array((self._upper - self._lower) + (upper2 - lower2), hull_length)
+        return self._masked(adjacent, self._mask | mask2)
+
+    def _from_bounds(self, lower, upper, lower_flags, upper_flags, mask, round_lower=True, round_upper=True) -> IntervalArray:
+        """Az intervallumaritmetikai műveletek eredménye. Az alsó (felső) végpontokat ott kerekíti kifelé, ahol
+        round_lower (round_upper) igaz. A hiányzó elemek helyén álló értékeket nem ellenőrzi, mert azok a NumPy
+        műveletek nem értelmezett (például nullával osztásból eredő) eredményei lehetnek.
+        """
+        lower = np.where(round_lower, np.nextafter(lower, -np.inf), lower)
+        upper = np.where(round_upper, np.nextafter(upper, np.inf), upper)
+        return self._from_columns(lower, upper, _pack_flags(lower_flags, upper_flags), np.asarray(mask, dtype=bool),
+                                  self._comparison)
+
+    def _interval_operands(self, value) -> tuple:
+        """Mint _operands(), de a számokat és a számok tömbjeit egyelemű zárt intervallumokként kezeli."""
+        if isinstance(value, (IntervalArray, Interval)):
+            return self._operands(value)
+        value = np.asarray(value, dtype=float)
+        return value, value, 1, 1, False
+
+    def __add__(self, value) -> IntervalArray:
+        """Ha value szám vagy az elemszámmal egyező hosszú tömb, akkor az intervallumokat value értékkel eltolja.
+        Ha value IntervalArray vagy Interval, akkor az Interval.__add__() szerinti, kifelé kerekített összegek tömbjével tér vissza.
+        """
+        if isinstance(value, (IntervalArray, Interval)):
+            lower2, upper2, lower_flags2, upper_flags2, mask2 = self._operands(value)
+            lower, upper = self._lower + lower2, self._upper + upper2
+            with np.errstate(invalid='ignore'):
+                round_lower = ~(_sum_error(self._lower, lower2, lower) >= 0)
+                round_upper = ~(_sum_error(self._upper, upper2, upper) <= 0)
+            return self._from_bounds(lower, upper, self.lower_flags & lower_flags2, self.upper_flags & upper_flags2,
+                                     self._mask | mask2, round_lower, round_upper)
+        value = np.asarray(value, dtype=float)
+        return type(self)(self._lower + value, self._upper + value, self._flags, self._mask, self._comparison)
+
+    def __radd__(self, value) -> IntervalArray:
+        return self + value
+
+    def __neg__(self) -> IntervalArray:
+        return self._from_columns(-self._upper, -self._lower, _pack_flags(self.upper_flags, self.lower_flags), self._mask,
+                                  self._comparison)
+
+    def __sub__(self, value) -> IntervalArray:
+        """Az Interval.__sub__() vektorizált megfelelője."""
+        if isinstance(value, (IntervalArray, Interval)):
+            return self + -value
+        return self + -np.asarray(value, dtype=float)
+
+    def __rsub__(self, value) -> IntervalArray:
+        return -self + value
+
+    def _product(self, other, divide: bool = False) -> IntervalArray:
+        """Az Interval._product() vektorizált megfelelője: a szélsőértékek a végpontokból képzett négy érték közül
+        kerülnek ki. Ha divide igaz, akkor a hányadosok, egyébként a szorzatok tömbjével tér vissza.
+        """
+        lower2, upper2, lower_flags2, upper_flags2, mask2 = self._interval_operands(other)
+        lower1, upper1, lower_flags1, upper_flags1 = self._lower, self._upper, self.lower_flags, self.upper_flags
+        results, errors, attained = [], [], []
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for value1, flags1 in ((lower1, lower_flags1), (upper1, upper_flags1)):
+                for value2, flags2 in ((lower2, lower_flags2), (upper2, upper_flags2)):
+                    if divide:
+                        result = value1 / value2
+                        residual = _quotient_residual(value1, value2, result)
+                        error = np.where(value2 > 0, residual, -residual)
+                    else:
+                        result = value1 * value2
+                        error = _product_error(value1, value2, result)
+                    errors.append(np.where(_underflow(value1, value2, result), np.nan, error))
+                    results.append(result)
+                    attained.append(flags1 & flags2)
+            candidates, errors = np.stack(np.broadcast_arrays(*results)), np.stack(np.broadcast_arrays(*errors))
+            attained = np.stack(np.broadcast_arrays(*attained)) == 1
+            lower, upper = candidates.min(axis=0), candidates.max(axis=0)
+            at_lower, at_upper = candidates == lower, candidates == upper
+            round_lower = np.any(at_lower & ~(errors >= 0), axis=0)
+            round_upper = np.any(at_upper & ~(errors <= 0), axis=0)
+        zero = _contains_zero(lower1, upper1, lower_flags1, upper_flags1)
+        if not divide:
+            zero |= _contains_zero(lower2, upper2, lower_flags2, upper_flags2)
+        lower_flags = np.any(attained & at_lower, axis=0) | (lower == 0) & zero
+        upper_flags = np.any(attained & at_upper, axis=0) | (upper == 0) & zero
+        mask = self._mask | mask2
+        if divide:
+            mask = mask | (lower2 <= 0) & (upper2 >= 0)
+        return self._from_bounds(lower, upper, lower_flags, upper_flags, mask, round_lower, round_upper)
+
+    def __mul__(self, value) -> IntervalArray:
+        """Ha value pozitív szám vagy ilyenek tömbje, akkor az intervallumok szélességét középpontjuk megtartásával
+        value-szeresére változtatja. Ha value IntervalArray vagy Interval, akkor az Interval.__mul__() szerinti,
+        kifelé kerekített szorzatok tömbjével tér vissza.
+        """
+        if isinstance(value, (IntervalArray, Interval)):
+            return self._product(value)
+        value = np.asarray(value, dtype=float)
+        if np.any(value <= 0):
+            raise ValueError('Az argumentum pozítv valós szám kell, hogy legyen.')
+        midpoint = (self._lower + self._upper) / 2
+        return type(self)(midpoint - (midpoint - self._lower) * value, midpoint + (self._upper - midpoint) * value,
+                          self._flags, self._mask, self._comparison)
+
+    def __rmul__(self, value) -> IntervalArray:
+        return self * value
+
+    def __truediv__(self, value) -> IntervalArray:
+        """Az Interval.__truediv__() vektorizált megfelelője. Ahol az osztó a nullát tartalmazza, vagy nyitott végpontja
+        a nulla, ott kivétel helyett hiányzó elem az eredmény.
+        """
+        return self._product(value, divide=True)
+
+    def __rtruediv__(self, value) -> IntervalArray:
+        if isinstance(value, Interval):
+            lower, upper, lower_flag, upper_flag, _ = self._operands(value)
+            return type(self)(np.full(self._lower.shape, lower), np.full(self._lower.shape, upper),
+                              _pack_flags(lower_flag, upper_flag), self._mask, self._comparison) / self
+        value = np.broadcast_to(np.asarray(value, dtype=float), self._lower.shape)
+        return type(self)(value, value, IntervalType.CLOSED, self._mask, self._comparison) / self
+
+    def __pow__(self, exponent: int | float) -> IntervalArray:
+        """Az Interval.__pow__() vektorizált megfelelője. Nem egész kitevő esetén ahol az intervallum negatív elemet
+        tartalmaz (negatív kitevőnél ahol nem pozitív elemű), ott kivétel helyett hiányzó elem az eredmény.
+        """
+        lower, upper, lower_flags, upper_flags = self._lower, self._upper, self.lower_flags, self.upper_flags
+        if isinstance(exponent, int):
+            if exponent == 0:
+                ones = np.ones_like(lower)
+                return type(self)(ones, ones, IntervalType.CLOSED, self._mask, self._comparison)
+            if exponent < 0:
+                return 1 / self ** -exponent
+            with np.errstate(over='ignore', invalid='ignore'):
+                lower_power, upper_power = lower ** exponent, upper ** exponent
+                lower_inexact = np.logical_not(_power_exact(lower, exponent))
+                upper_inexact = np.logical_not(_power_exact(upper, exponent))
+            if exponent % 2:
+                return self._from_bounds(lower_power, upper_power, lower_flags, upper_flags, self._mask,
+                                         lower_inexact, upper_inexact)
+            # Páros kitevő esetén a nempozitív elemű intervallumokon csökkenő, a nemnegatív elemű intervallumokon
+            # növekvő a függvény, a nullát belső pontként tartalmazókon pedig a nulla a legkisebb érték.
+            nonpositive, nonnegative = upper <= 0, lower >= 0
+            maximum = np.maximum(lower_power, upper_power)
+            maximum_flags = lower_flags & (lower_power == maximum) | upper_flags & (upper_power == maximum)
+            maximum_inexact = lower_inexact & (lower_power == maximum) | upper_inexact & (upper_power == maximum)
+            result_lower = np.where(nonpositive, upper_power, np.where(nonnegative, lower_power, 0))
+            result_upper = np.where(nonpositive, lower_power, np.where(nonnegative, upper_power, maximum))
+            result_lower_flags = np.where(nonpositive, upper_flags, np.where(nonnegative, lower_flags, 1))
+            result_upper_flags = np.where(nonpositive, lower_flags, np.where(nonnegative, upper_flags, maximum_flags))
+            round_lower = np.where(nonpositive, upper_inexact, nonnegative & lower_inexact)
+            round_upper = np.where(nonpositive, lower_inexact, np.where(nonnegative, upper_inexact, maximum_inexact))
+            return self._from_bounds(result_lower, result_upper, result_lower_flags, result_upper_flags, self._mask,
+                                     round_lower, round_upper)
+        invalid = (lower < 0) | (exponent < 0) & (lower == 0)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            lower_power, upper_power = lower ** exponent, upper ** exponent
+        lower_inexact, upper_inexact = (lower != 0) & (lower != 1), (upper != 0) & (upper != 1)
+        if exponent < 0:
+            return self._from_bounds(upper_power, lower_power, upper_flags, lower_flags, self._mask | invalid,
+                                     upper_inexact, lower_inexact)
+        return self._from_bounds(lower_power, upper_power, lower_flags, upper_flags, self._mask | invalid,
+                                 lower_inexact, upper_inexact)
+
+    def bisect(self, predicate: Callable, tol: float = 0.0, max_iterations: int = _MAX_BISECTIONS) -> IntervalArray:
+        """Az Interval.bisect() vektorizált megfelelője, amely minden intervallumot egymástól függetlenül, de egyszerre szűkít.
+        A predicate a felezőpontok tömbjével hívva egy azonos hosszúságú logikai tömbbel tér vissza, amely ott igaz,
+        ahol a keresett érték az alsó félintervallumban van. Az eredmény intervallumainak típusa megegyezik a kiindulókéval.
+        Legfeljebb max_iterations lépést végez; ha ezután is van még szűkíthető intervallum, akkor RuntimeWarning
+        figyelmeztetést ad, és az addig elért intervallumokkal tér vissza.
+        """
+        # A nagyon széles intervallumok szélessége végtelenre csordulhat túl, ami az összehasonlításokat nem zavarja.
+        with np.errstate(over='ignore'):
+            lower, upper = self._lower.copy(), self._upper.copy()
+            active = ~self._mask & (upper - lower > tol)
+            for _ in range(max_iterations):
+                if not active.any():
+                    break
+                middle = (lower + upper) / 2
+                # Ahol a felezőpont már nem esik a végpontok közé, ott a lebegőpontos pontosság határát elértük.
+                active &= (lower < middle) & (middle < upper)
+                to_lower = np.asarray(predicate(middle), dtype=bool)
+                upper = np.where(active & to_lower, middle, upper)
+                lower = np.where(active & ~to_lower, middle, lower)
+                active &= upper - lower > tol
+            else:
+                middle = (lower + upper) / 2
+                unfinished = np.count_nonzero(active & (lower < middle) & (middle < upper))
+                if unfinished:
+                    warnings.warn(f'The bisection of {unfinished} intervals did not converge in {max_iterations} iterations.',
+                                  RuntimeWarning, stacklevel=2)
+        return type(self)(lower, upper, self._flags, self._mask, self._comparison)
+
+    def find_root(self, f: Callable, tol: float = 0.0, max_iterations: int = _MAX_BISECTIONS) -> IntervalArray:
+        """Az Interval.find_root() vektorizált megfelelője. Az f egy tömbre elemenként kiértékelt függvény, amelynek
+        előjele minden intervallum két végpontjában különböző, vagy valamelyikben nulla.
+        """
+        f_lower, f_upper = np.asarray(f(self._lower), dtype=float), np.asarray(f(self._upper), dtype=float)
+        if np.any(~self._mask & (f_lower != 0) & (f_upper != 0) & ((f_lower > 0) == (f_upper > 0))):
+            raise ValueError('The function should have opposite signs at the endpoints.')
+        lower_positive = np.where(f_lower != 0, f_lower > 0, ~(f_upper > 0))
+
+        def predicate(middle):
+            f_middle = np.asarray(f(middle), dtype=float)
+            return (f_middle == 0) | ((f_middle > 0) != lower_positive)
+
+        return self.bisect(predicate, tol, max_iterations)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+from typing import Any, Iterable, Iterator, Mapping
+from bisect import bisect_left, bisect_right
+from interval import Interval, ComparisonPolicy, _check_comparison
+from interval_set import _intersect, _complement, _row_contains, _sort_key
+
+
+class IntervalDict:
+    """Egymással át nem lapolódó intervallumokhoz értékeket rendelő leképezés. Egy számhoz az őt tartalmazó
+    intervallum értéke tartozik, amely bináris kereséssel, O(log n) időben adódik, így nincs szükség az intervallumok
+    hash értékére. A tagintervallumokat az IntervalSet osztályhoz hasonlóan a végpontok értékeit és flagjeit, valamint
+    a hozzájuk rendelt értékeket tartalmazó párhuzamos listákban, az alsó végpontjuk szerint rendezve tároljuk.
+    Egy intervallumhoz rendelt érték felülírja a vele átlapolódó tagintervallumok közös részének értékét, a többi
+    részük pedig megmarad. Az egyenlő értékű, egymáshoz csatlakozó tagintervallumok automatikusan összevonódnak.
+    Két tagintervallum akkor csatlakozik egymáshoz, ha közös végpontjukat pontosan az egyikük tartalmazza.
+    Az egyenlőségvizsgálat szabálya a tagintervallumoké. Nem üres leképezés esetén az intervallum argumentumok szabályának
+    ezzel meg kell egyeznie, egyébként ValueError kivétel keletkezik.
+    """
+
+    def __init__(self, items: Mapping[Interval, Any] | Iterable[tuple[Interval, Any]] = ()):
+        """Az items egy szótár, vagy (intervallum, érték) párokat kiadó iterálható objektum. Az értékek a megadás
+        sorrendjében rendelődnek az intervallumokhoz, így átlapolódás esetén a később megadott érték érvényes.
+        """
+        self._lowers, self._uppers, self._lower_flags, self._upper_flags, self._values = [], [], [], [], []
+        self._comparison = Interval.default_comparison
+        for interval, value in (items.items() if isinstance(items, Mapping) else items):
+            self[interval] = value
+
+    @classmethod
+    def _from_rows(cls, rows: list[tuple], comparison: ComparisonPolicy) -> IntervalDict:
+        """Új példányt hoz létre rendezett, át nem lapolódó (alsó végpont, felső végpont, alsó flag, felső flag, érték) ötösökből."""
+        interval_dict = cls.__new__(cls)
+        columns = tuple(map(list, zip(*rows))) or ([], [], [], [], [])
+        interval_dict._lowers, interval_dict._uppers, interval_dict._lower_flags, interval_dict._upper_flags, \
+            interval_dict._values = columns
+        interval_dict._comparison = comparison
+        return interval_dict
+
+    @property
+    def comparison(self) -> ComparisonPolicy:
+        """A tagintervallumok egyenlőségvizsgálatához használt szabály."""
+        return self._comparison
+
+    def _comparison_with(self, interval: Interval) -> ComparisonPolicy:
+        """Az interval argumentummal végzett művelet szabálya. Üres leképezés esetén ez az interval szabálya."""
+        if self._lowers:
+            _check_comparison(self._comparison, interval.comparison)
+            return self._comparison
+        return interval.comparison
+
+    def _row(self, index: int) -> tuple:
+        return self._lowers[index], self._uppers[index], self._lower_flags[index], self._upper_flags[index]
+
+    def _window(self, lower, upper) -> tuple[int, int]:
+        """Azon tagok indexeinek tartománya, amelyek a lower és upper végpontú intervallummal átlapolódhatnak vagy
+        csatlakozhatnak hozzá. A végpontok tűréssel való összehasonlítása miatt mindkét oldalon egy további tagot is tartalmaz.
+        """
+        start = max(bisect_left(self._uppers, lower) - 1, 0)
+        stop = min(bisect_right(self._lowers, upper) + 1, len(self._lowers))
+        return start, stop
+
+    def _replace(self, interval: Interval, value=None, assign: bool = True):
+        """Az interval által lefedett részt eltávolítja a tagintervallumokból, és ha assign igaz, akkor a helyére
+        az interval intervallumot value értékkel illeszti be. Csak az érintett tagokat dolgozza fel.
+        """
+        self._comparison = comparison = self._comparison_with(interval)
+        eq = comparison.eq
+        row = (interval.lower_endpoint, interval.upper_endpoint, *interval.flags)
+        start, stop = self._window(row[0], row[1])
+        outside = _complement([row], eq)
+        rows = [(*piece, self._values[i]) for i in range(start, stop) for piece in _intersect([self._row(i)], outside, eq)]
+        if assign:
+            rows.append((*row, value))
+        rows.sort(key=_sort_key)
+        merged = []
+        for row in rows:
+            if merged:
+                lower, upper, lower_flag, upper_flag, previous_value = merged[-1]
+                if previous_value == row[4] and eq(upper, row[0]) and upper_flag != row[2]:
+                    merged[-1] = (lower, row[1], lower_flag, row[3], previous_value)
+                    continue
+            merged.append(row)
+        columns = tuple(map(list, zip(*merged))) or ([], [], [], [], [])
+        for stored, column in zip((self._lowers, self._uppers, self._lower_flags, self._upper_flags, self._values), columns):
+            stored[start:stop] = column
+
+    def __setitem__(self, interval: Interval, value):
+        """Az interval minden eleméhez a value értéket rendeli."""
+        self._replace(interval, value)
+
+    def __delitem__(self, interval: Interval):
+        """Az interval elemeit eltávolítja a leképezés értelmezési tartományából. A részben érintett tagintervallumok
+        interval-on kívül eső része megmarad.
+        """
+        self._replace(interval, assign=False)
+
+    def _index(self, value) -> int | None:
+        """A value értéket tartalmazó tag indexe, vagy None, ha ilyen nincs. A bináris kereséssel talált tag mellett
+        a következőt (tűrés miatt) és az előzőt is megvizsgálja, mert egy egyelemű tagnak és az őt követő, nyitott alsó
+        végpontú tagnak azonos az alsó végpontja.
+        """
+        index = bisect_right(self._lowers, value) - 1
+        for i in range(max(index - 1, 0), min(index + 2, len(self._lowers))):
+            if _row_contains(self._row(i), value, self._comparison.eq):
+                return i
+        return None
+
+    def __getitem__(self, key: int | float | Interval):
+        """Szám esetén az azt tartalmazó intervallumhoz rendelt értékkel tér vissza, vagy KeyError kivételt vált ki,
+        ha ilyen nincs. Interval esetén a leképezés azon részével tér vissza, amely a key intervallumra esik.
+        """
+        if isinstance(key, Interval):
+            return self.slice(key)
+        if (index := self._index(key)) is None:
+            raise KeyError(key)
+        return self._values[index]
+
+    def get(self, value: int | float, default=None):
+        index = self._index(value)
+        return default if index is None else self._values[index]
+
+    def __contains__(self, value: int | float) -> bool:
+        """Igaz, ha a value számhoz tartozik érték."""
+        return self._index(value) is not None
+
+    def slice(self, interval: Interval) -> IntervalDict:
+        """Új leképezéssel tér vissza, amely a tagintervallumok interval-ra eső részeihez rendeli azok értékét."""
+        comparison = self._comparison_with(interval)
+        row = (interval.lower_endpoint, interval.upper_endpoint, *interval.flags)
+        start, stop = self._window(row[0], row[1])
+        return self._from_rows([(*piece, self._values[i]) for i in range(start, stop)
+                                for piece in _intersect([self._row(i)], [row], comparison.eq)], comparison)
+
+    def __len__(self) -> int:
+        """A tagintervallumok száma."""
+        return len(self._lowers)
+
+    def __bool__(self) -> bool:
+        return bool(self._lowers)
+
+    def keys(self) -> Iterator[Interval]:
+        """Az alsó végpontjuk szerint növekvő sorrendben adja ki a tagintervallumokat."""
+        return (Interval.from_endpoint_values_and_flags(*self._row(i), self._comparison) for i in range(len(self)))
+
+    __iter__ = keys
+
+    def values(self) -> Iterator:
+        return iter(self._values)
+
+    def items(self) -> Iterator[tuple[Interval, Any]]:
+        return zip(self.keys(), self._values)
+
+    def __eq__(self, other) -> bool:
+        """Két leképezés egyenlő, ha tagintervallumaik és az azokhoz rendelt értékek páronként egyenlőek."""
+        if not isinstance(other, IntervalDict):
+            return NotImplemented
+        eq = self._comparison.eq
+        return len(self) == len(other) and all(
+            self._row(i)[2:] == other._row(i)[2:] and eq(self._lowers[i], other._lowers[i]) and
+            eq(self._uppers[i], other._uppers[i]) and self._values[i] == other._values[i] for i in range(len(self)))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({{{}}})'.format(type(self).__name__, ', '.join(f'{iv!r}: {value!r}' for iv, value in self.items()))
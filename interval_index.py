@@ -0,0 +1,207 @@
+from __future__ import annotations
+from typing import Iterable, Iterator
+from bisect import insort
+from operator import attrgetter
+from interval import Interval, ComparisonPolicy, _check_comparison, _common_comparison
+
+_lower_key = attrgetter('lower_endpoint')
+
+
+def _upper_key(interval: Interval):
+    """Felső végpont szerint csökkenő rendezéshez használt kulcs."""
+    return -interval.upper_endpoint
+
+
+class _Node:
+    """A centrált intervallumfa egy csomópontja. A csomópontban azok az intervallumok vannak, amelyek alsó végpontja
+    nem nagyobb, felső végpontja pedig nem kisebb a center értéknél. Ezeket két listában tároljuk: az egyikben az alsó
+    végpontjuk szerint növekvő, a másikban a felső végpontjuk szerint csökkenő sorrendben. A bal oldali részfa
+    intervallumainak felső végpontja kisebb, a jobb oldali részfa intervallumainak alsó végpontja nagyobb a center értéknél.
+    """
+    __slots__ = ('center', 'by_lower', 'by_upper', 'left', 'right')
+
+    def __init__(self, center, intervals: list[Interval] = ()):
+        self.center = center
+        self.by_lower = sorted(intervals, key=_lower_key)
+        self.by_upper = sorted(intervals, key=_upper_key)
+        self.left = self.right = None
+
+
+def _build(intervals: list[Interval]) -> _Node | None:
+    """Kiegyensúlyozott centrált intervallumfát épít az alsó végpontjuk szerint rendezett intervallumokból.
+    A csomópontok center értéke a hozzájuk tartozó intervallumok alsó végpontjainak mediánja.
+    A szétválogatás megtartja a rendezettséget, így a részfák felépítéséhez nem kell újra rendezni.
+    """
+    if not intervals:
+        return None
+    center = intervals[len(intervals) // 2].lower_endpoint
+    left, middle, right = [], [], []
+    for iv in intervals:
+        if iv.upper_endpoint < center:
+            left.append(iv)
+        elif iv.lower_endpoint > center:
+            right.append(iv)
+        else:
+            middle.append(iv)
+    node = _Node(center, middle)
+    node.left, node.right = _build(left), _build(right)
+    return node
+
+
+class IntervalIndex:
+    """Intervallumok gyűjteménye, amelyben gyorsan megkereshetők az adott értéket tartalmazó, illetve egy adott
+    intervallummal átlapolódó intervallumok. Az intervallumokat centrált intervallumfában tároljuk, így egy keresés
+    O(log n + k) idejű, ahol k a találatok száma. Egy érték tartalmazását az Interval.__contains__, az átlapolódást
+    az Interval.overlaps metódusokkal azonos szabályok szerint vizsgáljuk.
+    Az egyenként hozzáadott vagy eltávolított intervallumok miatt kiegyensúlyozatlanná váló fát az index időnként újraépíti.
+    Az egyenlőségvizsgálat szabálya a tárolt intervallumoké, amelyeknek, valamint a nem üres index keresési
+    argumentumainak szabálya meg kell, hogy egyezzen, egyébként ValueError kivétel keletkezik.
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        """Az indexet az intervals által kiadott intervallumokból egyetlen lépésben építi fel."""
+        self._rebuild(list(intervals))
+
+    def _rebuild(self, intervals: list[Interval]):
+        self._comparison = _common_comparison(intervals)
+        self._root = _build(sorted(intervals, key=_lower_key))
+        self._size = self._built_size = len(intervals)
+        self._changes = 0
+
+    def _changed(self):
+        """Ha a felépítés óta történt módosítások száma meghaladja az akkori elemszámot, akkor a fát újraépíti."""
+        self._changes += 1
+        if self._changes > max(self._built_size, 32):
+            self._rebuild(list(self))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Interval]:
+        """Az indexben tárolt intervallumokat adja ki, csomópontonként az alsó végpontjuk szerint rendezve."""
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            yield from node.by_lower
+            stack.extend(child for child in (node.right, node.left) if child)
+
+    def __repr__(self):
+        return '{}([{}])'.format(type(self).__name__, ', '.join(map(repr, self)))
+
+    @property
+    def comparison(self) -> ComparisonPolicy:
+        """A tárolt intervallumok egyenlőségvizsgálatához használt szabály."""
+        return self._comparison
+
+    def insert(self, interval: Interval):
+        """Az interval intervallumot hozzáadja az indexhez."""
+        if self._size:
+            _check_comparison(self._comparison, interval.comparison)
+        else:
+            self._comparison = interval.comparison
+        parent, node = None, self._root
+        while node:
+            if interval.upper_endpoint < node.center:
+                parent, node, side = node, node.left, 'left'
+            elif interval.lower_endpoint > node.center:
+                parent, node, side = node, node.right, 'right'
+            else:
+                insort(node.by_lower, interval, key=_lower_key)
+                insort(node.by_upper, interval, key=_upper_key)
+                break
+        else:
+            node = _Node(interval.midpoint(), [interval])
+            if parent is None:
+                self._root = node
+            else:
+                setattr(parent, side, node)
+        self._size += 1
+        self._changed()
+
+    def remove(self, interval: Interval):
+        """Eltávolítja az indexből az interval intervallummal egyenlő intervallumok egyikét. Ha maga az interval példány
+        is az indexben van, akkor azt. Ha ilyen nincs az indexben, akkor ValueError kivételt vált ki.
+        """
+        node = self._root
+        while node:
+            if interval.upper_endpoint < node.center:
+                node = node.left
+            elif interval.lower_endpoint > node.center:
+                node = node.right
+            else:
+                index = next((i for i, stored in enumerate(node.by_lower) if stored is interval), None)
+                if index is None:
+                    index = next((i for i, stored in enumerate(node.by_lower) if stored == interval), None)
+                if index is None:
+                    break
+                stored = node.by_lower.pop(index)
+                node.by_upper.pop(next(i for i, iv in enumerate(node.by_upper) if iv is stored))
+                self._size -= 1
+                self._changed()
+                return
+        raise ValueError('The interval is not in the index.')
+
+    def containing(self, value: int | float) -> list[Interval]:
+        """Az index azon intervallumainak listájával tér vissza, amelyeknek value eleme."""
+        eq = self._comparison.eq
+        result = []
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            center = node.center
+            if eq(value, center):
+                result.extend(iv for iv in node.by_lower if value in iv)
+                stack.extend(child for child in (node.left, node.right) if child)
+            elif value < center:
+                # A csomópont minden intervalluma a center értékig tart, ezért csak az alsó végpontot kell vizsgálni.
+                for iv in node.by_lower:
+                    if iv.lower_endpoint > value and not eq(iv.lower_endpoint, value):
+                        break
+                    if value in iv:
+                        result.append(iv)
+                if node.left:
+                    stack.append(node.left)
+            else:
+                for iv in node.by_upper:
+                    if iv.upper_endpoint < value and not eq(iv.upper_endpoint, value):
+                        break
+                    if value in iv:
+                        result.append(iv)
+                if node.right:
+                    stack.append(node.right)
+        return result
+
+    def overlapping(self, interval: Interval) -> list[Interval]:
+        """Az index azon intervallumainak listájával tér vissza, amelyek az interval intervallummal átlapolódnak,
+        vagyis legalább egy közös értékük van.
+        """
+        if self._size:
+            _check_comparison(self._comparison, interval.comparison)
+        eq = self._comparison.eq
+        lower, upper = interval.lower_endpoint, interval.upper_endpoint
+        result = []
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            center = node.center
+            if upper < center and not eq(upper, center):
+                for iv in node.by_lower:
+                    if iv.lower_endpoint > upper and not eq(iv.lower_endpoint, upper):
+                        break
+                    if iv.overlaps(interval):
+                        result.append(iv)
+                if node.left:
+                    stack.append(node.left)
+            elif lower > center and not eq(lower, center):
+                for iv in node.by_upper:
+                    if iv.upper_endpoint < lower and not eq(iv.upper_endpoint, lower):
+                        break
+                    if iv.overlaps(interval):
+                        result.append(iv)
+                if node.right:
+                    stack.append(node.right)
+            else:
+                # A keresett intervallum tartalmazza a center értéket, így a csomópont minden intervallumával átlapolódhat.
+                result.extend(iv for iv in node.by_lower if iv.overlaps(interval))
+                stack.extend(child for child in (node.left, node.right) if child)
+        return result
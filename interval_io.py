@@ -0,0 +1,147 @@
+"""Intervallumgyűjtemények tömör, rögzített rekordhosszú bináris formátuma.
+
+A fájl egy 16 bájtos fejlécből és azt követően intervallumonként egy 17 bájtos rekordból áll. Minden szám
+little-endian bájtsorrendű, a rekordok között nincs kitöltés.
+
+Fejléc (struct formátum '<4sBBHQ'):
+    4 bájt   a b'RIVL' azonosító,
+    1 bájt   a formátum verziószáma (jelenleg 1),
+    1 bájt   a fájl flagjei: az 1-es helyiértékű bit jelzi, hogy van-e hiányzó elem a rekordok között,
+    2 bájt   egy rekord hossza bájtban (17),
+    8 bájt   a rekordok száma.
+
+Rekord (struct formátum '<ddB'):
+    8 bájt   az alsó végpont float64 értéke,
+    8 bájt   a felső végpont float64 értéke,
+    1 bájt   flagek: az 1-es helyiértékű bit a felső, a 2-es az alsó végpont zártságát jelzi (az IntervalArray
+             flags tömbjével azonos módon), a 4-es helyiértékű bit pedig a hiányzó (None) elemet.
+
+A végpontok float64 értékként tárolódnak, így például az egész vagy Fraction végpontok betöltés után float típusúak.
+A rögzített rekordhossz miatt a fájl memóriába képezve (open_memmap) IntervalArray-ként használható, amelynek
+végpontjai az operációs rendszer lapgyorsítótárán keresztül több folyamat között is megoszthatók. Hiányzó elemek
+nélkül a teljes tartalom másolás nélkül érhető el, hiányzó elemek esetén a flagek és a maszk oszlopa másolódik.
+"""
+from __future__ import annotations
+from typing import BinaryIO, Iterable
+from os import PathLike, fstat
+from struct import Struct
+from interval import Interval
+from interval_array import IntervalArray
+
+MAGIC = b'RIVL'
+VERSION = 1
+HEADER = Struct('<4sBBHQ')
+RECORD = Struct('<ddB')
+_MISSING = 4
+_HAS_MISSING = 1
+
+
+def _record_dtype():
+    import numpy as np
+    return np.dtype([('lower', '<f8'), ('upper', '<f8'), ('flags', 'u1')])
+
+
+def _open(file: str | PathLike | BinaryIO, mode: str):
+    """A megadott útvonalú fájlt megnyitja, a már megnyitott fájlobjektumot változatlanul hagyja.
+    A második visszatérési érték jelzi, hogy a fájlt nekünk kell-e bezárni.
+    """
+    if isinstance(file, (str, PathLike)):
+        return open(file, mode), True
+    return file, False
+
+
+def _read_header(header: bytes) -> tuple[int, bool]:
+    """Ellenőrzi a fejlécet, és a rekordok számával, valamint azzal tér vissza, hogy van-e hiányzó elem."""
+    if len(header) < HEADER.size:
+        raise ValueError('The file is too short to contain a header.')
+    magic, version, file_flags, record_size, count = HEADER.unpack(header[:HEADER.size])
+    if magic != MAGIC:
+        raise ValueError('The file is not an interval file.')
+    if version != VERSION or record_size != RECORD.size:
+        raise ValueError(f'Unsupported interval file version: {version}.')
+    return count, bool(file_flags & _HAS_MISSING)
+
+
+def _read(file: str | PathLike | BinaryIO) -> tuple[bytes, int, bool]:
+    """A fájl rekordjait tartalmazó bájtsorozattal, a rekordok számával és a hiányzó elemek jelzésével tér vissza."""
+    stream, close = _open(file, 'rb')
+    try:
+        count, has_missing = _read_header(stream.read(HEADER.size))
+        data = stream.read(count * RECORD.size)
+    finally:
+        if close:
+            stream.close()
+    if len(data) != count * RECORD.size:
+        raise ValueError('The file is truncated.')
+    return data, count, has_missing
+
+
+def dump(intervals: Iterable[Interval | None] | IntervalArray, file: str | PathLike | BinaryIO):
+    """Az intervallumokat a modul leírásában megadott formátumban a file útvonalú fájlba vagy bináris fájlobjektumba írja.
+    Az intervals lehet IntervalArray, vagy Interval példányokat (és hiányzó elemként None értékeket) kiadó iterálható objektum.
+    """
+    stream, close = _open(file, 'wb')
+    try:
+        if isinstance(intervals, IntervalArray):
+            import numpy as np
+            records = np.empty(len(intervals), dtype=_record_dtype())
+            records['lower'], records['upper'] = intervals.lower_endpoints, intervals.upper_endpoints
+            records['flags'] = intervals.flags | np.where(intervals.mask, _MISSING, 0).astype(np.uint8)
+            file_flags = _HAS_MISSING if intervals.mask.any() else 0
+            stream.write(HEADER.pack(MAGIC, VERSION, file_flags, RECORD.size, len(records)))
+            stream.write(records.tobytes())
+        else:
+            intervals = list(intervals)
+            file_flags = _HAS_MISSING if None in intervals else 0
+            stream.write(HEADER.pack(MAGIC, VERSION, file_flags, RECORD.size, len(intervals)))
+            pack = RECORD.pack
+            stream.write(b''.join(pack(iv.lower_endpoint, iv.upper_endpoint, iv.flags[0] << 1 | iv.flags[1])
+                                  if iv is not None else pack(0.0, 0.0, _MISSING) for iv in intervals))
+    finally:
+        if close:
+            stream.close()
+
+
+def load(file: str | PathLike | BinaryIO) -> list[Interval | None]:
+    """A dump() által írt fájl intervallumainak listájával tér vissza, amelyben a hiányzó elemek helyén None áll."""
+    data, _, _ = _read(file)
+    return [Interval.from_endpoint_values_and_flags(lower, upper, flags >> 1 & 1, flags & 1)
+            if not flags & _MISSING else None
+            for lower, upper, flags in RECORD.iter_unpack(data)]
+
+
+def _as_interval_array(records, has_missing: bool) -> IntervalArray:
+    """A rekordok tömbjének oszlopaiból IntervalArray példányt hoz létre. A végpontok oszlopai mindig másolás nélküli
+    nézetek. Hiányzó elemek nélkül a flagek oszlopa is az, a maszk pedig egyetlen, az elemszámtól független méretű
+    hamis értékre mutató nézet. Hiányzó elemek esetén viszont a flagek és a maszk oszlopa elemenként egy-egy bájtos
+    új tömbként jön létre, mert a hiányzó elemek jelzése a flagek között tárolódik.
+    """
+    import numpy as np
+    flags = records['flags']
+    if has_missing:
+        return IntervalArray._from_columns(records['lower'], records['upper'], flags & 3, (flags & _MISSING).astype(bool))
+    return IntervalArray._from_columns(records['lower'], records['upper'], flags, np.broadcast_to(False, len(records)))
+
+
+def load_array(file: str | PathLike | BinaryIO) -> IntervalArray:
+    """A dump() által írt fájl tartalmát a memóriába olvassa, és IntervalArray példányként adja vissza."""
+    import numpy as np
+    data, count, has_missing = _read(file)
+    return _as_interval_array(np.frombuffer(data, dtype=_record_dtype(), count=count), has_missing)
+
+
+def open_memmap(path: str | PathLike) -> IntervalArray:
+    """A dump() által írt fájlt csak olvasható módon a memóriába képezi, és a tartalmát IntervalArray nézetként adja
+    vissza. A fájl megnyitása a méretétől függetlenül azonnali, az adatokat az operációs rendszer csak a tényleges
+    hozzáféréskor olvassa be. Ha a fájlban hiányzó elem is van, akkor a flagek és a maszk oszlopa a memóriában jön
+    létre (lásd _as_interval_array()). A végpontok sorrendjét betöltéskor nem ellenőrzi.
+    """
+    import numpy as np
+    with open(path, 'rb') as stream:
+        count, has_missing = _read_header(stream.read(HEADER.size))
+        if fstat(stream.fileno()).st_size < HEADER.size + count * RECORD.size:
+            raise ValueError('The file is truncated.')
+    if not count:
+        return _as_interval_array(np.empty(0, dtype=_record_dtype()), has_missing)
+    records = np.memmap(path, dtype=_record_dtype(), mode='r', offset=HEADER.size, shape=(count,))
+    return _as_interval_array(records, has_missing)
@@ -0,0 +1,70 @@
+"""Monoton függvények kiterjesztése intervallumokra.
+
+Egy monoton növekvő f függvény egy intervallum elemeihez rendelt értékeinek halmaza az az intervallum, amelynek
+végpontjai az eredeti végpontokban felvett függvényértékek, és amely a végpontjain ugyanúgy zárt/nyitott, mint az
+eredeti. A függvényértékek lebegőpontos kerekítése miatt az eredmény végpontjai kifelé kerekítettek, így a pontos
+függvényértékek mindig az eredmény elemei. A pontosan ábrázolható függvényértékek (például a tökéletes négyzetek
+négyzetgyöke vagy exp(0)) nem kerekítődnek.
+
+A függvények Interval és IntervalArray argumentummal is hívhatók. Interval esetén az értelmezési tartományon kívül
+eső elemet tartalmazó intervallum ValueError kivételt vált ki, IntervalArray esetén pedig az ilyen elemek helyén
+hiányzó elem az eredmény.
+"""
+from __future__ import annotations
+import math
+from typing import Callable
+import numpy as np
+from interval import Interval, _product_error, _underflow
+from interval_array import IntervalArray
+
+
+def _sqrt_error(value, root):
+    """Olyan szám, amelynek előjele a value pontos négyzetgyöke és a kerekített root különbségének előjele.
+    Alulcsordulás esetén NaN.
+    """
+    square = root * root
+    return np.where(_underflow(root, root, square), np.nan, (value - square) - _product_error(root, root, square))
+
+
+def _exact_at(point: float) -> Callable:
+    """Olyan hibafüggvény, amely szerint a függvényérték csak a point helyen pontos (ahol a hiba nulla)."""
+    return lambda value, result: np.where(value == point, 0.0, np.nan)
+
+
+def _apply(interval: Interval | IntervalArray, function: Callable, array_function: Callable,
+           outside_domain: Callable | None = None, error: Callable | None = None) -> Interval | IntervalArray:
+    """A monoton növekvő function (IntervalArray esetén array_function) függvényt alkalmazza az intervallum végpontjaira.
+    Az outside_domain az alsó végpontról (vagy végpontok tömbjéről) dönti el, hogy az intervallum kilóg-e az
+    értelmezési tartományból. Ha None, akkor a függvény minden valós számra értelmezett. Az error az argumentumból és
+    a kerekített függvényértékből a kerekítési hiba előjelét adja meg; ha None, akkor a végpontok mindig kerekítődnek.
+    """
+    if isinstance(interval, IntervalArray):
+        lower, upper = interval.lower_endpoints, interval.upper_endpoints
+        mask = interval.mask if outside_domain is None else interval.mask | outside_domain(lower)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            lower_value, upper_value = array_function(lower), array_function(upper)
+            round_lower = True if error is None else ~(error(lower, lower_value) >= 0)
+            round_upper = True if error is None else ~(error(upper, upper_value) <= 0)
+        return interval._from_bounds(lower_value, upper_value, interval.lower_flags, interval.upper_flags, mask,
+                                     round_lower, round_upper)
+    if outside_domain is not None and outside_domain(interval.lower_endpoint):
+        raise ValueError('The interval should be within the domain of the function.')
+    lower_value, upper_value = function(interval.lower_endpoint), function(interval.upper_endpoint)
+    return interval._from_bounds(lower_value, interval.flags[0], upper_value, interval.flags[1],
+                                 error is None or not error(interval.lower_endpoint, lower_value) >= 0,
+                                 error is None or not error(interval.upper_endpoint, upper_value) <= 0)
+
+
+def sqrt(interval: Interval | IntervalArray) -> Interval | IntervalArray:
+    """Az elemek négyzetgyökeinek intervalluma. Az intervallum nem tartalmazhat negatív elemet."""
+    return _apply(interval, math.sqrt, np.sqrt, lambda lower: lower < 0, _sqrt_error)
+
+
+def exp(interval: Interval | IntervalArray) -> Interval | IntervalArray:
+    """Az elemek exponenciális függvény szerinti képeinek intervalluma."""
+    return _apply(interval, math.exp, np.exp, error=_exact_at(0))
+
+
+def log(interval: Interval | IntervalArray) -> Interval | IntervalArray:
+    """Az elemek természetes alapú logaritmusainak intervalluma. Az intervallum elemei pozitívak kell, hogy legyenek."""
+    return _apply(interval, math.log, np.log, lambda lower: lower <= 0, _exact_at(1))
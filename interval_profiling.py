@@ -0,0 +1,157 @@
+"""Az Interval és a Partition metódusainak, valamint az egyenlőségvizsgálati szabályoknak a mérése.
+
+Bekapcsolt állapotban minden mért metódus hívásainak számát, a hívásokban eltöltött (a belőlük hívott további
+metódusok idejét is tartalmazó) összes időt és a hívások alatt létrehozott Interval példányok számát rögzíti.
+A mérés bekapcsolásakor a metódusokat az osztályokban mérő burkolófüggvényekre cseréli, kikapcsoláskor pedig
+visszaállítja az eredetieket, így kikapcsolt állapotban a műveletek futási ideje semmivel sem nő.
+
+Bekapcsolható az enable() függvénnyel, a profile() környezetkezelővel, vagy a REAL_INTERVAL_PROFILE környezeti
+változóval; utóbbi esetben a mérés az interval modul betöltésekor indul, és a program végén az összesítő táblázat
+a szabványos hibakimenetre íródik. Több szál egyidejű használata esetén az időadatok csak tájékoztató jellegűek.
+
+Példa:
+    with interval_profiling.profile():
+        relative_frequency(data, -100, 100)
+    print(interval_profiling.report())
+"""
+from __future__ import annotations
+import atexit
+import sys
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from interval import Interval, Partition, ExactComparison, RelativeTolerance, AbsoluteTolerance
+
+# Műveletnevenként a [hívások száma, összes idő másodpercben, létrehozott Interval példányok száma] lista.
+_records: dict[str, list] = {}
+# A mérés kezdete óta létrehozott Interval példányok száma.
+_created = [0]
+# Az osztályokból kicserélt eredeti attribútumok (osztály, név, eredeti érték) hármasai.
+_originals: list[tuple] = []
+_depth = 0
+
+
+def _measured(name: str, function, creates: bool = False):
+    record = _records.setdefault(name, [0, 0.0, 0])
+    created = _created
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if creates:
+            created[0] += 1
+        created_before = created[0]
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record[1] += perf_counter() - start
+            record[0] += 1
+            record[2] += created[0] - created_before + creates
+    return wrapper
+
+
+def _targets():
+    """A mérendő (osztály, attribútumnév) párok. Az Interval minden metódusa, a Partition nyilvános és speciális
+    metódusai, valamint az egyenlőségvizsgálati szabályok eq és eq_array metódusai. A tulajdonságokat nem méri.
+    """
+    for name in vars(Interval):
+        yield Interval, name
+    for name in vars(Partition):
+        if not name.startswith('_') or name.startswith('__'):
+            yield Partition, name
+    for cls in (ExactComparison, RelativeTolerance, AbsoluteTolerance):
+        for name in ('eq', 'eq_array'):
+            yield cls, name
+
+
+def _install():
+    for cls, name in _targets():
+        attribute = vars(cls).get(name)
+        label = f'{cls.__name__}.{name}'
+        if isinstance(attribute, (classmethod, staticmethod)):
+            replacement = type(attribute)(_measured(label, attribute.__func__))
+        elif callable(attribute) and not isinstance(attribute, type) and name not in ('__new__', '__init_subclass__',
+                                                                                       '__class_getitem__'):
+            replacement = _measured(label, attribute, creates=cls is Interval and name == '__init__')
+        else:
+            continue
+        _originals.append((cls, name, attribute))
+        setattr(cls, name, replacement)
+
+
+def _uninstall():
+    while _originals:
+        cls, name, attribute = _originals.pop()
+        setattr(cls, name, attribute)
+
+
+def enable():
+    """Bekapcsolja a mérést. Többszöri hívás esetén ugyanannyi disable() hívás kapcsolja ki."""
+    global _depth
+    if not _depth:
+        _install()
+    _depth += 1
+
+
+def disable():
+    """Kikapcsolja a mérést, és visszaállítja az eredeti metódusokat. Az addig rögzített adatok megmaradnak."""
+    global _depth
+    if _depth:
+        _depth -= 1
+        if not _depth:
+            _uninstall()
+
+
+def is_enabled() -> bool:
+    return bool(_depth)
+
+
+def reset():
+    """Törli a rögzített adatokat."""
+    for record in _records.values():
+        record[:] = [0, 0.0, 0]
+    _created[0] = 0
+
+
+@contextmanager
+def profile(reset_stats: bool = True):
+    """A with blokk idejére bekapcsolja a mérést. Ha reset_stats igaz, akkor előtte törli a korábbi adatokat."""
+    if reset_stats:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def stats() -> dict[str, dict]:
+    """A legalább egyszer hívott műveletek adatai műveletnév szerinti szótárban: calls (hívások száma),
+    total_time (összes idő másodpercben), mean_time (egy hívás átlagos ideje másodpercben) és objects_created
+    (a hívások alatt létrehozott Interval példányok száma). A műveletek az összes idő szerint csökkenő sorrendben vannak.
+    """
+    ordered = sorted(((name, record) for name, record in _records.items() if record[0]),
+                     key=lambda item: item[1][1], reverse=True)
+    return {name: {'calls': calls, 'total_time': total, 'mean_time': total / calls, 'objects_created': created}
+            for name, (calls, total, created) in ordered}
+
+
+def report() -> str:
+    """A stats() adatai szöveges táblázatként."""
+    rows = stats()
+    width = max(map(len, rows), default=0) + 2
+    lines = [f'{"operation":{width}}{"calls":>12}{"total ms":>12}{"mean us":>12}{"created":>12}']
+    for name, row in rows.items():
+        lines.append(f'{name:{width}}{row["calls"]:>12}{row["total_time"] * 1e3:>12.3f}'
+                     f'{row["mean_time"] * 1e6:>12.3f}{row["objects_created"]:>12}')
+    return '\n'.join(lines)
+
+
+def _report_at_exit():
+    print(report(), file=sys.stderr)
+
+
+def enable_from_environment():
+    """Az interval modul hívja betöltésekor, ha a REAL_INTERVAL_PROFILE környezeti változó be van állítva."""
+    enable()
+    atexit.register(_report_at_exit)
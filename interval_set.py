@@ -0,0 +1,389 @@
+from __future__ import annotations
+from typing import Iterable, Iterator
+from bisect import bisect_right
+from heapq import merge
+from itertools import chain
+from interval import Interval, ComparisonPolicy, _check_comparison
+
+# Egy intervallumot a halmaz belső ábrázolásában egy (alsó végpont, felső végpont, alsó flag, felső flag) négyes ír le.
+# A négyeseken dolgozó segédfüggvények az egyenlőségvizsgálatot az eq argumentumként kapott függvénnyel, a feldolgozott
+# intervallumok közös egyenlőségvizsgálati szabályának eq() metódusával végzik.
+_NEG_INF, _POS_INF = float('-inf'), float('inf')
+
+
+def _sort_key(row: tuple):
+    """Alsó végpont szerinti rendezés, azonos alsó végpontnál a zárt előre kerül."""
+    return row[0], -row[2]
+
+
+def _is_empty(lower, upper, lower_flag, upper_flag, eq) -> bool:
+    """Igaz, ha a végpontok és flagek által leírt intervallumnak nincs eleme."""
+    if eq(lower, upper):
+        return not (lower_flag and upper_flag)
+    return lower > upper
+
+
+def _row_contains(row: tuple, value, eq) -> bool:
+    """Az Interval.__contains__ szabályai szerint vizsgálja, hogy value eleme-e a row által leírt intervallumnak."""
+    lower, upper, lower_flag, upper_flag = row
+    return ((eq(lower, value) * lower_flag or lower < value) and
+            (eq(upper, value) * upper_flag or upper > value))
+
+
+def _iter_coalesced(rows: Iterable[tuple], eq) -> Iterator[tuple]:
+    """Az alsó végpontjuk szerint rendezett intervallumokat diszjunkt, nem szomszédos intervallumokká vonja össze.
+    Két intervallum akkor vonható össze, ha átlapolódnak, vagy közös végpontjuk van, és azt legalább az egyik tartalmazza.
+    Az összevont intervallumokat egyenként, amint lezárultak, adja ki, így a bemenetet egyetlen menetben dolgozza fel.
+    Ha a bemenet nem rendezett, akkor ValueError kivételt vált ki.
+    Azonos alsó végpontok esetén a zárt alsó végpontú intervallumoknak nem kell előbb szerepelniük: egy lezárult
+    intervallumot, amely a következővel egy mindkettőből hiányzó végpontban érintkezik, addig visszatartunk, amíg
+    kiderül, hogy egy később érkező, ezt a végpontot tartalmazó intervallum összeköti-e őket.
+    """
+    pending = current = None
+    for row in rows:
+        lower, upper, lower_flag, upper_flag = row
+        if current is not None:
+            prev_lower, prev_upper, prev_lower_flag, prev_upper_flag = current
+            if lower < prev_lower and not eq(lower, prev_lower):
+                raise ValueError('The intervals should be sorted by their lower endpoints.')
+        if _is_empty(*row, eq):
+            continue
+        if current is not None:
+            if eq(lower, prev_upper):
+                joinable = prev_upper_flag or lower_flag
+            else:
+                joinable = lower < prev_upper
+            if joinable:
+                if eq(lower, prev_lower):
+                    prev_lower_flag |= lower_flag
+                if eq(upper, prev_upper):
+                    prev_upper_flag |= upper_flag
+                elif upper > prev_upper:
+                    prev_upper, prev_upper_flag = upper, upper_flag
+                current = (prev_lower, prev_upper, prev_lower_flag, prev_upper_flag)
+                continue
+            if pending is not None:
+                current = yield from _settle(pending, current)
+            if eq(lower, prev_upper):
+                pending = current
+            else:
+                pending = None
+                yield current
+        current = row
+    if current is not None:
+        if pending is not None:
+            current = yield from _settle(pending, current)
+        yield current
+
+
+def _settle(pending: tuple, current: tuple):
+    """A visszatartott pending intervallumot a vele érintkező current intervallumhoz csatolja, ha current időközben
+    zárt alsó végpontúvá vált, egyébként kiadja. A (generátorból) visszaadott érték az esetleg bővített current.
+    """
+    if current[2]:
+        return pending[0], current[1], pending[2], current[3]
+    yield pending
+    return current
+
+
+def _coalesce(rows: Iterable[tuple], eq) -> list[tuple]:
+    return list(_iter_coalesced(rows, eq))
+
+
+def _intersect(rows1: list[tuple], rows2: list[tuple], eq) -> list[tuple]:
+    """Két normalizált intervallumsorozat metszetét állítja elő egyetlen összefésülő menetben."""
+    result = []
+    i = j = 0
+    while i < len(rows1) and j < len(rows2):
+        lower1, upper1, lower_flag1, upper_flag1 = rows1[i]
+        lower2, upper2, lower_flag2, upper_flag2 = rows2[j]
+        # A metszet alsó végpontja a nagyobbik alsó végpont, a felső a kisebbik felső végpont.
+        if eq(lower1, lower2):
+            lower, lower_flag = max(lower1, lower2), lower_flag1 & lower_flag2
+        elif lower1 > lower2:
+            lower, lower_flag = lower1, lower_flag1
+        else:
+            lower, lower_flag = lower2, lower_flag2
+        # Amelyik intervallum előbb ér véget, annak sorozatában lépünk tovább.
+        if eq(upper1, upper2):
+            upper, upper_flag = min(upper1, upper2), upper_flag1 & upper_flag2
+            i, j = i + 1, j + 1
+        elif upper1 < upper2:
+            upper, upper_flag = upper1, upper_flag1
+            i += 1
+        else:
+            upper, upper_flag = upper2, upper_flag2
+            j += 1
+        if not _is_empty(lower, upper, lower_flag, upper_flag, eq):
+            result.append((lower, upper, lower_flag, upper_flag))
+    return result
+
+
+def _complement(rows: list[tuple], eq) -> list[tuple]:
+    """Egy normalizált intervallumsorozat komplementerét adja vissza a teljes számegyenesre vonatkozóan.
+    A két szélső intervallum végtelenbe nyúlik, ezért ezek csak belső, köztes eredményként használhatók.
+    """
+    result = []
+    prev_upper, prev_upper_flag = _NEG_INF, 1
+    for lower, upper, lower_flag, upper_flag in rows:
+        if not _is_empty(prev_upper, lower, prev_upper_flag ^ 1, lower_flag ^ 1, eq):
+            result.append((prev_upper, lower, prev_upper_flag ^ 1, lower_flag ^ 1))
+        prev_upper, prev_upper_flag = upper, upper_flag
+    result.append((prev_upper, _POS_INF, prev_upper_flag ^ 1, 0))
+    return result
+
+
+def _to_rows(intervals: Iterable[Interval]) -> tuple[ComparisonPolicy, Iterator[tuple]]:
+    """Az intervallumok közös egyenlőségvizsgálati szabályával és négyeseik iterátorával tér vissza. A szabály az első
+    intervallumé (üres bemenet esetén az Interval osztály default_comparison attribútuma); ha egy későbbi intervallumé
+    ettől eltér, akkor az iterátor ValueError kivételt vált ki. A bemenetből csak az első intervallumot olvassa ki előre.
+    """
+    intervals = iter(intervals)
+    if (first := next(intervals, None)) is None:
+        return Interval.default_comparison, iter(())
+    return first.comparison, _checked_rows(chain((first,), intervals), first.comparison)
+
+
+def _checked_rows(intervals: Iterable[Interval], comparison: ComparisonPolicy) -> Iterator[tuple]:
+    for iv in intervals:
+        _check_comparison(comparison, iv.comparison)
+        yield iv.lower_endpoint, iv.upper_endpoint, *iv.flags
+
+
+def _to_interval(row: tuple, comparison: ComparisonPolicy) -> Interval:
+    return Interval.from_endpoint_values_and_flags(*row, comparison)
+
+
+def _merged_rows(intervals: Iterable[Interval], presorted: bool) -> tuple[ComparisonPolicy, Iterator[tuple]]:
+    comparison, rows = _to_rows(intervals)
+    return comparison, _iter_coalesced(rows if presorted else sorted(rows, key=_sort_key), comparison.eq)
+
+
+def iter_merged(intervals: Iterable[Interval]) -> Iterator[Interval]:
+    """Az alsó végpontjuk szerint rendezett intervallumok unióját alkotó diszjunkt intervallumokat adja ki egyenként,
+    egyetlen menetben, a bemenet tárolása nélkül. Az intervallumok összevonása az Interval | operátorának szabályai
+    szerint történik. Ha a bemenet nem rendezett, vagy az intervallumok egyenlőségvizsgálati szabálya eltér, akkor
+    ValueError kivételt vált ki. Az eredmény intervallumai a bemenet szabályát öröklik.
+    """
+    comparison, rows = _to_rows(intervals)
+    for row in _iter_coalesced(rows, comparison.eq):
+        yield _to_interval(row, comparison)
+
+
+def merge_all(intervals: Iterable[Interval], presorted: bool = False) -> list[Interval]:
+    """Az intervals által kiadott intervallumok unióját alkotó diszjunkt, nem szomszédos intervallumok listája az alsó
+    végpontjuk szerint rendezve. Ha presorted igaz, akkor a bemenet már rendezett, és a rendezés elmarad.
+    """
+    comparison, rows = _merged_rows(intervals, presorted)
+    return [_to_interval(row, comparison) for row in rows]
+
+
+def intersect_all(intervals: Iterable[Interval]) -> Interval | None:
+    """Az intervals által kiadott intervallumok közös része, vagy None, ha nincs közös elemük.
+    A végpontok flagjeit az Interval & operátorával azonos szabályok szerint kezeli, egyetlen menetben.
+    """
+    lower = upper = None
+    for iv in intervals:
+        iv_lower, iv_upper = iv.lower_endpoint, iv.upper_endpoint
+        iv_lower_flag, iv_upper_flag = iv.flags
+        if lower is None:
+            lower, upper, lower_flag, upper_flag = iv_lower, iv_upper, iv_lower_flag, iv_upper_flag
+            comparison = iv.comparison
+            eq = comparison.eq
+            continue
+        _check_comparison(comparison, iv.comparison)
+        if eq(iv_lower, lower):
+            lower, lower_flag = max(lower, iv_lower), lower_flag & iv_lower_flag
+        elif iv_lower > lower:
+            lower, lower_flag = iv_lower, iv_lower_flag
+        if eq(iv_upper, upper):
+            upper, upper_flag = min(upper, iv_upper), upper_flag & iv_upper_flag
+        elif iv_upper < upper:
+            upper, upper_flag = iv_upper, iv_upper_flag
+    if lower is None:
+        raise ValueError('At least one interval should be given.')
+    if _is_empty(lower, upper, lower_flag, upper_flag, eq):
+        return None
+    return Interval.from_endpoint_values_and_flags(lower, upper, lower_flag, upper_flag, comparison)
+
+
+def gaps(intervals: Iterable[Interval], within: Interval | None = None, presorted: bool = False) -> list[Interval]:
+    """A within intervallum azon részintervallumainak listája, amelyeket az intervals által kiadott intervallumok
+    egyike sem fed le. Ha within nincs megadva, akkor az intervallumok legkisebb alsó és legnagyobb felső végpontja
+    közötti hézagokat adja vissza. Ha presorted igaz, akkor a bemenet már rendezett, és a rendezés elmarad.
+    """
+    comparison, rows = _merged_rows(intervals, presorted)
+    rows = list(rows)
+    if within is not None:
+        if rows:
+            _check_comparison(comparison, within.comparison)
+        comparison = within.comparison
+        bounds = [(within.lower_endpoint, within.upper_endpoint, *within.flags)]
+    elif rows:
+        bounds = [(rows[0][0], rows[-1][1], rows[0][2], rows[-1][3])]
+    else:
+        return []
+    return [_to_interval(row, comparison) for row in _intersect(bounds, _complement(rows, comparison.eq), comparison.eq)]
+
+
+def coverage_length(intervals: Iterable[Interval], presorted: bool = False) -> int | float:
+    """Az intervals által kiadott intervallumok uniójának hossza, vagyis az átlapolódó részek csak egyszer számítanak.
+    Ha presorted igaz, akkor a bemenet már rendezett, és a számítás a bemenet tárolása nélkül, egyetlen menetben történik.
+    """
+    return sum(upper - lower for lower, upper, _, _ in _merged_rows(intervals, presorted)[1])
+
+
+class IntervalSet:
+    """Diszjunkt intervallumok uniójaként előálló valós számhalmazt modellez.
+    A tagintervallumok az alsó végpontjuk szerint rendezettek, nem lapolódnak át és nem is szomszédosak úgy, hogy egyesíthetők
+    lennének. Ezeket nem Interval példányokként, hanem a végpontok értékeit és flagjeit tartalmazó párhuzamos listákban tároljuk.
+    A tartalmazásvizsgálat bináris kereséssel, a halmazműveletek a két halmaz tagjainak egyetlen összefésülésével történnek.
+    A végpontok összehasonlítása és nyitottságuk/zártságuk kezelése az Interval osztályéval megegyező szabályok szerint történik.
+    Az egyenlőségvizsgálat szabálya a tagintervallumoké, amelynek a halmazt alkotó és a vele műveletben álló nem üres
+    halmazok és intervallumok esetén meg kell egyeznie, egyébként ValueError kivétel keletkezik.
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        """A halmazt az intervals által kiadott intervallumok uniójaként hozza létre. Az intervallumok tetszőleges sorrendben
+        megadhatók, és átlapolódhatnak is; a halmaz ezeket rendezi és a lehetséges esetekben egyesíti.
+        """
+        comparison, rows = _merged_rows(intervals, presorted=False)
+        self._set_rows(list(rows), comparison)
+
+    def _set_rows(self, rows: list[tuple], comparison: ComparisonPolicy):
+        columns = tuple(map(list, zip(*rows))) or ([], [], [], [])
+        self._lowers, self._uppers, self._lower_flags, self._upper_flags = columns
+        self._comparison = comparison
+
+    @classmethod
+    def _from_rows(cls, rows: list[tuple], comparison: ComparisonPolicy) -> IntervalSet:
+        """Új példányt hoz létre már normalizált intervallumnégyesekből."""
+        interval_set = cls.__new__(cls)
+        interval_set._set_rows(rows, comparison)
+        return interval_set
+
+    @property
+    def comparison(self) -> ComparisonPolicy:
+        """A tagintervallumok egyenlőségvizsgálatához használt szabály."""
+        return self._comparison
+
+    def _common_comparison(self, other: IntervalSet) -> ComparisonPolicy:
+        """A két halmaz közös szabálya. Üres halmaz szabálya a másik halmazéhoz igazodik."""
+        if not other:
+            return self._comparison
+        if self:
+            _check_comparison(self._comparison, other._comparison)
+        return other._comparison
+
+    def _rows(self) -> list[tuple]:
+        return list(zip(self._lowers, self._uppers, self._lower_flags, self._upper_flags))
+
+    @staticmethod
+    def _coerce(other) -> IntervalSet | None:
+        if isinstance(other, IntervalSet):
+            return other
+        if isinstance(other, Interval):
+            return IntervalSet((other,))
+        return None
+
+    def __repr__(self):
+        return '{}([{}])'.format(type(self).__name__, ', '.join(map(repr, self)))
+
+    def __str__(self):
+        return ' ∪ '.join(map(str, self)) if self else '∅'
+
+    def __len__(self) -> int:
+        """A halmazt alkotó diszjunkt intervallumok száma."""
+        return len(self._lowers)
+
+    def __bool__(self) -> bool:
+        return bool(self._lowers)
+
+    def __iter__(self) -> Iterator[Interval]:
+        """Az alsó végpontjuk szerint növekvő sorrendben adja ki a halmazt alkotó intervallumokat."""
+        comparison = self._comparison
+        return (_to_interval(row, comparison) for row in self._rows())
+
+    def __getitem__(self, index: int) -> Interval:
+        return Interval.from_endpoint_values_and_flags(self._lowers[index], self._uppers[index],
+                                                       self._lower_flags[index], self._upper_flags[index], self._comparison)
+
+    def __eq__(self, other) -> bool:
+        """Két halmaz egyenlő, ha tagintervallumaik páronként egyenlőek."""
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        eq = self._comparison.eq
+        return len(self) == len(other) and all(
+            row1[2:] == row2[2:] and eq(row1[0], row2[0]) and eq(row1[1], row2[1])
+            for row1, row2 in zip(self._rows(), other._rows()))
+
+    __hash__ = None
+
+    def _candidate_indexes(self, value) -> range:
+        """Azon tagok indexei, amelyek a value értéket tartalmazhatják. Ezek a bináris kereséssel talált tag és a következő,
+        mivel a végpontok tűréssel való összehasonlítása miatt egy alsó végpontnál kissé kisebb érték is eleme lehet a tagnak.
+        """
+        index = bisect_right(self._lowers, value) - 1
+        return range(max(index, 0), min(index + 2, len(self._lowers)))
+
+    def __contains__(self, item: int | float | Interval) -> bool:
+        """Igaz értékkel tér vissza, ha item a halmaz eleme. Az item lehet szám vagy Interval példány.
+        Utóbbi esetben akkor, ha item valamelyik tagintervallumnak részintervalluma.
+        """
+        if isinstance(item, Interval):
+            return any(item.is_subinterval(self[i]) for i in self._candidate_indexes(item.lower_endpoint))
+        return any(_row_contains((self._lowers[i], self._uppers[i], self._lower_flags[i], self._upper_flags[i]), item,
+                                 self._comparison.eq)
+                   for i in self._candidate_indexes(item))
+
+    def length(self) -> int | float:
+        """A tagintervallumok hosszainak összege."""
+        return sum(upper - lower for lower, upper in zip(self._lowers, self._uppers))
+
+    def union(self, other: IntervalSet | Interval) -> IntervalSet:
+        """A self és other egyesítésével előálló halmazzal tér vissza. Hatásában megegyezik a | operátoréval."""
+        return self | other
+
+    def intersection(self, other: IntervalSet | Interval) -> IntervalSet:
+        """A self és other közös részét képviselő halmazzal tér vissza. Hatásában megegyezik a & operátoréval."""
+        return self & other
+
+    def difference(self, other: IntervalSet | Interval) -> IntervalSet:
+        """A self azon elemeiből álló halmazzal tér vissza, amelyek other-nek nem elemei.
+        Hatásában megegyezik a - operátoréval.
+        """
+        return self - other
+
+    def complement(self, universe: IntervalSet | Interval) -> IntervalSet:
+        """A self komplementerét adja vissza a universe halmazra vagy intervallumra vonatkozóan, vagyis a
+        universe azon elemeinek halmazát, amelyek self-nek nem elemei.
+        """
+        if (universe := self._coerce(universe)) is None:
+            raise TypeError('The universe should be an IntervalSet or Interval instance.')
+        return universe - self
+
+    def __or__(self, other: IntervalSet | Interval) -> IntervalSet:
+        if (other := self._coerce(other)) is None:
+            return NotImplemented
+        comparison = self._common_comparison(other)
+        return self._from_rows(_coalesce(merge(self._rows(), other._rows(), key=_sort_key), comparison.eq), comparison)
+
+    def __and__(self, other: IntervalSet | Interval) -> IntervalSet:
+        if (other := self._coerce(other)) is None:
+            return NotImplemented
+        comparison = self._common_comparison(other)
+        return self._from_rows(_intersect(self._rows(), other._rows(), comparison.eq), comparison)
+
+    def __sub__(self, other: IntervalSet | Interval) -> IntervalSet:
+        if (other := self._coerce(other)) is None:
+            return NotImplemented
+        comparison = self._common_comparison(other)
+        return self._from_rows(_intersect(self._rows(), _complement(other._rows(), comparison.eq), comparison.eq), comparison)
+
+    __ror__ = __or__
+    __rand__ = __and__
+
+    def __rsub__(self, other: Interval) -> IntervalSet:
+        if (other := self._coerce(other)) is None:
+            return NotImplemented
+        return other - self
@@ -0,0 +1,77 @@
+from __future__ import annotations
+from typing import NamedTuple
+from collections import OrderedDict
+from threading import Lock
+from interval import Interval, Partition
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class PartitionCache:
+    """Az Interval.split() által előállított partíciók korlátos méretű gyorsítótára, amely a legrégebben használt
+    elemet törli, ha a tárolt partíciók száma elérné a maxsize értéket. A kulcs az intervallum végpontjai (típusukkal
+    együtt), típusa és egyenlőségvizsgálati szabálya, valamint a részek n száma. A partíciók nem módosíthatók, és az
+    osztályba soroláshoz használt tömbjeik is csak olvashatók, ezért a tárolt példányok a hívók között biztonságosan
+    megoszthatók; a partíción először végzett osztályba sorolás által felépített tömbök is a gyorsítótárban maradnak.
+    A gyorsítótár több szálból is használható.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 0:
+            raise ValueError('The maximum size should be non-negative.')
+        self._maxsize = maxsize
+        self._partitions: OrderedDict[tuple, Partition] = OrderedDict()
+        self._lock = Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def __repr__(self):
+        return f'{type(self).__name__}(maxsize={self._maxsize})'
+
+    def __len__(self) -> int:
+        return len(self._partitions)
+
+    def split(self, interval: Interval, n: int) -> Partition:
+        """Hatásában megegyezik az interval.split(n) hívással, de az azonos kulcsú partíciót csak egyszer hozza létre."""
+        lower, upper = interval.lower_endpoint, interval.upper_endpoint
+        key = (lower, upper, type(lower), type(upper), interval.type, interval.comparison, n)
+        with self._lock:
+            partition = self._partitions.get(key)
+            if partition is not None:
+                self._partitions.move_to_end(key)
+                self._hits += 1
+                return partition
+            self._misses += 1
+        partition = interval.split(n)
+        with self._lock:
+            # Egy másik szál közben ugyanezt a partíciót eltárolhatta; ekkor azt adjuk vissza.
+            partition = self._partitions.setdefault(key, partition)
+            self._partitions.move_to_end(key)
+            while len(self._partitions) > self._maxsize:
+                self._partitions.popitem(last=False)
+                self._evictions += 1
+        return partition
+
+    def info(self) -> CacheInfo:
+        """A találatok, hiányok és törlések számát, valamint a maximális és a pillanatnyi méretet adja vissza."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._partitions))
+
+    def clear(self):
+        """Törli a tárolt partíciókat és lenullázza a számlálókat."""
+        with self._lock:
+            self._partitions.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+default_cache = PartitionCache()
+
+
+def cached_split(interval: Interval, n: int) -> Partition:
+    """Az interval.split(n) eredménye a modul közös gyorsítótárából (default_cache)."""
+    return default_cache.split(interval, n)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# A modulok a tároló gyökérkönyvtárában vannak, így a tesztek bármely könyvtárból futtatva importálhatják őket.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
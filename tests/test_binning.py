@@ -0,0 +1,44 @@
+import math
+import numpy as np
+import pytest
+from interval import Interval, IntervalType, Partition, AbsoluteTolerance
+from binning import Binner
+
+
+def _values(partition):
+    edges = [partition[0].lower_endpoint] + [iv.upper_endpoint for iv in partition]
+    values = [math.nan, math.inf, -math.inf, edges[0] - 1, edges[-1] + 1]
+    for edge in edges:
+        values += [edge, math.nextafter(edge, -math.inf), math.nextafter(edge, math.inf), edge + 1e-12, edge - 1e-12]
+    return values + np.linspace(edges[0], edges[-1], 37).tolist()
+
+
+@pytest.mark.parametrize('partition', [
+    Interval(0, 1).split(10),
+    Interval(0.1, 1, IntervalType.OPEN).split(3),
+    Interval(-2, 3, IntervalType.LEFT_OPEN).split(7),
+    Partition.from_edges([0, 0.5, 2, 2.25, 10]),
+    Partition.from_edges([0, 1, 2, 4], IntervalType.LEFT_OPEN, AbsoluteTolerance(0.01)),
+    Partition([Interval(0, 1, IntervalType.RIGHT_OPEN), Interval(1, 2, IntervalType.OPEN), Interval(2, 3)]),
+])
+def test_add_matches_update(partition):
+    values = _values(partition)
+    one_by_one, batch = Binner(partition), Binner(partition)
+    for value in values:
+        one_by_one.add(value)
+    batch.update(values)
+    state1, state2 = one_by_one.snapshot(), batch.snapshot()
+    assert state1.counts.tolist() == state2.counts.tolist()
+    assert state1[2:] == state2[2:]
+    assert state1.total == len(values)
+
+
+def test_values_at_open_joins_are_counted_as_gaps():
+    partition = Partition([Interval(0, 1, IntervalType.RIGHT_OPEN), Interval(1, 2, IntervalType.OPEN)])
+    binner = Binner(partition)
+    binner.add(1)
+    binner.update([1.0, 2.0, -1.0, 0.5, 3.0])
+    state = binner.snapshot()
+    assert state.counts.tolist() == [1, 0]
+    assert (state.underflow, state.overflow, state.invalid, state.gaps) == (1, 2, 0, 2)
+    assert state.total == 6
@@ -0,0 +1,63 @@
+import math
+import pytest
+from interval import Interval
+from box import Box, BoxIndex
+
+
+def _boxes(n):
+    return [Box.from_corners((i, 0), (i + 1, 1)) for i in range(n)]
+
+
+def test_box_index_remove_keeps_remaining_boxes():
+    boxes = _boxes(100)
+    index = BoxIndex(boxes + [Box.from_corners((5, 0), (6, 1))])
+    index.remove(Box.from_corners((5, 0), (6, 1)))
+    assert index.containing((5.5, 0.5)) == [boxes[5]]
+    index.remove(boxes[5])
+    assert index.containing((5.5, 0.5)) == []
+    assert len(index) == 99
+    with pytest.raises(ValueError):
+        index.remove(boxes[5])
+
+
+def test_box_index_remove_finds_box_equal_within_tolerance():
+    index = BoxIndex(_boxes(3))
+    index.remove(Box(Interval(math.nextafter(1, 2), 2), Interval(0, 1)))
+    assert len(index) == 2
+    assert index.containing((1.5, 0.5)) == []
+
+
+def test_box_index_checks_dimensions():
+    index = BoxIndex(_boxes(3))
+    with pytest.raises(ValueError):
+        index.containing((0.5, 0.5, 7))
+    with pytest.raises(ValueError):
+        index.overlapping(Box(Interval(0, 1)))
+    with pytest.raises(ValueError):
+        index.insert(Box(Interval(0, 1)))
+
+
+def test_box_index_uses_the_most_selective_axis():
+    # Minden téglatest első tengelye azonos, így a keresésnek a második tengely indexét kell használnia.
+    boxes = [Box.from_corners((0, i), (1, i + 1)) for i in range(100)]
+    index = BoxIndex(boxes)
+    assert index._axis() == 1
+    assert index.containing((0.5, 42.5)) == [boxes[42]]
+    assert index.overlapping(Box.from_corners((0.2, 10.5), (0.3, 11.5))) == [boxes[10], boxes[11]]
+    index.remove(boxes[42])
+    assert index.containing((0.5, 42.5)) == []
+    assert len(index) == 99
+
+
+def test_box_index_matches_brute_force():
+    boxes = [Box.from_corners((i % 7, i % 5), (i % 7 + 2, i % 5 + 1.5)) for i in range(60)]
+    index = BoxIndex(boxes[:30])
+    for box in boxes[30:]:
+        index.insert(box)
+    for box in boxes[::3]:
+        index.remove(box)
+    stored = [box for i, box in enumerate(boxes) if i % 3]
+    for point in [(x * 0.5, y * 0.5) for x in range(-1, 20) for y in range(-1, 14)]:
+        assert sorted(map(repr, index.containing(point))) == sorted(repr(box) for box in stored if point in box)
+    query = Box.from_corners((2, 1), (3.5, 2))
+    assert sorted(map(repr, index.overlapping(query))) == sorted(repr(box) for box in stored if box.overlaps(query))
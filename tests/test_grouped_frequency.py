@@ -0,0 +1,46 @@
+import statistics
+import pytest
+from interval import Interval, IntervalType
+from grouped_frequency import GroupedFrequencyTable
+
+FREQUENCIES = {Interval(0, 10, IntervalType.RIGHT_OPEN): 3, Interval(10, 20, IntervalType.RIGHT_OPEN): 5,
+               Interval(20, 30, IntervalType.RIGHT_OPEN): 0, Interval(30, 40): 7}
+
+
+def _expanded():
+    """Az osztályközök középpontjaiból a gyakoriságuknak megfelelő számú elemet tartalmazó lista."""
+    return [iv.midpoint() for iv, frequency in FREQUENCIES.items() for _ in range(frequency)]
+
+
+def test_statistics_match_midpoint_expanded_data():
+    table = GroupedFrequencyTable(FREQUENCIES)
+    data = _expanded()
+    assert table.total() == len(data)
+    assert table.mean() == pytest.approx(statistics.mean(data))
+    assert table.pvariance() == pytest.approx(statistics.pvariance(data))
+    assert table.variance() == pytest.approx(statistics.variance(data))
+    assert table.stdev() == pytest.approx(statistics.stdev(data))
+    assert table.median(interpolate=False) == statistics.median(data)
+    # Egyenlő szélességű osztályközöknél a medián interpolációja a statistics.median_grouped() képletével azonos.
+    assert table.median() == pytest.approx(statistics.median_grouped(data, 10))
+    assert table.quantile(0.5) == table.median()
+
+
+def test_quantiles():
+    table = GroupedFrequencyTable(FREQUENCIES)
+    assert table.quantile(0) == 0
+    assert table.quantile(1) == 40
+    quartiles = table.quantiles(4)
+    assert quartiles == sorted(quartiles) and len(quartiles) == 3
+    # Az első kvartilis a 15 elemből a 3.75-ödik pozícióban, vagyis a második osztályköz 0.75 / 5 részénél van.
+    assert quartiles[0] == pytest.approx(11.5)
+    with pytest.raises(ValueError):
+        table.quantile(1.5)
+
+
+def test_merge_adds_frequencies():
+    table = GroupedFrequencyTable(FREQUENCIES) + GroupedFrequencyTable({Interval(30, 40): 1})
+    assert table[Interval(30, 40)] == 8
+    assert table.mode_class() == Interval(30, 40)
+    with pytest.raises(ValueError):
+        GroupedFrequencyTable({Interval(0, 10): 1, Interval(5, 15): 1})
@@ -0,0 +1,47 @@
+import math
+import operator
+from fractions import Fraction
+import pytest
+from interval import Interval, IntervalType, EXACT
+from interval_array import IntervalArray
+from interval_set import IntervalSet
+
+
+def test_is_adjacent_to():
+    assert Interval(1, 2).is_adjacent_to(Interval(2, 3, IntervalType.LEFT_OPEN))
+    assert not Interval(1, 2).is_adjacent_to(Interval(2.5, 3))
+
+
+@pytest.mark.parametrize('other', [3, None, 'a', (2, 3)])
+def test_is_adjacent_to_rejects_non_intervals(other):
+    with pytest.raises(TypeError):
+        Interval(1, 2).is_adjacent_to(other)
+
+
+def test_bisect_terminates_with_fraction_endpoints():
+    result = Interval(Fraction(0), Fraction(2), comparison=EXACT).bisect(lambda middle: middle * middle >= 2)
+    assert result.lower_endpoint < 2 ** 0.5 <= result.upper_endpoint
+    assert math.nextafter(result.lower_endpoint, math.inf) == result.upper_endpoint
+
+
+def test_interval_minus_interval_set():
+    result = Interval(0, 5) - IntervalSet([Interval(1, 2)])
+    assert isinstance(result, IntervalSet)
+    assert str(result) == '⟦0, 1⸩ ∪ ⸨2, 5⟧'
+
+
+@pytest.mark.parametrize('operation, lower, upper', [
+    (operator.add, 1, 7), (operator.sub, -2, 4), (operator.mul, 0, 10), (operator.truediv, 0, 5)])
+def test_interval_with_interval_array(operation, lower, upper):
+    result = operation(Interval(0, 5), IntervalArray([1.0], [2.0]))
+    assert isinstance(result, IntervalArray)
+    assert result[0] == Interval(lower, upper)
+
+
+@pytest.mark.parametrize('other', ['a', None, [1]])
+def test_arithmetic_rejects_unsupported_operands(other):
+    for operation in (operator.add, operator.sub, operator.mul, operator.truediv):
+        with pytest.raises(TypeError):
+            operation(Interval(1, 2), other)
+        with pytest.raises(TypeError):
+            operation(other, Interval(1, 2))
@@ -0,0 +1,48 @@
+import math
+import warnings
+import numpy as np
+import pytest
+from interval import Interval, EXACT
+from interval_array import IntervalArray
+
+
+def test_bisect_converges_on_widest_float_bracket():
+    array = IntervalArray([-1.7e308, 1.0], [1.7e308, 2.0])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = array.find_root(lambda x: x - np.array([5e-324, 1.5]))
+    assert result.lower_endpoints.tolist() == [0.0, math.nextafter(1.5, 0)]
+    assert result.upper_endpoints.tolist() == [5e-324, 1.5]
+
+
+def test_bisect_warns_when_iteration_limit_is_hit():
+    with pytest.warns(RuntimeWarning):
+        result = IntervalArray([0.0], [1.0]).bisect(lambda middle: np.full_like(middle, False), max_iterations=10)
+    assert result.upper_endpoints.tolist() == [1.0]
+
+
+def test_interval_array_carries_member_policy():
+    array = IntervalArray.from_intervals([Interval(0, 1, comparison=EXACT), None, Interval(2, 3, comparison=EXACT)])
+    assert array.comparison == EXACT
+    assert array[0].comparison == EXACT
+    assert all(iv.comparison == EXACT for iv in array.to_list() if iv is not None)
+    assert (array & Interval(0.5, 2.5, comparison=EXACT)).comparison == EXACT
+    assert array[1:].comparison == EXACT
+
+
+def test_interval_array_rejects_mixed_policies():
+    with pytest.raises(ValueError):
+        IntervalArray.from_intervals([Interval(0, 1, comparison=EXACT), Interval(2, 3)])
+    with pytest.raises(ValueError):
+        IntervalArray([0.0], [1.0], comparison=EXACT) | Interval(0, 2)
+
+
+def test_is_adjacent_to_matches_interval_under_exact_policy():
+    rng = np.random.default_rng(0)
+    shared, lower, upper = rng.uniform(-1e3, 1e3, (3, 2000))
+    lower, upper = np.minimum(lower, shared), np.maximum(upper, shared)
+    array1, array2 = IntervalArray(lower, shared, comparison=EXACT), IntervalArray(shared, upper, comparison=EXACT)
+    expected = [iv1.is_adjacent_to(iv2) for iv1, iv2 in zip(array1, array2)]
+    assert array1.is_adjacent_to(array2).tolist() == expected == [True] * 2000
+    expected = [iv2.is_adjacent_to(iv1) for iv1, iv2 in zip(array1, array2)]
+    assert array2.is_adjacent_to(array1).tolist() == expected
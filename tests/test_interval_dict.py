@@ -0,0 +1,41 @@
+import pytest
+from interval import Interval, IntervalType
+from interval_dict import IntervalDict
+
+OPEN, LEFT_OPEN, RIGHT_OPEN = IntervalType.OPEN, IntervalType.LEFT_OPEN, IntervalType.RIGHT_OPEN
+
+
+def test_setting_splits_overlapped_members():
+    d = IntervalDict({Interval(0, 10): 'a'})
+    d[Interval(3, 5, OPEN)] = 'b'
+    assert list(d.items()) == [(Interval(0, 3), 'a'), (Interval(3, 5, OPEN), 'b'), (Interval(5, 10), 'a')]
+    assert [iv.type for iv in d] == [IntervalType.CLOSED, OPEN, IntervalType.CLOSED]
+    assert (d[3], d[4], d[5], d[10]) == ('a', 'b', 'a', 'a')
+
+
+def test_setting_equal_value_merges_adjacent_members():
+    d = IntervalDict({Interval(0, 1, RIGHT_OPEN): 1, Interval(2, 3): 1})
+    d[Interval(1, 2, RIGHT_OPEN)] = 1
+    assert list(d.items()) == [(Interval(0, 3), 1)]
+    # Különböző érték vagy hézag esetén nincs összevonás.
+    d[Interval(3, 4, LEFT_OPEN)] = 2
+    d[Interval(5, 6)] = 2
+    assert len(d) == 3
+
+
+def test_deleting_splits_and_setting_back_merges():
+    d = IntervalDict({Interval(0, 10): 'a'})
+    del d[Interval(4, 6)]
+    assert list(d) == [Interval(0, 4, RIGHT_OPEN), Interval(6, 10, LEFT_OPEN)]
+    assert 4 not in d and 5 not in d and 3.9 in d and 6.1 in d
+    with pytest.raises(KeyError):
+        d[5]
+    d[Interval(4, 6)] = 'a'
+    assert d == IntervalDict({Interval(0, 10): 'a'})
+    del d[Interval(-5, 20)]
+    assert not d and d.get(1) is None
+
+
+def test_slice_keeps_values():
+    d = IntervalDict({Interval(0, 2, RIGHT_OPEN): 'a', Interval(2, 4): 'b'})
+    assert list(d[Interval(1, 3, OPEN)].items()) == [(Interval(1, 2, OPEN), 'a'), (Interval(2, 3, RIGHT_OPEN), 'b')]
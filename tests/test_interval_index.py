@@ -0,0 +1,49 @@
+from random import Random
+from interval import Interval, IntervalType
+from interval_index import IntervalIndex
+
+
+def _random_intervals(rng, n):
+    types = tuple(IntervalType)
+    result = []
+    for i in range(n):
+        lower = rng.randrange(40) * 0.5
+        result.append(Interval(lower, lower + rng.choice((0, 0.5, 1, 3)), types[i % 4]))
+    return result
+
+
+def _ids(intervals):
+    return sorted(map(id, intervals))
+
+
+def _check(index, stored):
+    for value in [x * 0.25 for x in range(-4, 100)]:
+        assert _ids(index.containing(value)) == _ids(iv for iv in stored if value in iv)
+    for query in (Interval(3, 3), Interval(2.5, 7, IntervalType.OPEN), Interval(10, 12, IntervalType.LEFT_OPEN),
+                  Interval(-5, -1), Interval(0, 30)):
+        assert _ids(index.overlapping(query)) == _ids(iv for iv in stored if iv.overlaps(query))
+
+
+def test_queries_match_brute_force_after_insert_remove_and_rebuild():
+    rng = Random(5)
+    stored = _random_intervals(rng, 50)
+    index = IntervalIndex(stored)
+    _check(index, stored)
+    # A felépítés óta végzett sok módosítás a fa újraépítését is kiváltja.
+    for interval in _random_intervals(rng, 60):
+        index.insert(interval)
+        stored.append(interval)
+    _check(index, stored)
+    for interval in stored[::2]:
+        index.remove(interval)
+    stored = stored[1::2]
+    assert len(index) == len(stored)
+    _check(index, stored)
+
+
+def test_empty_index():
+    index = IntervalIndex()
+    assert index.containing(1) == [] and index.overlapping(Interval(0, 1)) == []
+    index.insert(Interval(0, 1))
+    index.remove(Interval(0, 1))
+    assert len(index) == 0 and index.containing(0.5) == []
@@ -0,0 +1,61 @@
+import io
+import numpy as np
+import pytest
+from interval import Interval, IntervalType
+from interval_array import IntervalArray
+from interval_io import dump, load, load_array, open_memmap
+
+INTERVALS = [Interval(0, 1), None, Interval(-2.5, 3, IntervalType.OPEN), Interval(1, 1),
+             Interval(0.1, 0.2, IntervalType.LEFT_OPEN), Interval(5, 7, IntervalType.RIGHT_OPEN)]
+
+
+def _assert_same(array, intervals):
+    assert [None if iv is None else (iv.lower_endpoint, iv.upper_endpoint, iv.type) for iv in array] == \
+        [None if iv is None else (iv.lower_endpoint, iv.upper_endpoint, iv.type) for iv in intervals]
+
+
+@pytest.mark.parametrize('intervals', [INTERVALS, [iv for iv in INTERVALS if iv is not None], []])
+def test_round_trips(tmp_path, intervals):
+    path = tmp_path / 'intervals.rivl'
+    dump(intervals, path)
+    _assert_same(load(path), intervals)
+    _assert_same(load_array(path), intervals)
+    memmap = open_memmap(path)
+    _assert_same(memmap, intervals)
+    assert memmap.mask.tolist() == [iv is None for iv in intervals]
+
+
+def test_interval_array_round_trip_through_file_object():
+    array = IntervalArray.from_intervals(INTERVALS)
+    stream = io.BytesIO()
+    dump(array, stream)
+    stream.seek(0)
+    loaded = load_array(stream)
+    assert np.array_equal(loaded.flags, array.flags) and np.array_equal(loaded.mask, array.mask)
+    _assert_same(loaded, INTERVALS)
+
+
+def test_memmap_without_missing_elements_does_not_allocate_a_mask(tmp_path):
+    path = tmp_path / 'intervals.rivl'
+    dump([Interval(0, 1)] * 1000, path)
+    memmap = open_memmap(path)
+    assert memmap.mask.strides == (0,) and not memmap.mask.any()
+    assert (memmap & Interval(0.5, 2)).lower_endpoints.tolist() == [0.5] * 1000
+
+
+def test_truncated_file(tmp_path):
+    path = tmp_path / 'intervals.rivl'
+    dump(INTERVALS, path)
+    path.write_bytes(path.read_bytes()[:-1])
+    for reader in (load, load_array, open_memmap):
+        with pytest.raises(ValueError, match='truncated'):
+            reader(path)
+
+
+@pytest.mark.parametrize('content', [b'RIV', b'XXXX' + bytes(12)])
+def test_invalid_header(tmp_path, content):
+    path = tmp_path / 'intervals.rivl'
+    path.write_bytes(content)
+    for reader in (load, load_array, open_memmap):
+        with pytest.raises(ValueError):
+            reader(path)
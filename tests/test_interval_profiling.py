@@ -0,0 +1,40 @@
+import interval_profiling
+from interval import Interval
+
+
+def test_hooks_are_installed_only_while_enabled():
+    original = Interval.__and__
+    assert not interval_profiling.is_enabled()
+    with interval_profiling.profile():
+        assert interval_profiling.is_enabled()
+        assert Interval.__and__ is not original
+        Interval(0, 2) & Interval(1, 3)
+        Interval(0, 1).split(4).bin_index(0.5)
+    assert not interval_profiling.is_enabled()
+    assert Interval.__and__ is original
+    stats = interval_profiling.stats()
+    assert stats['Interval.__and__']['calls'] == 1
+    # A metszet egy új példányt hoz létre, a konstruktorhívások pedig maguk is mért műveletek.
+    assert stats['Interval.__and__']['objects_created'] == 1
+    assert stats['Interval.__init__']['calls'] >= 3
+    assert stats['Partition.bin_index']['calls'] == 1
+    assert 'Interval.__and__' in interval_profiling.report()
+
+
+def test_disabled_calls_are_not_recorded():
+    with interval_profiling.profile():
+        pass
+    Interval(0, 2) & Interval(1, 3)
+    assert interval_profiling.stats() == {}
+
+
+def test_nested_enable_needs_matching_disable():
+    interval_profiling.reset()
+    interval_profiling.enable()
+    interval_profiling.enable()
+    interval_profiling.disable()
+    assert interval_profiling.is_enabled()
+    Interval(0, 1).midpoint()
+    interval_profiling.disable()
+    assert not interval_profiling.is_enabled()
+    assert interval_profiling.stats()['Interval.midpoint']['calls'] == 1
@@ -0,0 +1,47 @@
+import pytest
+from interval import Interval, IntervalType, EXACT, AbsoluteTolerance
+from interval_set import IntervalSet, merge_all, intersect_all, gaps
+from interval_dict import IntervalDict
+from interval_index import IntervalIndex
+
+LOOSE = AbsoluteTolerance(0.1)
+
+
+def test_interval_set_uses_member_policy():
+    interval_set = IntervalSet([Interval(0, 1, comparison=LOOSE), Interval(1.05, 2, comparison=LOOSE)])
+    assert len(interval_set) == 1
+    assert interval_set.comparison == LOOSE
+    assert all(iv.comparison == LOOSE for iv in interval_set)
+    assert interval_set[0].comparison == LOOSE
+    assert 2.05 in interval_set
+    assert (interval_set | Interval(3, 4, comparison=LOOSE)).comparison == LOOSE
+    assert (IntervalSet() | interval_set).comparison == LOOSE
+
+
+def test_interval_set_rejects_mixed_policies():
+    with pytest.raises(ValueError):
+        IntervalSet([Interval(0, 1, comparison=LOOSE), Interval(2, 3, comparison=EXACT)])
+    with pytest.raises(ValueError):
+        IntervalSet([Interval(0, 1, comparison=LOOSE)]) - Interval(0.5, 2, comparison=EXACT)
+
+
+def test_module_functions_use_input_policy():
+    intervals = [Interval(0, 1, comparison=LOOSE), Interval(1.05, 2, IntervalType.OPEN, comparison=LOOSE)]
+    merged = merge_all(intervals)
+    assert len(merged) == 1 and merged[0].comparison == LOOSE
+    assert intersect_all([intervals[0], Interval(0.5, 2, comparison=LOOSE)]).comparison == LOOSE
+    assert gaps(intervals) == []
+    with pytest.raises(ValueError):
+        merge_all([Interval(0, 1), Interval(2, 3, comparison=EXACT)])
+
+
+def test_interval_dict_and_index_use_member_policy():
+    interval_dict = IntervalDict({Interval(0, 1, comparison=EXACT): 'a'})
+    assert next(interval_dict.keys()).comparison == EXACT
+    with pytest.raises(ValueError):
+        interval_dict[Interval(2, 3)] = 'b'
+    index = IntervalIndex([Interval(0, 1, comparison=LOOSE)])
+    assert index.comparison == LOOSE
+    assert len(index.containing(1.05)) == 1
+    with pytest.raises(ValueError):
+        index.insert(Interval(2, 3, comparison=EXACT))
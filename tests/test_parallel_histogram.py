@@ -0,0 +1,32 @@
+import math
+import numpy as np
+import pytest
+from interval import Interval, IntervalType, Partition
+from binning import parallel_histogram
+
+
+def _data():
+    rng = np.random.default_rng(12)
+    values = rng.triangular(-3, 2, 5, 5000)
+    # Végpontokkal egyenlő, partíción kívüli és NaN értékek is.
+    return np.concatenate([values, np.arange(-2, 4.5, 0.5), [math.nan, math.inf, -math.inf]])
+
+
+@pytest.mark.parametrize('partition', [
+    Interval(-2, 4).split(12),
+    Interval(-2, 4, IntervalType.OPEN).split(5),
+    Partition.from_edges([-1, 0, 0.5, 3]),
+])
+def test_two_workers_match_serial_histogram(partition):
+    data = _data()
+    expected = partition.histogram(data).tolist()
+    assert parallel_histogram(data, partition, workers=2, chunk_size=700).tolist() == expected
+    assert parallel_histogram(iter(data.tolist()), partition, workers=2, chunk_size=999, max_pending=1).tolist() == expected
+    assert parallel_histogram(data, partition, workers=1, chunk_size=1000).tolist() == expected
+
+
+def test_empty_source_and_chunk_size():
+    partition = Interval(0, 1).split(4)
+    assert parallel_histogram([], partition, workers=2).tolist() == [0, 0, 0, 0]
+    with pytest.raises(ValueError):
+        parallel_histogram([0.5], partition, chunk_size=0)
@@ -0,0 +1,52 @@
+import math
+import numpy as np
+from interval import Interval, IntervalType, Partition
+
+
+def test_bin_indices_keeps_values_near_open_outer_edge():
+    partition = Interval(0.1, 1, IntervalType.OPEN).split(2)
+    value = math.nextafter(0.1, 1)
+    assert value in partition[0]
+    assert partition.bin_indices([value]).tolist() == [0]
+    assert partition.histogram([value]).tolist() == [1, 0]
+    assert partition.bin_indices([0.1, math.nextafter(0.1, 0)]).tolist() == [-1, -1]
+
+
+def test_bin_indices_edges_follow_flags():
+    partition = Partition.from_edges([0, 1, 2, 3])
+    assert partition.bin_indices([0, 1, 2, 3, -1, 4, np.nan]).tolist() == [0, 1, 2, -1, -1, -1, -1]
+
+
+def _near(value):
+    """A value körüli értékek: maga a value, a szomszédos lebegőpontos számok és a tűrésen belüli és kívüli eltérések."""
+    yield value
+    for direction in (-math.inf, math.inf):
+        near = value
+        for _ in range(3):
+            near = math.nextafter(near, direction)
+            yield near
+    for delta in (1e-16, 1e-15, 1e-14, 1e-9):
+        yield value - delta * max(abs(value), 1)
+        yield value + delta * max(abs(value), 1)
+
+
+def _partitions():
+    for interval_type in IntervalType:
+        yield Interval(0, 1, interval_type).split(10)
+        yield Interval(0.1, 0.7, interval_type).split(3)
+        yield Interval(-3, 2, interval_type).split(7)[2:5]
+        yield Partition.from_edges([-1, 0, 0.3, 0.35, 2], interval_type)
+        yield Partition.from_edges([0.1, 0.2, 0.3], interval_type)[1:]
+
+
+def test_bin_index_matches_bin_indices_near_every_edge():
+    for partition in _partitions():
+        edges, _ = partition._edge_arrays()
+        values = [v for edge in edges.tolist() for v in _near(edge)] + [math.inf, -math.inf, math.nan]
+        expected = partition.bin_indices(values).tolist()
+        assert [partition.bin_index(v) for v in values] == expected, partition
+        for value, index in zip(values, expected):
+            if index >= 0:
+                assert value in partition[index]
+            else:
+                assert not any(value in iv for iv in partition)
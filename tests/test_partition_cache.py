@@ -0,0 +1,36 @@
+from interval import Interval, IntervalType
+from partition_cache import PartitionCache
+
+
+def test_least_recently_used_partition_is_evicted():
+    cache = PartitionCache(maxsize=2)
+    a = cache.split(Interval(0, 1), 4)
+    b = cache.split(Interval(0, 2), 4)
+    assert cache.split(Interval(0, 1), 4) is a
+    cache.split(Interval(0, 3), 4)
+    assert len(cache) == 2
+    # A legrégebben használt a (0, 2) intervallum partíciója volt, így azt kellett törölni.
+    assert cache.split(Interval(0, 1), 4) is a
+    assert cache.split(Interval(0, 2), 4) is not b
+    assert cache.info() == (2, 4, 2, 2, 2)
+
+
+def test_key_distinguishes_type_endpoint_types_and_n():
+    cache = PartitionCache()
+    partition = cache.split(Interval(0, 1), 4)
+    assert list(partition) == list(Interval(0, 1).split(4))
+    assert cache.split(Interval(0, 1, IntervalType.OPEN), 4) is not partition
+    assert cache.split(Interval(0.0, 1.0), 4) is not partition
+    assert cache.split(Interval(0, 1), 5) is not partition
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (0, 4, 4)
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 128, 0)
+
+
+def test_zero_maxsize_stores_nothing():
+    cache = PartitionCache(maxsize=0)
+    cache.split(Interval(0, 1), 2)
+    cache.split(Interval(0, 1), 2)
+    assert len(cache) == 0
+    assert cache.info()[:3] == (0, 2, 2)
@@ -0,0 +1,34 @@
+import math
+import numpy as np
+import pytest
+from interval import Interval, IntervalType
+from interval_array import IntervalArray
+
+INTERVALS = [Interval(lower, upper, kind) for lower, upper in ((0, 1), (0.5, 0.5), (1, 3), (-5, -4), (2.5, 10))
+             for kind in IntervalType]
+
+
+def _sorted_values():
+    values = [x * 0.25 for x in range(-4, 20)] + [0.5, 0.5, 1, 1 + 1e-16, 1 - 1e-16, math.nextafter(3, 4), 3 + 1e-12]
+    return sorted(values)
+
+
+@pytest.mark.parametrize('interval', INTERVALS, ids=repr)
+def test_select_agrees_with_contains(interval):
+    values = _sorted_values()
+    expected = [value for value in values if value in interval]
+    for sequence in (values, tuple(values), np.array(values)):
+        selection = interval.select(sequence)
+        assert list(sequence[selection]) == expected
+        assert interval.count_in(sequence) == len(expected)
+
+
+def test_interval_array_select_agrees_with_interval():
+    values = np.array(_sorted_values())
+    array = IntervalArray.from_intervals(INTERVALS + [None])
+    starts, stops = array.select(values)
+    for i, interval in enumerate(INTERVALS):
+        assert slice(int(starts[i]), int(stops[i])) == interval.select(values)
+    assert starts.mask[-1]
+    assert array.count_in(values)[:-1].tolist() == [iv.count_in(values) for iv in INTERVALS]
+    assert array.count_in(np.array([])).tolist()[:-1] == [0] * len(INTERVALS)